@@ -11,13 +11,38 @@ GITHUB_TOKEN: Optional[str] = os.getenv("GITHUB_TOKEN")
 DEFAULT_SEARCH_LIMIT = 10
 MAX_SEARCH_LIMIT = 30
 DEFAULT_MAX_COMMENTS = 10
+MAX_BATCH_ISSUES = 20
+# search_issues(prefetch=True) warms the cache for this many top results
+PREFETCH_TOP_K = 5
+PREFETCH_CONCURRENCY = 5
 
 # Pagination
 DEFAULT_PAGE_SIZE = 30
 
+# Response caching (seconds); stale entries are revalidated with ETags
+ISSUE_CACHE_TTL = 30
+REPO_CACHE_TTL = 60
+SEARCH_CACHE_TTL = 60
+RESPONSE_CACHE_MAX_ENTRIES = 512
+
+# Optional SQLite file keeping repository metadata (and its ETag) across
+# restarts; unset disables it. Entries not confirmed within the max age are refetched.
+REPO_DISK_CACHE_PATH: Optional[str] = os.getenv("GITHUB_REPO_CACHE_PATH") or None
+REPO_DISK_CACHE_MAX_AGE = 24 * 60 * 60
+
+# Retries for throttled (429 / secondary rate limit) and gateway errors
+MAX_RETRIES = 3
+RETRY_BACKOFF_BASE = 1.0
+MAX_RETRY_DELAY = 60
+
+# Upper bound on in-flight GitHub API requests across all clients
+MAX_CONCURRENT_REQUESTS = 10
+
 # Git Configuration
 DEFAULT_CLONE_METHOD = "https"
 DEFAULT_BRANCH = "main"
+# Upper bound on simultaneous git clones; None means one per available CPU
+MAX_CONCURRENT_CLONES: Optional[int] = None
 
 # Filesystem
 DEFAULT_MUST_BE_EMPTY = True
@@ -39,8 +64,8 @@ class ErrorCode:
     PR_CREATION_FAILED = "PR_CREATION_FAILED"
 
 # GitHub API Headers
-def get_github_headers() -> dict:
-    """Get GitHub API headers with optional authentication."""
+def _build_headers() -> dict:
+    """Build GitHub API headers with optional authentication."""
     headers = {
         "Accept": "application/vnd.github+json",
         "X-GitHub-Api-Version": "2022-11-28"
@@ -48,3 +73,18 @@ def get_github_headers() -> dict:
     if GITHUB_TOKEN:
         headers["Authorization"] = f"Bearer {GITHUB_TOKEN}"
     return headers
+
+
+# Built once at import; GITHUB_TOKEN is only read at startup anyway
+GITHUB_HEADERS = _build_headers()
+
+
+def get_github_headers() -> dict:
+    """
+    Get GitHub API headers with optional authentication.
+    
+    Returns the shared module-level headers dict. Callers that need extra
+    or different headers must copy it (e.g. ``{**get_github_headers(), ...}``)
+    rather than mutating it.
+    """
+    return GITHUB_HEADERS
@@ -5,16 +5,34 @@ for better performance and true async I/O without blocking the thread pool.
 """
 
 import asyncio
+import functools
+import os
 import shutil
+import signal
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Literal, Optional
 
-from ..config import ErrorCode, DEFAULT_CLONE_METHOD
+from ..config import ErrorCode, DEFAULT_CLONE_METHOD, MAX_CONCURRENT_CLONES
 from ..utils.errors import error_response, success_response, MCPError
-from ..utils.detect_project import format_next_steps
+from ..utils.detect_project import detect_project_type, format_next_steps
 from .fs_validate import validate_folder_for_clone
 
 
+@functools.cache
+def _git_path() -> Optional[str]:
+    """
+    Locate the git executable.
+    
+    PATH is scanned once per process on first use; git is assumed not to
+    appear or disappear while the server runs.
+    
+    Returns:
+        Absolute path to git, or None if it is not installed
+    """
+    return shutil.which("git")
+
+
 def check_git_installed() -> bool:
     """
     Check if git is installed and available.
@@ -22,7 +40,7 @@ def check_git_installed() -> bool:
     Returns:
         True if git is available, False otherwise
     """
-    return shutil.which("git") is not None
+    return _git_path() is not None
 
 
 def get_clone_url(repo: str, method: str = "https") -> str:
@@ -42,21 +60,60 @@ def get_clone_url(repo: str, method: str = "https") -> str:
         return f"https://github.com/{repo}.git"
 
 
+_clone_semaphore: Optional[asyncio.Semaphore] = None
+_clone_semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_clone_semaphore() -> asyncio.Semaphore:
+    """
+    Get the semaphore bounding concurrent clones on the running event loop.
+    
+    Created lazily because asyncio primitives bind to the loop they are
+    first used on. Sized by MAX_CONCURRENT_CLONES, or by the CPUs this
+    process may run on.
+    
+    Returns:
+        Shared asyncio.Semaphore for clone operations
+    """
+    global _clone_semaphore, _clone_semaphore_loop
+    
+    loop = asyncio.get_running_loop()
+    if _clone_semaphore is None or _clone_semaphore_loop is not loop:
+        limit = MAX_CONCURRENT_CLONES
+        if not limit:
+            try:
+                limit = len(os.sched_getaffinity(0))
+            except AttributeError:  # Not available on macOS/Windows
+                limit = os.cpu_count() or 1
+        _clone_semaphore = asyncio.Semaphore(limit)
+        _clone_semaphore_loop = loop
+    return _clone_semaphore
+
+
+# Process-group kills are POSIX-only
+_CAN_KILL_GROUP = hasattr(os, "killpg")
+
+
 async def run_git_command(
     args: list[str],
     cwd: Optional[str] = None,
-    timeout: int = 30
-) -> tuple[int, str, str]:
+    timeout: int = 30,
+    capture: Literal["both", "stderr", "none"] = "both"
+) -> tuple[int, bytes, bytes]:
     """
     Run a git command asynchronously using asyncio subprocess.
     
     This is the core async function that replaces subprocess.run() calls.
     It uses asyncio.create_subprocess_exec() for true async I/O.
     
+    Output is returned as raw bytes; callers decode only what they read.
+    Streams that aren't captured go to DEVNULL and come back as b"".
+    
     Args:
         args: Command arguments (e.g., ["git", "status"])
         cwd: Working directory for the command
         timeout: Timeout in seconds
+        capture: Which streams to capture ("both", "stderr" or "none")
         
     Returns:
         Tuple of (returncode, stdout, stderr)
@@ -64,13 +121,26 @@ async def run_git_command(
     Raises:
         asyncio.TimeoutError: If command times out
     """
+    # Use the absolute git path so the spawn skips PATH resolution
+    git_path = _git_path()
+    if args and args[0] == "git" and git_path:
+        args = [git_path, *args[1:]]
+    
+    process = None
     try:
         # Create async subprocess
         process = await asyncio.create_subprocess_exec(
             *args,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            cwd=cwd
+            stdout=asyncio.subprocess.PIPE if capture == "both" else asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL if capture == "none" else asyncio.subprocess.PIPE,
+            cwd=cwd,
+            # Fail instead of waiting for credentials nobody can type; a
+            # private or missing repo over HTTPS would otherwise hang until
+            # the timeout
+            env={**os.environ, "GIT_TERMINAL_PROMPT": "0"},
+            # Own process group, so a timeout can also kill helpers git spawns
+            # (git-remote-https, index-pack); ignored on Windows
+            start_new_session=_CAN_KILL_GROUP
         )
         
         # Wait for completion with timeout
@@ -79,39 +149,334 @@ async def run_git_command(
             timeout=timeout
         )
         
-        return (
-            process.returncode,
-            stdout.decode('utf-8', errors='replace'),
-            stderr.decode('utf-8', errors='replace')
-        )
+        return process.returncode, stdout or b"", stderr or b""
         
     except asyncio.TimeoutError:
-        # Kill the process if it times out
-        if process.returncode is None:
-            process.kill()
+        # Kill the process (and its children) if it times out
+        if process is not None and process.returncode is None:
+            if _CAN_KILL_GROUP:
+                try:
+                    os.killpg(process.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+            else:
+                process.kill()
             await process.wait()
         raise
 
 
+class GitSession:
+    """
+    Long-lived git helper for repeated queries against one repository.
+    
+    The repository's git dir is located once with ``git rev-parse``; after
+    that, branch lookups read ``HEAD`` directly and ref resolution goes
+    through a persistent ``git cat-file --batch-check`` process, so repeated
+    queries don't fork a new git binary each time. ``git status`` has no
+    batch mode and is still run as a one-shot command.
+    
+    A session is bound to the event loop it was opened on.
+    """
+    
+    def __init__(self, repo_path: Path):
+        """
+        Initialize a session for a repository.
+        
+        Args:
+            repo_path: Resolved path to the git repository
+        """
+        self.repo_path = repo_path
+        self.git_dir: Optional[Path] = None
+        # Where git found the repo: the directories it walked up through
+        # without a .git entry, and the .git entry that ended the walk
+        self._walked_dirs: list[Path] = []
+        self._git_marker: Optional[Path] = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._batch: Optional[asyncio.subprocess.Process] = None
+        self._lock = asyncio.Lock()
+    
+    async def __aenter__(self) -> "GitSession":
+        await self.open()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+    
+    def _git_dir_is_current(self) -> bool:
+        """
+        Check that the resolved git dir would still be found for repo_path.
+        
+        It stops applying when the git dir or the .git entry that led to it
+        is removed, or when a directory between repo_path and that entry
+        gains its own .git (e.g. a repository initialized or cloned inside
+        another one).
+        
+        Returns:
+            True if the cached git dir can still be used
+        """
+        if not self.git_dir.is_dir():
+            return False
+        if self._git_marker is not None and not os.path.lexists(self._git_marker):
+            return False
+        return not any(os.path.lexists(directory / ".git") for directory in self._walked_dirs)
+    
+    async def open(self) -> bool:
+        """
+        Locate the repository's git dir.
+        
+        A git dir found earlier is reused while it still applies; otherwise
+        it is looked up again and the batch process restarted.
+        
+        Returns:
+            True if repo_path is inside a git repository, False otherwise
+        """
+        if self.git_dir is not None:
+            if self._git_dir_is_current():
+                return True
+            self.git_dir = None
+            await self.aclose()
+        
+        self.loop = asyncio.get_running_loop()
+        returncode, stdout, stderr = await run_git_command(
+            ["git", "rev-parse", "--absolute-git-dir"],
+            cwd=str(self.repo_path),
+            timeout=5
+        )
+        git_dir = stdout.decode("utf-8", errors="replace").strip()
+        if returncode != 0 or not git_dir:
+            return False
+        
+        walked, marker = [], None
+        for directory in (self.repo_path, *self.repo_path.parents):
+            if os.path.lexists(directory / ".git"):
+                marker = directory / ".git"
+                break
+            walked.append(directory)
+        else:
+            # No .git entry (e.g. GIT_DIR from the environment); nothing to watch
+            walked = []
+        
+        self.git_dir = Path(git_dir)
+        self._walked_dirs, self._git_marker = walked, marker
+        return True
+    
+    async def rev_parse(self, ref: str) -> Optional[str]:
+        """
+        Resolve a revision to an object id through the batch channel.
+        
+        Args:
+            ref: Any revision expression git understands (e.g. "HEAD")
+            
+        Returns:
+            The object id, or None if the revision does not exist
+        """
+        if not await self.open():
+            return None
+        
+        async with self._lock:
+            if self._batch is None or self._batch.returncode is not None:
+                self._batch = await asyncio.create_subprocess_exec(
+                    _git_path() or "git", f"--git-dir={self.git_dir}", "cat-file", "--batch-check",
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.DEVNULL
+                )
+            
+            try:
+                self._batch.stdin.write(ref.encode("utf-8") + b"\n")
+                await self._batch.stdin.drain()
+                line = await asyncio.wait_for(self._batch.stdout.readline(), timeout=5)
+            except BaseException:
+                # An unread reply would be taken as the answer to the next
+                # query, so start over with a fresh process
+                await self._kill_batch()
+                raise
+        
+        # "<oid> <type> <size>" on success, "<ref> missing" otherwise
+        fields = line.decode("utf-8", errors="replace").split()
+        if len(fields) != 3:
+            return None
+        return fields[0]
+    
+    async def branch(self) -> str:
+        """
+        Get the current branch name, like ``git rev-parse --abbrev-ref HEAD``.
+        
+        Returns:
+            Branch name, "HEAD" when detached, or "unknown" if HEAD does not
+            resolve (e.g. no commits yet)
+        """
+        if not await self.open():
+            return "unknown"
+        
+        if await self.rev_parse("HEAD") is None:
+            return "unknown"
+        
+        head = (self.git_dir / "HEAD").read_text(encoding="utf-8").strip()
+        if head.startswith("ref: refs/heads/"):
+            return head[len("ref: refs/heads/"):]
+        return "HEAD"
+    
+    async def status(self) -> tuple[int, bytes, bytes]:
+        """
+        Run ``git status --porcelain`` for the repository.
+        
+        ``--no-optional-locks`` stops status from taking index.lock to write
+        back its refreshed stat cache, so concurrent reads don't contend.
+        
+        Returns:
+            Tuple of (returncode, stdout, stderr)
+        """
+        return await run_git_command(
+            ["git", "--no-optional-locks", "status", "--porcelain"],
+            cwd=str(self.repo_path),
+            timeout=5
+        )
+    
+    async def _kill_batch(self) -> None:
+        """Kill and reap the batch process; the caller holds the lock."""
+        process, self._batch = self._batch, None
+        if process is not None and process.returncode is None:
+            process.kill()
+            await process.wait()
+    
+    async def aclose(self) -> None:
+        """Shut down the persistent batch process, if any."""
+        # Waits for an in-flight rev_parse instead of closing its pipes
+        async with self._lock:
+            process, self._batch = self._batch, None
+            if process is None or process.returncode is not None:
+                return
+            
+            process.stdin.close()
+            try:
+                await asyncio.wait_for(process.wait(), timeout=5)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+
+
+# Open sessions keyed by resolved repo path, least recently used first
+_SESSIONS: "OrderedDict[str, GitSession]" = OrderedDict()
+MAX_GIT_SESSIONS = 8
+
+
+async def get_git_session(repo_path: Path) -> GitSession:
+    """
+    Get a cached GitSession for a repository, creating it if needed.
+    
+    Args:
+        repo_path: Resolved path to the git repository
+        
+    Returns:
+        GitSession bound to the running event loop
+    """
+    key = str(repo_path)
+    session = _SESSIONS.get(key)
+    loop = asyncio.get_running_loop()
+    
+    if session is not None and session.loop not in (None, loop):
+        # Pipes from another (possibly closed) loop can't be reused
+        _SESSIONS.pop(key)
+        session = None
+    
+    if session is None:
+        session = GitSession(repo_path)
+        _SESSIONS[key] = session
+        while len(_SESSIONS) > MAX_GIT_SESSIONS:
+            _, evicted = _SESSIONS.popitem(last=False)
+            if evicted.loop is loop:
+                await evicted.aclose()
+    else:
+        _SESSIONS.move_to_end(key)
+    
+    return session
+
+
+async def close_git_sessions() -> None:
+    """
+    Close all cached GitSessions and their batch processes.
+    
+    Call this on server shutdown. Sessions bound to another event loop are
+    dropped without closing, as their pipes can't be awaited here.
+    """
+    loop = asyncio.get_running_loop()
+    sessions = list(_SESSIONS.values())
+    _SESSIONS.clear()
+    for session in sessions:
+        if session.loop in (None, loop):
+            await session.aclose()
+
+
+# Branch / remote URL lookups keyed by repo path, each stored with the mtime
+# of the file whose change invalidates it (.git/HEAD, .git/config)
+_BRANCH_CACHE: "OrderedDict[str, tuple[int, str]]" = OrderedDict()
+_REMOTE_CACHE: "OrderedDict[tuple[str, str], tuple[int, str]]" = OrderedDict()
+MAX_CACHED_REPOS = 64
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    """Get a file's mtime in nanoseconds, or None if it can't be stat'ed."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _cache_put(cache: OrderedDict, key: Any, value: Any) -> None:
+    """Insert into an LRU cache dict, evicting the oldest entries."""
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > MAX_CACHED_REPOS:
+        cache.popitem(last=False)
+
+
+async def invalidate_repo_cache(repo_path: Path) -> None:
+    """
+    Drop cached lookups and the GitSession for a repository.
+    
+    Call after operations that replace or rewrite the repository
+    (e.g. cloning into the path).
+    
+    Args:
+        repo_path: Path to the git repository
+    """
+    key = str(repo_path)
+    _BRANCH_CACHE.pop(key, None)
+    for cache_key in [k for k in _REMOTE_CACHE if k[0] == key]:
+        del _REMOTE_CACHE[cache_key]
+    
+    # The session holds the git dir it resolved, which may now be a different one
+    session = _SESSIONS.pop(key, None)
+    if session is not None and session.loop in (None, asyncio.get_running_loop()):
+        await session.aclose()
+
+
 async def get_current_branch(repo_path: Path) -> str:
     """
     Get the current branch name in a git repository.
     
+    Results are cached until ``.git/HEAD`` changes. "unknown" is never
+    cached, since the first commit creates the branch without touching HEAD.
+    
     Args:
         repo_path: Path to the git repository
         
     Returns:
         Current branch name or "unknown"
     """
+    key = str(repo_path)
+    mtime = _mtime_ns(Path(repo_path) / ".git" / "HEAD")
+    cached = _BRANCH_CACHE.get(key)
+    if mtime is not None and cached is not None and cached[0] == mtime:
+        return cached[1]
+    
     try:
-        returncode, stdout, stderr = await run_git_command(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-            cwd=str(repo_path),
-            timeout=5
-        )
-        
-        if returncode == 0:
-            return stdout.strip()
+        session = await get_git_session(repo_path)
+        branch = await session.branch()
+        if mtime is not None and branch != "unknown":
+            _cache_put(_BRANCH_CACHE, key, (mtime, branch))
+        return branch
     except Exception:
         pass
     
@@ -124,7 +489,9 @@ async def clone_repository(
     clone_method: str = DEFAULT_CLONE_METHOD,
     shallow: bool = False,
     branch: Optional[str] = None,
-    skip_validation: bool = False
+    skip_validation: bool = False,
+    filter_spec: Optional[str] = None,
+    no_checkout: bool = False
 ) -> Dict[str, Any]:
     """
     Clone a GitHub repository to a local directory using async subprocess.
@@ -140,9 +507,17 @@ async def clone_repository(
         shallow: Whether to do a shallow clone (--depth 1)
         branch: Specific branch to clone (optional)
         skip_validation: Skip folder validation (use with caution)
+        filter_spec: Partial clone filter passed to --filter (e.g. "blob:none")
+        no_checkout: Skip checking out the working tree (--no-checkout)
         
     Returns:
         Standardized response dictionary with clone results
+        
+    Note:
+        With filter_spec="blob:none" file contents are only fetched when they
+        are needed, and with no_checkout=True nothing is written to the working
+        tree until a later ``git checkout`` (or ``git sparse-checkout``). Use
+        these when only refs and history are needed.
     """
     # Check if git is installed
     if not check_git_installed():
@@ -157,16 +532,18 @@ async def clone_repository(
     
     # Validate folder unless explicitly skipped
     if not skip_validation:
-        validation_result = validate_folder_for_clone(target_path, must_be_empty=True)
+        validation_result = await asyncio.to_thread(validate_folder_for_clone, target_path, must_be_empty=True)
         if not validation_result.get("ok"):
             return validation_result
         
         # Use the resolved path from validation
-        target_path = validation_result["data"]["resolved_path"]
+        repo_path = Path(validation_result["data"]["resolved_path"])
+    else:
+        repo_path = Path(target_path).expanduser().resolve()
     
     # Build clone command
     clone_url = get_clone_url(repo, clone_method)
-    cmd = ["git", "clone"]
+    cmd = ["git", "clone", "--quiet"]
     
     if shallow:
         cmd.extend(["--depth", "1"])
@@ -174,19 +551,28 @@ async def clone_repository(
     if branch:
         cmd.extend(["--branch", branch])
     
-    cmd.extend([clone_url, target_path])
+    if filter_spec:
+        cmd.extend(["--filter", filter_spec])
+    
+    if no_checkout:
+        cmd.append("--no-checkout")
+    
+    cmd.extend([clone_url, str(repo_path)])
     
     try:
         # Execute git clone using fully async subprocess
-        # This doesn't block the event loop or consume thread pool resources
-        returncode, stdout, stderr = await run_git_command(
-            cmd,
-            cwd=None,  # Clone operations don't need a cwd
-            timeout=300  # 5 minute timeout
-        )
+        # This doesn't block the event loop or consume thread pool resources;
+        # the semaphore keeps parallel clones from thrashing network and disk
+        async with _get_clone_semaphore():
+            returncode, stdout, stderr = await run_git_command(
+                cmd,
+                cwd=None,  # Clone operations don't need a cwd
+                timeout=300,  # 5 minute timeout
+                capture="stderr"  # Only errors are inspected
+            )
         
         if returncode != 0:
-            error_msg = stderr.strip() if stderr else stdout.strip()
+            error_msg = stderr.decode('utf-8', errors='replace').strip()
             
             # Parse common git errors
             if "Repository not found" in error_msg or "could not read" in error_msg:
@@ -219,12 +605,15 @@ async def clone_repository(
                     }
                 )
         
-        # Get the current branch
-        repo_path = Path(target_path).resolve()
-        current_branch = await get_current_branch(repo_path)
+        # Get the current branch while project detection scans the checkout
+        await invalidate_repo_cache(repo_path)
+        current_branch, detection = await asyncio.gather(
+            get_current_branch(repo_path),
+            asyncio.to_thread(detect_project_type, repo_path)
+        )
         
         # Format next steps with project detection
-        next_steps = format_next_steps(repo_path, repo, current_branch)
+        next_steps = format_next_steps(repo_path, repo, current_branch, detection)
         
         return success_response({
             "local_repo_path": str(repo_path),
@@ -245,7 +634,7 @@ async def clone_repository(
     except Exception as e:
         return error_response(
             ErrorCode.CLONE_FAILED,
-            f"Unexpected error during clone: {str(e)}",
+            f"Unexpected error during clone: {e}",
             {"clone_url": clone_url}
         )
 
@@ -254,6 +643,9 @@ async def get_git_status(repo_path: str) -> Dict[str, Any]:
     """
     Get git status for a repository using async subprocess.
     
+    The git-dir probe and branch lookup go through the repository's cached
+    GitSession; the branch lookup runs concurrently with ``git status``.
+    
     Args:
         repo_path: Path to the git repository
         
@@ -266,24 +658,15 @@ async def get_git_status(repo_path: str) -> Dict[str, Any]:
     try:
         path = Path(repo_path).resolve()
         
-        # Check if it's a git repository
-        returncode, stdout, stderr = await run_git_command(
-            ["git", "rev-parse", "--git-dir"],
-            cwd=str(path),
-            timeout=5
-        )
-        
-        if returncode != 0:
+        # Check if it's a git repository, then look up the branch through the
+        # repository's session concurrently with the status query
+        session = await get_git_session(path)
+        if not await session.open():
             return {"error": "Not a git repository"}
         
-        # Get current branch
-        branch = await get_current_branch(path)
-        
-        # Get status
-        returncode, stdout, stderr = await run_git_command(
-            ["git", "status", "--porcelain"],
-            cwd=str(path),
-            timeout=5
+        branch, (returncode, stdout, stderr) = await asyncio.gather(
+            get_current_branch(path),
+            session.status()
         )
         
         has_changes = bool(stdout.strip())
@@ -292,7 +675,7 @@ async def get_git_status(repo_path: str) -> Dict[str, Any]:
             "is_git_repo": True,
             "current_branch": branch,
             "has_uncommitted_changes": has_changes,
-            "status_summary": stdout.strip() if has_changes else "Working tree clean"
+            "status_summary": stdout.decode('utf-8', errors='replace').strip() if has_changes else "Working tree clean"
         }
         
     except asyncio.TimeoutError:
@@ -313,12 +696,13 @@ async def check_repo_has_uncommitted_changes(repo_path: str) -> bool:
     """
     try:
         returncode, stdout, stderr = await run_git_command(
-            ["git", "status", "--porcelain"],
+            ["git", "--no-optional-locks", "status", "--porcelain", "-z"],
             cwd=repo_path,
             timeout=5
         )
         
-        return returncode == 0 and bool(stdout.strip())
+        # A clean tree prints nothing, so any output at all means changes
+        return returncode == 0 and bool(stdout)
     except Exception:
         return False
 
@@ -327,6 +711,8 @@ async def get_remote_url(repo_path: str, remote: str = "origin") -> Optional[str
     """
     Get the remote URL for a git repository.
     
+    Results are cached until ``.git/config`` changes.
+    
     Args:
         repo_path: Path to the git repository
         remote: Remote name (default: "origin")
@@ -334,6 +720,12 @@ async def get_remote_url(repo_path: str, remote: str = "origin") -> Optional[str
     Returns:
         Remote URL or None if not found
     """
+    key = (str(repo_path), remote)
+    mtime = _mtime_ns(Path(repo_path) / ".git" / "config")
+    cached = _REMOTE_CACHE.get(key)
+    if mtime is not None and cached is not None and cached[0] == mtime:
+        return cached[1]
+    
     try:
         returncode, stdout, stderr = await run_git_command(
             ["git", "remote", "get-url", remote],
@@ -342,7 +734,10 @@ async def get_remote_url(repo_path: str, remote: str = "origin") -> Optional[str
         )
         
         if returncode == 0:
-            return stdout.strip()
+            url = stdout.decode('utf-8', errors='replace').strip()
+            if mtime is not None:
+                _cache_put(_REMOTE_CACHE, key, (mtime, url))
+            return url
     except Exception:
         pass
     
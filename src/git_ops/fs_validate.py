@@ -1,8 +1,9 @@
 """Filesystem validation utilities for safe cloning operations."""
 
 import os
+import stat
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Union
 from enum import Enum
 
 from ..config import ErrorCode
@@ -32,48 +33,42 @@ def validate_folder_for_clone(
         Standardized response dictionary with status and details
     """
     try:
-        # Resolve and expand the path
-        path = Path(target_path).expanduser().resolve()
-        
-        # Check if path is valid
-        if not _is_valid_path(path):
-            return error_response(
-                ErrorCode.INVALID_PATH,
-                f"Invalid path: {target_path}",
-                {
-                    "provided_path": target_path,
-                    "message": "Path contains invalid characters or references"
-                }
-            )
-        
-        # Check if path exists
-        if not path.exists():
+        # Resolve and expand the path with plain string ops. realpath()
+        # collapses ".." components and raises on unusable input (e.g. NUL
+        # bytes), which is handled below.
+        path = os.path.realpath(os.path.expanduser(target_path))
+        
+        # One stat() answers both "does it exist" and "is it a directory"
+        try:
+            is_dir = stat.S_ISDIR(os.stat(path).st_mode)
+        except (FileNotFoundError, NotADirectoryError):
             # Try to create it
             try:
-                path.mkdir(parents=True, exist_ok=True)
+                os.makedirs(path, exist_ok=True)
+                is_dir = True
             except PermissionError:
                 return error_response(
                     ErrorCode.PERMISSION_DENIED,
                     f"Permission denied: Cannot create directory at {path}",
                     {
-                        "resolved_path": str(path),
+                        "resolved_path": path,
                         "message": "You don't have permission to create directories at this location"
                     }
                 )
             except Exception as e:
                 return error_response(
                     ErrorCode.INVALID_PATH,
-                    f"Failed to create directory: {str(e)}",
-                    {"resolved_path": str(path)}
+                    f"Failed to create directory: {e}",
+                    {"resolved_path": path}
                 )
         
         # Check if it's a directory
-        if not path.is_dir():
+        if not is_dir:
             return error_response(
                 ErrorCode.INVALID_PATH,
                 f"Path exists but is not a directory: {path}",
                 {
-                    "resolved_path": str(path),
+                    "resolved_path": path,
                     "message": "Please provide a directory path, not a file"
                 }
             )
@@ -84,20 +79,20 @@ def validate_folder_for_clone(
                 ErrorCode.PERMISSION_DENIED,
                 f"Permission denied: Cannot write to directory {path}",
                 {
-                    "resolved_path": str(path),
+                    "resolved_path": path,
                     "message": "You don't have write permission for this directory"
                 }
             )
         
-        # Check if folder is empty (if required)
-        if must_be_empty:
+        # Check if folder is empty (if required); only list it when it isn't
+        if must_be_empty and not _is_empty_fast(path):
             contents = list_directory_contents(path)
             if contents:
                 return error_response(
                     ErrorCode.NOT_EMPTY,
                     f"Directory is not empty: {path}",
                     {
-                        "resolved_path": str(path),
+                        "resolved_path": path,
                         "contents_preview": contents[:10],  # First 10 items
                         "total_items": len(contents),
                         "message": "Please choose an empty directory for cloning or manually clear this directory"
@@ -107,51 +102,36 @@ def validate_folder_for_clone(
         # All checks passed
         return success_response({
             "status": ValidationStatus.OK,
-            "resolved_path": str(path),
+            "resolved_path": path,
             "message": "Path is valid and ready for cloning"
         })
         
     except Exception as e:
         return error_response(
             ErrorCode.INVALID_PATH,
-            f"Unexpected error during path validation: {str(e)}",
+            f"Unexpected error during path validation: {e}",
             {"provided_path": target_path}
         )
 
 
-def _is_valid_path(path: Path) -> bool:
+def _is_empty_fast(path: Union[str, Path]) -> bool:
     """
-    Check if a path is valid and safe.
+    Check whether a directory is empty without listing it.
     
     Args:
-        path: Path to validate
+        path: Directory path
         
     Returns:
-        True if path is valid, False otherwise
+        True if the directory has no entries, False otherwise
     """
     try:
-        # Basic validation - check if path can be resolved
-        _ = path.resolve()
-        
-        # Check for suspicious patterns (this is basic, could be enhanced)
-        path_str = str(path)
-        
-        # Disallow paths that try to escape using ".." excessively
-        # (normal ".." is fine, but we want to catch malicious patterns)
-        parts = path.parts
-        dotdot_count = sum(1 for part in parts if part == "..")
-        
-        # If more than half the parts are "..", it's suspicious
-        if dotdot_count > len(parts) / 2:
-            return False
-        
-        return True
-        
-    except (ValueError, OSError):
+        with os.scandir(path) as it:
+            return next(it, None) is None
+    except OSError:
         return False
 
 
-def list_directory_contents(path: Path, max_items: int = 100) -> List[str]:
+def list_directory_contents(path: Union[str, Path], max_items: int = 100) -> List[str]:
     """
     List contents of a directory.
     
@@ -164,11 +144,13 @@ def list_directory_contents(path: Path, max_items: int = 100) -> List[str]:
     """
     try:
         items = []
-        for item in path.iterdir():
-            items.append(item.name)
-            if len(items) >= max_items:
-                break
-        return sorted(items)
+        with os.scandir(path) as it:
+            for entry in it:
+                items.append(entry.name)
+                if len(items) >= max_items:
+                    break
+        items.sort()
+        return items
     except Exception:
         return []
 
@@ -0,0 +1,134 @@
+"""In-process cache for GitHub API GET responses."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from ..config import RESPONSE_CACHE_MAX_ENTRIES
+
+
+class CacheEntry:
+    """A cached response body with its ETag and expiry time."""
+    
+    def __init__(self, data: Any, etag: Optional[str], expires_at: float):
+        self.data = data
+        self.etag = etag
+        self.expires_at = expires_at
+    
+    def is_fresh(self) -> bool:
+        """Check whether the entry can be served without contacting GitHub."""
+        return time.monotonic() < self.expires_at
+
+
+class ResponseCache:
+    """
+    LRU cache of parsed GitHub responses with per-entry TTLs.
+    
+    Fresh entries are served directly. Stale entries keep their ETag so the
+    next request can be sent with If-None-Match; GitHub answers an unchanged
+    resource with an empty 304 that does not count against the rate limit.
+    """
+    
+    def __init__(self, max_entries: int = RESPONSE_CACHE_MAX_ENTRIES):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_entries: Maximum number of responses kept before evicting
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+    
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Build a cache key from a URL and its query parameters.
+        
+        Args:
+            url: Request URL
+            params: Query parameters
+            
+        Returns:
+            Cache key string
+        """
+        if not params:
+            return url
+        query = "&".join(f"{name}={value}" for name, value in sorted(params.items()))
+        return f"{url}?{query}"
+    
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        """
+        Get the entry for a key, fresh or stale.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            CacheEntry, or None if nothing is cached
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+    
+    def store(self, key: str, data: Any, etag: Optional[str], ttl: float) -> None:
+        """
+        Cache a response body.
+        
+        Args:
+            key: Cache key
+            data: Parsed response body
+            etag: ETag header from the response, if any
+            ttl: Seconds the entry stays fresh
+        """
+        self._entries[key] = CacheEntry(data, etag, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def revalidate(self, key: str, entry: CacheEntry, ttl: float) -> Any:
+        """
+        Mark a stale entry fresh again after a 304 Not Modified.
+        
+        Takes the entry the conditional request was built from rather than
+        looking it up again: while the request was in flight the key may
+        have been evicted or the cache cleared, and the entry is put back.
+        
+        Args:
+            key: Cache key
+            entry: Entry whose ETag the 304 confirmed
+            ttl: Seconds the entry stays fresh
+            
+        Returns:
+            The cached response body
+        """
+        entry.expires_at = time.monotonic() + ttl
+        if self._entries.get(key) is not entry:
+            self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        self._entries.move_to_end(key)
+        return entry.data
+    
+    def conditional_headers(self, headers: Dict[str, str], entry: Optional[CacheEntry]) -> Dict[str, str]:
+        """
+        Add If-None-Match to request headers when a stale entry has an ETag.
+        
+        Args:
+            headers: Base request headers (not modified)
+            entry: Cached entry for the request, if any
+            
+        Returns:
+            Headers to send
+        """
+        if entry is None or not entry.etag:
+            return headers
+        return {**headers, "If-None-Match": entry.etag}
+    
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
+
+
+# Shared by all GitHubClient instances
+response_cache = ResponseCache()
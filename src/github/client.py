@@ -1,32 +1,569 @@
 """GitHub API client for making HTTP requests."""
 
+import asyncio
+import functools
 import json
 import logging
-from typing import List, Dict, Any, Optional
+import math
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 import httpx
 
-from ..config import GITHUB_API_BASE, get_github_headers, ErrorCode, DEFAULT_PAGE_SIZE
+try:
+    import orjson  # Optional: faster JSON decoding
+except ImportError:
+    orjson = None
+
+try:
+    import h2  # noqa: F401  Optional: lets httpx speak HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+from ..config import (
+    GITHUB_API_BASE,
+    GITHUB_TOKEN,
+    GITHUB_HEADERS,
+    ErrorCode,
+    DEFAULT_PAGE_SIZE,
+    ISSUE_CACHE_TTL,
+    REPO_CACHE_TTL,
+    SEARCH_CACHE_TTL,
+    MAX_RETRIES,
+    RETRY_BACKOFF_BASE,
+    MAX_RETRY_DELAY,
+    MAX_CONCURRENT_REQUESTS,
+)
 from ..utils.errors import MCPError, RateLimitError, GitHubApiError
 from ..utils.redact import safe_error_message
-from .models import IssueSearchResult, IssueDetail, Comment, RepositoryMetadata
+from .cache import response_cache
+from .disk_cache import repo_metadata_store
+from .models import IssueSearchResult, IssueDetail, Comment, RepositoryMetadata, IssueBundle
 
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive limits for the shared connection pool
+HTTP_POOL_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+
+# Gateway errors worth retrying for idempotent requests
+RETRYABLE_SERVER_ERRORS = frozenset({502, 503, 504})
+
+# The search API never returns more than this many results for a query
+SEARCH_RESULT_CAP = 1000
+
+# Selects only the fields IssueSearchResult reads; GraphQL needs a token.
+# An issue can carry at most 100 labels, so labels(first: 100) returns them
+# all, as REST does, and both paths score the same label set.
+SEARCH_ISSUES_QUERY = """
+query($q: String!, $n: Int!) {
+  search(query: $q, type: ISSUE, first: $n) {
+    nodes {
+      ... on Issue {
+        number
+        title
+        url
+        state
+        body
+        createdAt
+        updatedAt
+        comments { totalCount }
+        labels(first: 100) { nodes { name } }
+        repository { nameWithOwner }
+      }
+    }
+  }
+}
+"""
+
+# REST sort parameter -> GraphQL search qualifier (REST sorts descending)
+GRAPHQL_SORT_QUALIFIERS = {
+    "created": "sort:created-desc",
+    "updated": "sort:updated-desc",
+    "comments": "sort:comments-desc",
+}
+
+# The topics preview is folded into Accept for repository metadata
+REPOSITORY_HEADERS = {**GITHUB_HEADERS, "Accept": "application/vnd.github.mercy-preview+json"}
+
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+_request_semaphore: Optional[asyncio.Semaphore] = None
+_request_semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client used for all GitHub API requests.
+    
+    Reusing one client keeps TCP/TLS connections to api.github.com alive
+    between tool calls instead of paying a new handshake per request. The
+    client is created lazily and recreated if the running event loop
+    changes, since its connection pool is bound to the loop it was used on.
+    When h2 is installed, HTTP/2 is negotiated so concurrent requests are
+    multiplexed over a single connection.
+    
+    Returns:
+        Shared httpx.AsyncClient instance
+    """
+    global _http_client, _http_client_loop
+    
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = httpx.AsyncClient(
+            timeout=30,
+            limits=HTTP_POOL_LIMITS,
+            http2=HTTP2_AVAILABLE
+        )
+        _http_client_loop = loop
+    return _http_client
+
+
+def _get_request_semaphore() -> asyncio.Semaphore:
+    """
+    Get the semaphore capping in-flight GitHub API requests.
+    
+    Shared by all GitHubClient instances so fan-out through gather() can't
+    trip GitHub's secondary rate limits. Created lazily per event loop, like
+    the shared HTTP client.
+    
+    Returns:
+        Shared asyncio.Semaphore for API requests
+    """
+    global _request_semaphore, _request_semaphore_loop
+    
+    loop = asyncio.get_running_loop()
+    if _request_semaphore is None or _request_semaphore_loop is not loop:
+        _request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        _request_semaphore_loop = loop
+    return _request_semaphore
+
+
+def _parse_json(response: httpx.Response) -> Any:
+    """
+    Decode a JSON response body.
+    
+    Uses orjson on the raw bytes when it is installed, which is several times
+    faster than the stdlib decoder for large search results. Either way the
+    bytes are parsed directly: ``response.json()`` would first decode them
+    to text (with charset detection) and then parse that string.
+    
+    Args:
+        response: HTTP response with a JSON body
+        
+    Returns:
+        Decoded JSON data
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return json.loads(response.content)
+
+
+@functools.lru_cache(maxsize=8)
+def _token_headers(token: str) -> Dict[str, str]:
+    """
+    Get the default headers authenticated with an explicit token.
+    
+    Built once per token; the returned dict is shared and must not be mutated.
+    
+    Args:
+        token: GitHub personal access token
+        
+    Returns:
+        Request headers dict
+    """
+    return {**GITHUB_HEADERS, "Authorization": f"Bearer {token}"}
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client and its pooled connections."""
+    global _http_client, _http_client_loop
+    
+    client, _http_client, _http_client_loop = _http_client, None, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+# Rate limit buckets known to be exhausted -> reset time (epoch seconds)
+_exhausted_buckets: Dict[Tuple[str, Optional[str]], float] = {}
+
+
+def _rate_limit_bucket(url: str, headers: Optional[Dict[str, str]]) -> Tuple[str, Optional[str]]:
+    """
+    Identify the rate limit a request counts against.
+    
+    GitHub keeps separate budgets per resource (search, GraphQL and the core
+    REST API) and per credential.
+    
+    Args:
+        url: Request URL
+        headers: Request headers
+        
+    Returns:
+        (resource, Authorization header) tuple
+    """
+    if "/search/" in url:
+        resource = "search"
+    elif url.endswith("/graphql"):
+        resource = "graphql"
+    else:
+        resource = "core"
+    return resource, (headers or {}).get("Authorization")
+
+
+def _record_rate_limit(bucket: Tuple[str, Optional[str]], response: httpx.Response) -> None:
+    """Remember when an exhausted rate limit bucket resets."""
+    headers = response.headers
+    if headers.get("X-RateLimit-Remaining") != "0":
+        return
+    try:
+        _exhausted_buckets[bucket] = float(headers.get("X-RateLimit-Reset"))
+    except (TypeError, ValueError):
+        pass
+
+
+async def _wait_for_rate_limit_reset(bucket: Tuple[str, Optional[str]]) -> None:
+    """
+    Hold a request until its exhausted rate limit bucket resets.
+    
+    Short waits are slept through; long ones fail fast instead of sending a
+    request that is certain to be rejected.
+    
+    Args:
+        bucket: Rate limit bucket of the request
+        
+    Raises:
+        RateLimitError: If the reset is more than MAX_RETRY_DELAY away
+    """
+    reset_at = _exhausted_buckets.get(bucket)
+    if reset_at is None:
+        return
+    
+    wait = reset_at - time.time()
+    if wait > MAX_RETRY_DELAY:
+        raise RateLimitError(reset_at=int(reset_at), limit_remaining=0)
+    if wait > 0:
+        logger.warning("GitHub API rate limit exhausted, waiting %.1fs for reset", wait)
+        await asyncio.sleep(wait)
+    _exhausted_buckets.pop(bucket, None)
+
+
+# Cache key -> task fetching it, for coalescing identical concurrent requests
+_inflight: Dict[str, "asyncio.Task[Any]"] = {}
+
+
+async def _coalesce(key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Share one fetch between concurrent callers asking for the same key.
+    
+    The first caller starts the fetch as a task; callers arriving while it
+    runs await the same task instead of sending their own request. The task
+    is shielded, so one caller being cancelled doesn't cancel it for the
+    others.
+    
+    Args:
+        key: Cache key identifying the request
+        fetch: Starts the request when no identical one is in flight
+        
+    Returns:
+        The fetch result (shared between all callers)
+    """
+    task = _inflight.get(key)
+    if task is None or task.get_loop() is not asyncio.get_running_loop():
+        task = asyncio.ensure_future(fetch())
+        _inflight[key] = task
+        
+        def forget(done: "asyncio.Task[Any]") -> None:
+            if _inflight.get(key) is done:
+                del _inflight[key]
+        
+        task.add_done_callback(forget)
+    return await asyncio.shield(task)
+
+
+# Maps an error status code to a factory building the exception to raise
+ErrorMap = Dict[int, Callable[[httpx.Response], Exception]]
+
+
+def _rate_limited(response: httpx.Response) -> RateLimitError:
+    """Build the error for a 429 Too Many Requests response."""
+    reset_at = response.headers.get("X-RateLimit-Reset")
+    remaining = response.headers.get("X-RateLimit-Remaining", "0")
+    logger.error("Rate limit hit. Reset at: %s", reset_at)
+    return RateLimitError(reset_at=reset_at, limit_remaining=int(remaining))
+
+
+def _search_forbidden(response: httpx.Response) -> MCPError:
+    """Build the error for a 403 response, telling rate limits from access errors."""
+    # Primary rate limits are flagged in the headers; only parse the body
+    # for other 403s (e.g. secondary limits)
+    if response.headers.get("X-RateLimit-Remaining") == "0":
+        logger.error("Rate limit exceeded via 403 response")
+        return RateLimitError(reset_at=response.headers.get("X-RateLimit-Reset"), limit_remaining=0)
+    
+    error_data = _parse_json(response)
+    if "rate limit" in error_data.get("message", "").lower():
+        logger.error("Rate limit exceeded via 403 response")
+        return RateLimitError(limit_remaining=0)
+    logger.error("Access forbidden: %s", error_data.get('message'))
+    return GitHubApiError(error_data.get("message", "Access forbidden"), status_code=403)
+
+
+def _pr_validation_failed(response: httpx.Response) -> MCPError:
+    """Build the error for a 422 response to a pull request creation."""
+    error_data = _parse_json(response)
+    return MCPError(
+        ErrorCode.PR_CREATION_FAILED,
+        f"Pull request validation failed: {error_data.get('message', 'Unknown error')}",
+        {"errors": error_data.get("errors", [])}
+    )
+
+
+SEARCH_ERRORS: ErrorMap = {429: _rate_limited, 403: _search_forbidden}
+PR_ERRORS: ErrorMap = {422: _pr_validation_failed}
+FORK_ERRORS: ErrorMap = {
+    403: lambda response: MCPError(
+        ErrorCode.FORK_FAILED,
+        "Cannot fork repository. You may not have permission or already have a fork.",
+        {}
+    )
+}
+
 
 class GitHubClient:
     """Client for interacting with the GitHub API."""
     
-    def __init__(self, timeout: int = 30):
+    def __init__(
+        self,
+        timeout: int = 30,
+        http_client: Optional[httpx.AsyncClient] = None,
+        max_retries: int = MAX_RETRIES
+    ):
         """
         Initialize the GitHub API client.
         
+        Requests go through the module's shared connection pool unless an
+        explicit http_client is given, so creating a GitHubClient per call
+        still reuses open connections.
+        
         Args:
             timeout: Request timeout in seconds
+            http_client: Dedicated HTTP client to use instead of the shared pool
+            max_retries: Retries for throttled or transiently failing requests
         """
         self.base_url = GITHUB_API_BASE
         self.timeout = timeout
-        logger.debug(f"GitHubClient initialized with {timeout}s timeout")
+        self.max_retries = max_retries
+        self._client = http_client
+        logger.debug("GitHubClient initialized with %ss timeout", timeout)
+    
+    async def __aenter__(self) -> "GitHubClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+    
+    def _http(self) -> httpx.AsyncClient:
+        """Get the HTTP client for this instance's requests."""
+        return self._client if self._client is not None else get_http_client()
+    
+    async def aclose(self) -> None:
+        """
+        Close the dedicated HTTP client, if one was given.
+        
+        The shared pool outlives individual clients and is closed on server
+        shutdown via close_http_client().
+        """
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+    
+    def _retry_delay(self, method: str, response: httpx.Response, attempt: int) -> Optional[float]:
+        """
+        Decide whether and how long to wait before retrying a request.
+        
+        Throttled requests (429, or 403 with Retry-After for secondary rate
+        limits) were rejected outright, so they are retried for any method.
+        Gateway errors are only retried for GETs, since a POST may have been
+        applied. Waits follow Retry-After or X-RateLimit-Reset, with capped
+        exponential backoff and jitter.
+        
+        Args:
+            method: HTTP method of the request
+            response: Response that was received
+            attempt: Zero-based attempt number
+            
+        Returns:
+            Seconds to wait, or None if the response should be returned as-is
+        """
+        status = response.status_code
+        retry_after = response.headers.get("Retry-After")
+        
+        if status == 429 or (status == 403 and retry_after is not None):
+            wait = 0.0
+            try:
+                if retry_after is not None:
+                    wait = float(retry_after)
+                elif response.headers.get("X-RateLimit-Reset"):
+                    wait = max(0.0, int(response.headers["X-RateLimit-Reset"]) - time.time())
+            except ValueError:
+                pass
+            
+            # The limit won't reset soon; let the caller report it
+            if wait > MAX_RETRY_DELAY:
+                return None
+        elif status in RETRYABLE_SERVER_ERRORS and method == "GET":
+            wait = 0.0
+        else:
+            return None
+        
+        backoff = RETRY_BACKOFF_BASE * (2 ** attempt)
+        return min(max(wait, backoff) + random.uniform(0, 1), MAX_RETRY_DELAY)
+    
+    async def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """
+        Send a request, retrying throttled and transient failures.
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Passed through to httpx (params, headers, json, ...)
+            
+        Returns:
+            The final httpx.Response; error statuses are left to the caller
+            
+        Raises:
+            RateLimitError: If the rate limit bucket for this request is known
+                to be exhausted and won't reset within MAX_RETRY_DELAY
+        """
+        client = self._http()
+        bucket = _rate_limit_bucket(url, kwargs.get("headers"))
+        attempt = 0
+        while True:
+            await _wait_for_rate_limit_reset(bucket)
+            
+            # Only the request itself holds a slot, not the backoff sleep
+            async with _get_request_semaphore():
+                response = await client.request(method, url, timeout=self.timeout, **kwargs)
+            _record_rate_limit(bucket, response)
+            if attempt >= self.max_retries:
+                return response
+            
+            delay = self._retry_delay(method, response, attempt)
+            if delay is None:
+                return response
+            
+            logger.warning(
+                "GitHub API returned %s, retrying in %.1fs (attempt %s/%s)",
+                response.status_code, delay, attempt + 1, self.max_retries
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+    
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        errors: Optional[ErrorMap] = None,
+        **kwargs: Any
+    ) -> httpx.Response:
+        """
+        Send a request and raise the mapped exception for error statuses.
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            errors: Status code -> exception factory dispatch table
+            **kwargs: Passed through to _request
+            
+        Returns:
+            The response, for statuses without an entry in errors
+            
+        Raises:
+            Exception: Built by the factory registered for the status code
+        """
+        response = await self._request(method, url, **kwargs)
+        self._check_rate_limit(response)
+        
+        if errors:
+            make_error = errors.get(response.status_code)
+            if make_error is not None:
+                raise make_error(response)
+        return response
+    
+    async def _get_cached_json(
+        self,
+        url: str,
+        ttl: float,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Dict[str, str] = GITHUB_HEADERS,
+        errors: Optional[ErrorMap] = None
+    ) -> Any:
+        """
+        GET a JSON resource through the response cache.
+        
+        Fresh entries are returned without a request; stale ones are
+        revalidated with If-None-Match and refreshed on a 304.
+        
+        Args:
+            url: Request URL
+            ttl: Seconds a fetched response stays fresh
+            params: Query parameters
+            headers: Request headers
+            errors: Status code -> exception factory dispatch table
+            
+        Returns:
+            Decoded JSON body
+            
+        Raises:
+            httpx.HTTPStatusError: For unmapped error statuses
+        """
+        key = response_cache.make_key(url, params)
+        cached = response_cache.lookup(key)
+        if cached is not None and cached.is_fresh():
+            return cached.data
+        
+        return await _coalesce(key, lambda: self._fetch_json(key, url, ttl, params, headers, errors))
+    
+    async def _fetch_json(
+        self,
+        key: str,
+        url: str,
+        ttl: float,
+        params: Optional[Dict[str, Any]],
+        headers: Dict[str, str],
+        errors: Optional[ErrorMap]
+    ) -> Any:
+        """
+        Fetch (or revalidate) a JSON resource and update the response cache.
+        
+        Args:
+            key: Cache key of the resource
+            url: Request URL
+            ttl: Seconds a fetched response stays fresh
+            params: Query parameters
+            headers: Request headers
+            errors: Status code -> exception factory dispatch table
+            
+        Returns:
+            Decoded JSON body
+        """
+        cached = response_cache.lookup(key)
+        response = await self._send(
+            "GET",
+            url,
+            errors,
+            params=params,
+            headers=response_cache.conditional_headers(headers, cached)
+        )
+        if response.status_code == 304 and cached is not None:
+            return response_cache.revalidate(key, cached, ttl)
+        
+        response.raise_for_status()
+        data = _parse_json(response)
+        response_cache.store(key, data, response.headers.get("ETag"), ttl)
+        return data
     
     def _extract_rate_limit_info(self, response: httpx.Response) -> Dict[str, Any]:
         """Extract rate limit information from response headers."""
@@ -38,16 +575,19 @@ class GitHubClient:
     
     def _check_rate_limit(self, response: httpx.Response) -> None:
         """Check and log rate limit status from response headers."""
-        rate_info = self._extract_rate_limit_info(response)
-        remaining = rate_info.get("remaining")
-        limit = rate_info.get("limit")
+        headers = response.headers
+        try:
+            remaining = int(headers.get("X-RateLimit-Remaining", ""))
+            limit = int(headers.get("X-RateLimit-Limit", ""))
+        except (TypeError, ValueError):
+            return  # Headers missing or malformed
         
-        if remaining and limit:
-            logger.debug(f"GitHub API rate limit: {remaining}/{limit} remaining")
-            
-            # Warn if approaching limit
-            if int(remaining) < int(limit) * 0.1:  # Less than 10% remaining
-                logger.warning(f"Approaching GitHub API rate limit: {remaining}/{limit}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("GitHub API rate limit: %s/%s remaining (%s)", remaining, limit, response.http_version)
+        
+        # Warn if approaching limit (less than 10% remaining, in integer math)
+        if remaining * 10 < limit:
+            logger.warning("Approaching GitHub API rate limit: %s/%s", remaining, limit)
     
     async def search_issues(
         self,
@@ -77,58 +617,193 @@ class GitHubClient:
             "per_page": min(limit, 100)  # GitHub max is 100
         }
         
-        logger.info(f"Searching GitHub issues: {query[:50]}...")
+        logger.info("Searching GitHub issues: %s...", query[:50])
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    url,
-                    params=params,
-                    headers=get_github_headers()
-                )
-                
-                # Check and log rate limit
-                self._check_rate_limit(response)
-                
-                if response.status_code == 429:
-                    # Too Many Requests
-                    reset_at = response.headers.get("X-RateLimit-Reset")
-                    remaining = response.headers.get("X-RateLimit-Remaining", "0")
-                    logger.error(f"Rate limit hit. Reset at: {reset_at}")
-                    raise RateLimitError(reset_at=reset_at, limit_remaining=int(remaining))
-                
-                if response.status_code == 403:
-                    error_data = response.json()
-                    if "rate limit" in error_data.get("message", "").lower():
-                        logger.error("Rate limit exceeded via 403 response")
-                        raise RateLimitError(limit_remaining=0)
-                    logger.error(f"Access forbidden: {error_data.get('message')}")
-                    raise GitHubApiError(
-                        error_data.get('message', 'Access forbidden'),
-                        status_code=403
-                    )
-                
-                response.raise_for_status()
-                data = response.json()
-                
-                items = data.get("items", [])[:limit]
-                logger.info(f"Found {len(items)} issues")
-                return [IssueSearchResult(item) for item in items]
-                
+            # GraphQL serves a single page; larger searches paginate over REST
+            if GITHUB_TOKEN and limit <= 100:
+                try:
+                    return await self._search_issues_graphql(query, sort, limit)
+                except MCPError as e:
+                    logger.warning("GraphQL search failed, falling back to REST: %s", e.message)
+            
+            data = await self._get_cached_json(url, SEARCH_CACHE_TTL, params=params, errors=SEARCH_ERRORS)
+            
+            items = data.get("items", ())  # per_page already bounds the page
+            if limit > 100:
+                items = [*items, *await self._search_remaining_pages(url, params, data, limit)][:limit]
+            logger.info("Found %s issues", len(items))
+            return IssueSearchResult.bulk(items)
+            
         except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error during search: {e.response.status_code}")
+            logger.error("HTTP error during search: %s", e.response.status_code)
             raise GitHubApiError(
                 safe_error_message(e, "GitHub API request failed"),
                 status_code=e.response.status_code
             )
         except httpx.RequestError as e:
-            logger.error(f"Network error: {safe_error_message(e, 'Network error')}")
+            logger.error("Network error: %s", safe_error_message(e, 'Network error'))
             raise MCPError(
                 ErrorCode.HTTP_ERROR,
                 safe_error_message(e, "Network error while contacting GitHub"),
                 {}
             )
     
+    async def search_repositories(
+        self,
+        query: str,
+        sort: str = "stars",
+        limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """
+        Search for repositories using GitHub search API.
+        
+        Args:
+            query: GitHub repository search query string
+            sort: Sort order (stars, forks, updated)
+            limit: Maximum number of results (at most 100)
+            
+        Returns:
+            Raw repository items, most relevant first
+            
+        Raises:
+            RateLimitError: If rate limit exceeded
+            httpx.HTTPStatusError: For other error statuses
+        """
+        params = {
+            "q": query,
+            "sort": sort,
+            "order": "desc",
+            "per_page": min(limit, 100)
+        }
+        data = await self._get_cached_json(
+            f"{self.base_url}/search/repositories",
+            SEARCH_CACHE_TTL,
+            params=params,
+            errors=SEARCH_ERRORS
+        )
+        return data.get("items", [])[:limit]
+    
+    async def _search_remaining_pages(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        first_page: Dict[str, Any],
+        limit: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch search result pages after the first one concurrently.
+        
+        The number of pages comes from the first page's total_count, so no
+        requests are made for pages that can't have results.
+        
+        Args:
+            url: Search endpoint URL
+            params: Query parameters used for the first page
+            first_page: Decoded first page of results
+            limit: Maximum number of results wanted overall
+            
+        Returns:
+            Raw items from pages 2 and onwards; stops at the first failed page
+        """
+        wanted = min(limit, first_page.get("total_count", 0), SEARCH_RESULT_CAP)
+        pages = math.ceil(wanted / 100)
+        if pages <= 1:
+            return []
+        
+        responses = await asyncio.gather(*(
+            self._request("GET", url, params={**params, "page": page}, headers=GITHUB_HEADERS)
+            for page in range(2, pages + 1)
+        ))
+        
+        items: List[Dict[str, Any]] = []
+        for response in responses:
+            # Partial results beat failing the whole search
+            if response.status_code != 200:
+                logger.warning("Search page request failed with %s; returning partial results", response.status_code)
+                break
+            items.extend(_parse_json(response).get("items", ()))
+        return items
+    
+    async def graphql(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run a GraphQL query against the GitHub v4 API.
+        
+        Args:
+            query: GraphQL query document
+            variables: Query variables
+            
+        Returns:
+            The "data" object of the response
+            
+        Raises:
+            GitHubApiError: If the request fails or returns only errors
+        """
+        response = await self._send(
+            "POST",
+            f"{self.base_url}/graphql",
+            json={"query": query, "variables": variables},
+            headers=GITHUB_HEADERS
+        )
+        
+        if response.status_code != 200:
+            raise GitHubApiError("GraphQL request failed", status_code=response.status_code)
+        
+        payload = _parse_json(response)
+        data = payload.get("data")
+        if not data:
+            errors = payload.get("errors") or [{}]
+            raise GitHubApiError(errors[0].get("message", "GraphQL query returned no data"))
+        return data
+    
+    async def _search_issues_graphql(self, query: str, sort: str, limit: int) -> List[IssueSearchResult]:
+        """
+        Search issues through GraphQL, fetching only the fields the results use.
+        
+        Args:
+            query: GitHub search query string
+            sort: Sort order (relevance, created, updated, comments)
+            limit: Maximum number of results
+            
+        Returns:
+            List of IssueSearchResult objects
+        """
+        qualifier = GRAPHQL_SORT_QUALIFIERS.get(sort)
+        if qualifier:
+            query = f"{query} {qualifier}"
+        
+        variables = {"q": query, "n": min(limit, 100)}
+        
+        # POSTs have no ETag to revalidate with, so entries simply expire
+        key = response_cache.make_key(f"{self.base_url}/graphql#search", variables)
+        cached = response_cache.lookup(key)
+        if cached is not None and cached.is_fresh():
+            return IssueSearchResult.bulk(cached.data)
+        
+        data = await _coalesce(key, lambda: self.graphql(SEARCH_ISSUES_QUERY, variables))
+        
+        # Reshape nodes into the REST item layout the model understands
+        items = [
+            {
+                "repository_url": f"{self.base_url}/repos/{node['repository']['nameWithOwner']}",
+                "number": node["number"],
+                "title": node["title"],
+                "html_url": node["url"],
+                "labels": node["labels"]["nodes"],
+                "comments": node["comments"]["totalCount"],
+                "created_at": node["createdAt"],
+                "updated_at": node["updatedAt"],
+                "state": node["state"].lower(),
+                "body": node["body"],
+                "score": 0  # GraphQL search has no relevance score
+            }
+            for node in data["search"]["nodes"]
+            if node  # Non-issue results come back as empty objects
+        ]
+        response_cache.store(key, items, None, SEARCH_CACHE_TTL)
+        logger.info("Found %s issues", len(items))
+        return IssueSearchResult.bulk(items)
+    
     async def get_issue(
         self,
         repo: str,
@@ -148,30 +823,22 @@ class GitHubClient:
             MCPError: If the API request fails
         """
         url = f"{self.base_url}/repos/{repo}/issues/{number}"
+        errors = {
+            404: lambda response: MCPError(
+                ErrorCode.GITHUB_NOT_FOUND,
+                f"Issue #{number} not found in repository {repo}",
+                {"repo": repo, "number": number}
+            ),
+            403: lambda response: MCPError(
+                ErrorCode.GITHUB_RATE_LIMIT,
+                "GitHub API rate limit exceeded. Please set GITHUB_TOKEN environment variable.",
+                {}
+            )
+        }
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, headers=get_github_headers())
-                
-                if response.status_code == 404:
-                    raise MCPError(
-                        ErrorCode.GITHUB_NOT_FOUND,
-                        f"Issue #{number} not found in repository {repo}",
-                        {"repo": repo, "number": number}
-                    )
-                
-                if response.status_code == 403:
-                    raise MCPError(
-                        ErrorCode.GITHUB_RATE_LIMIT,
-                        "GitHub API rate limit exceeded. Please set GITHUB_TOKEN environment variable.",
-                        {}
-                    )
-                
-                response.raise_for_status()
-                data = response.json()
-                
-                return IssueDetail(data)
-                
+            return IssueDetail(await self._get_cached_json(url, ISSUE_CACHE_TTL, errors=errors))
+            
         except httpx.HTTPStatusError as e:
             raise MCPError(
                 ErrorCode.HTTP_ERROR,
@@ -194,6 +861,9 @@ class GitHubClient:
         """
         Get comments for a specific issue.
         
+        Pages beyond the first 100 comments are requested concurrently
+        (bounded by the shared request limit) rather than one after another.
+        
         Args:
             repo: Repository in "owner/repo" format
             number: Issue number
@@ -213,28 +883,66 @@ class GitHubClient:
         }
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    url,
-                    params=params,
-                    headers=get_github_headers()
-                )
-                
-                if response.status_code == 404:
-                    # Issue might not exist, but return empty list
-                    return []
-                
-                response.raise_for_status()
-                data = response.json()
-                
-                return [Comment(comment) for comment in data[:max_comments]]
-                
+            items = await self._get_cached_json(url, ISSUE_CACHE_TTL, params=params)
+            
+            # A full first page may have more behind it; fetch the rest at once
+            pages = math.ceil(max_comments / 100)
+            if pages > 1 and len(items) == 100:
+                rest = await asyncio.gather(*(
+                    self._get_cached_json(url, ISSUE_CACHE_TTL, params={**params, "page": page})
+                    for page in range(2, pages + 1)
+                ))
+                items = [*items]
+                for page_items in rest:
+                    items.extend(page_items)
+                    if len(page_items) < 100:
+                        break  # Later pages are empty
+                items = items[:max_comments]
+            
+            return Comment.bulk(items)
+            
         except httpx.HTTPStatusError as e:
             # For comments, we can be more lenient and return empty list
+            # (this includes a 404 for an issue that doesn't exist)
             return []
-        except httpx.RequestError as e:
+        except (httpx.RequestError, RateLimitError) as e:
             return []
     
+    async def get_issue_bundle(
+        self,
+        repo: str,
+        number: int,
+        max_comments: int = 10,
+        include_repository: bool = False
+    ) -> IssueBundle:
+        """
+        Get an issue together with its comments (and optionally its repository).
+        
+        The requests don't depend on each other, so they are issued
+        concurrently and cost one round trip instead of two or three.
+        
+        Args:
+            repo: Repository in "owner/repo" format
+            number: Issue number
+            max_comments: Maximum number of comments to return
+            include_repository: Whether to also fetch repository metadata
+            
+        Returns:
+            IssueBundle object
+            
+        Raises:
+            MCPError: If the issue or repository request fails
+        """
+        requests = [
+            self.get_issue(repo, number),
+            self.get_issue_comments(repo, number, max_comments)
+        ]
+        if include_repository:
+            requests.append(self.get_repository(repo))
+        
+        issue, comments, *repository = await asyncio.gather(*requests)
+        return IssueBundle(issue, comments, repository[0] if repository else None)
+    
     async def get_repository(self, repo: str) -> RepositoryMetadata:
         """
         Get repository metadata.
@@ -249,26 +957,32 @@ class GitHubClient:
             MCPError: If the API request fails
         """
         url = f"{self.base_url}/repos/{repo}"
-        headers = get_github_headers()
-        # Add topics preview header
-        headers["Accept"] = "application/vnd.github.mercy-preview+json"
+        errors = {
+            404: lambda response: MCPError(
+                ErrorCode.GITHUB_NOT_FOUND,
+                f"Repository {repo} not found",
+                {"repo": repo}
+            )
+        }
+        
+        store = repo_metadata_store
+        key = response_cache.make_key(url)
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, headers=headers)
-                
-                if response.status_code == 404:
-                    raise MCPError(
-                        ErrorCode.GITHUB_NOT_FOUND,
-                        f"Repository {repo} not found",
-                        {"repo": repo}
-                    )
-                
-                response.raise_for_status()
-                data = response.json()
-                
-                return RepositoryMetadata(data)
-                
+            if store is not None and response_cache.lookup(key) is None:
+                # Seed a stale entry so the first fetch is a conditional request
+                stored = await store.load(repo)
+                if stored is not None and response_cache.lookup(key) is None:
+                    response_cache.store(key, stored[0], stored[1], 0)
+            
+            data = await self._get_cached_json(url, REPO_CACHE_TTL, headers=REPOSITORY_HEADERS, errors=errors)
+            
+            if store is not None:
+                entry = response_cache.lookup(key)
+                if entry is not None:
+                    await store.save(repo, entry.data, entry.etag)
+            return RepositoryMetadata(data)
+            
         except httpx.HTTPStatusError as e:
             raise MCPError(
                 ErrorCode.HTTP_ERROR,
@@ -311,8 +1025,7 @@ class GitHubClient:
             MCPError: If the API request fails
         """
         url = f"{self.base_url}/repos/{repo}/pulls"
-        headers = get_github_headers()
-        headers["Authorization"] = f"Bearer {token}"
+        headers = _token_headers(token)
         
         payload = {
             "title": title,
@@ -323,29 +1036,21 @@ class GitHubClient:
         }
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    url,
-                    json=payload,
-                    headers=headers
-                )
-                
-                if response.status_code == 422:
-                    error_data = response.json()
-                    raise MCPError(
-                        ErrorCode.PR_CREATION_FAILED,
-                        f"Pull request validation failed: {error_data.get('message', 'Unknown error')}",
-                        {"errors": error_data.get("errors", [])}
-                    )
-                
-                response.raise_for_status()
-                data = response.json()
-                
-                return {
-                    "pr_url": data.get("html_url", ""),
-                    "pr_number": data.get("number", 0)
-                }
-                
+            response = await self._send(
+                "POST",
+                url,
+                PR_ERRORS,
+                json=payload,
+                headers=headers
+            )
+            response.raise_for_status()
+            data = _parse_json(response)
+            
+            return {
+                "pr_url": data.get("html_url", ""),
+                "pr_number": data.get("number", 0)
+            }
+            
         except httpx.HTTPStatusError as e:
             raise MCPError(
                 ErrorCode.PR_CREATION_FAILED,
@@ -378,29 +1083,19 @@ class GitHubClient:
             MCPError: If the API request fails
         """
         url = f"{self.base_url}/repos/{repo}/forks"
-        headers = get_github_headers()
-        headers["Authorization"] = f"Bearer {token}"
+        headers = _token_headers(token)
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(url, headers=headers)
-                
-                if response.status_code == 403:
-                    raise MCPError(
-                        ErrorCode.FORK_FAILED,
-                        "Cannot fork repository. You may not have permission or already have a fork.",
-                        {}
-                    )
-                
-                response.raise_for_status()
-                data = response.json()
-                
-                return {
-                    "fork_full_name": data.get("full_name", ""),
-                    "clone_url": data.get("clone_url", ""),
-                    "ssh_url": data.get("ssh_url", "")
-                }
-                
+            response = await self._send("POST", url, FORK_ERRORS, headers=headers)
+            response.raise_for_status()
+            data = _parse_json(response)
+            
+            return {
+                "fork_full_name": data.get("full_name", ""),
+                "clone_url": data.get("clone_url", ""),
+                "ssh_url": data.get("ssh_url", "")
+            }
+            
         except httpx.HTTPStatusError as e:
             raise MCPError(
                 ErrorCode.FORK_FAILED,
@@ -413,3 +1108,23 @@ class GitHubClient:
                 safe_error_message(e, "Network error while forking repository"),
                 {}
             )
+
+
+_default_client: Optional[GitHubClient] = None
+
+
+def get_default_client() -> GitHubClient:
+    """
+    Get the process-wide GitHubClient used by the MCP tool handlers.
+    
+    The client holds only configuration; its connections live in the shared
+    pool, which the server closes on shutdown via close_http_client().
+    
+    Returns:
+        Shared GitHubClient instance
+    """
+    global _default_client
+    
+    if _default_client is None:
+        _default_client = GitHubClient()
+    return _default_client
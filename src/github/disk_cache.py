@@ -0,0 +1,143 @@
+"""On-disk store for repository metadata responses."""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import time
+import zlib
+from contextlib import closing
+from typing import Any, Dict, Optional, Tuple
+
+from ..config import REPO_DISK_CACHE_PATH, REPO_DISK_CACHE_MAX_AGE
+
+
+logger = logging.getLogger(__name__)
+
+
+class RepoMetadataStore:
+    """
+    SQLite table of repository metadata bodies and their ETags.
+    
+    Repository metadata rarely changes, but the in-memory response cache
+    starts empty with every server process. Stored bodies are used to seed
+    that cache as stale entries, so the first lookup in a new session is a
+    conditional request; GitHub answers an unchanged repository with a 304
+    that does not count against the rate limit and carries no body.
+    
+    Storage errors are logged and treated as misses; the store never fails
+    a request.
+    """
+    
+    def __init__(self, path: str, max_age: float = REPO_DISK_CACHE_MAX_AGE):
+        """
+        Initialize the store.
+        
+        Args:
+            path: SQLite database file, created on first write
+            max_age: Seconds a stored body is kept before it is ignored
+                unless it is confirmed unchanged again
+        """
+        self.path = path
+        self.max_age = max_age
+        # Re-confirmed bodies get a fresh timestamp at most this often
+        self.touch_interval = max_age / 24
+        self._ready = False
+        # ETags known to be on disk, so unchanged responses aren't rewritten
+        self._stored_etags: Dict[str, str] = {}
+        # When each stored body was last written or confirmed
+        self._stored_at: Dict[str, float] = {}
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database, creating the file and table if needed."""
+        if not self._ready:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        if not self._ready:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS repos ("
+                "repo TEXT PRIMARY KEY, etag TEXT, payload BLOB, fetched_at REAL)"
+            )
+            self._ready = True
+        return conn
+    
+    def _load(self, repo: str) -> Optional[Tuple[Any, str]]:
+        """Blocking part of load()."""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT etag, payload, fetched_at FROM repos WHERE repo = ? AND fetched_at > ?",
+                (repo, time.time() - self.max_age)
+            ).fetchone()
+        if row is None:
+            return None
+        etag, payload, fetched_at = row
+        self._stored_etags[repo] = etag
+        self._stored_at[repo] = fetched_at
+        return json.loads(zlib.decompress(payload)), etag
+    
+    def _save(self, repo: str, data: Any, etag: str) -> None:
+        """Blocking part of save()."""
+        payload = zlib.compress(json.dumps(data, separators=(",", ":")).encode())
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO repos (repo, etag, payload, fetched_at) VALUES (?, ?, ?, ?)",
+                (repo, etag, payload, now)
+            )
+        self._stored_etags[repo] = etag
+        self._stored_at[repo] = now
+    
+    def _touch(self, repo: str) -> None:
+        """Blocking part of save() for a body that is already stored."""
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            conn.execute("UPDATE repos SET fetched_at = ? WHERE repo = ?", (now, repo))
+        self._stored_at[repo] = now
+    
+    async def load(self, repo: str) -> Optional[Tuple[Any, str]]:
+        """
+        Get the stored metadata body for a repository.
+        
+        Args:
+            repo: Repository in "owner/repo" format
+            
+        Returns:
+            (data, etag) tuple, or None if nothing recent is stored
+        """
+        try:
+            return await asyncio.to_thread(self._load, repo)
+        except (sqlite3.Error, OSError, ValueError, zlib.error) as e:
+            logger.debug("Repository cache read failed for %s: %s", repo, e)
+            return None
+    
+    async def save(self, repo: str, data: Any, etag: Optional[str]) -> None:
+        """
+        Store a metadata body, or refresh the timestamp of a stored one.
+        
+        A body GitHub confirmed unchanged (same ETag) isn't rewritten; only
+        its fetched_at is bumped, at most once per touch_interval, so it
+        doesn't age out while it is still being revalidated.
+        
+        Args:
+            repo: Repository in "owner/repo" format
+            data: Decoded response body
+            etag: ETag of the response; bodies without one aren't stored
+        """
+        if not etag:
+            return
+        try:
+            if self._stored_etags.get(repo) != etag:
+                await asyncio.to_thread(self._save, repo, data, etag)
+            elif time.time() - self._stored_at.get(repo, 0) > self.touch_interval:
+                await asyncio.to_thread(self._touch, repo)
+        except (sqlite3.Error, OSError, TypeError, ValueError) as e:
+            logger.debug("Repository cache write failed for %s: %s", repo, e)
+
+
+# Shared by all GitHubClient instances; None when no path is configured
+repo_metadata_store: Optional[RepoMetadataStore] = (
+    RepoMetadataStore(REPO_DISK_CACHE_PATH) if REPO_DISK_CACHE_PATH else None
+)
@@ -1,27 +1,142 @@
-"""Data models for GitHub API responses."""
+"""
+Data models for GitHub API responses.
 
-from typing import List, Optional, Any, Dict
+These classes only reshape decoded JSON (dicts and strings), and the tool
+calls that build them are bound by GitHub round-trip latency, not CPU. JIT
+compilers such as Numba can't type this kind of dynamic data, so speedups
+here come from doing less work per object instead: __slots__, bulk
+construction, and memoized derived fields.
+"""
+
+import operator
+from typing import Iterable, FrozenSet, List, Optional, Any, Dict, Tuple
 from datetime import datetime
 
 
+# Default snippet length; snippets of this length are memoized per result
+SNIPPET_LENGTH = 200
+
+# Shared stand-in for empty label/assignee lists; immutable, so safe to share
+_EMPTY: Tuple[()] = ()
+
+# Serialized field order for each model's to_dict; the getters fetch every
+# value in one C-level call instead of one attribute lookup per key. The keys
+# are identifier-like literals, which the compiler already interns, so every
+# emitted dict shares the same key objects without explicit sys.intern calls.
+_SEARCH_RESULT_KEYS = (
+    "repo", "number", "title", "url", "labels", "comments", "created_at", "updated_at",
+)
+_SEARCH_RESULT_VALUES = operator.attrgetter(*_SEARCH_RESULT_KEYS)
+
+_ISSUE_DETAIL_KEYS = (
+    "number", "title", "body", "url", "state", "labels", "assignees", "milestone",
+    "created_at", "updated_at", "closed_at", "author", "comments_count",
+)
+_ISSUE_DETAIL_VALUES = operator.attrgetter(*_ISSUE_DETAIL_KEYS)
+
+_COMMENT_KEYS = ("id", "author", "body", "created_at", "updated_at", "url")
+_COMMENT_VALUES = operator.attrgetter(*_COMMENT_KEYS)
+
+_REPOSITORY_KEYS = (
+    "name", "full_name", "description", "default_branch", "language", "license",
+    "stars", "forks", "open_issues", "clone_url", "ssh_url", "topics", "homepage",
+    "created_at", "updated_at",
+)
+_REPOSITORY_VALUES = operator.attrgetter(*_REPOSITORY_KEYS)
+
+
 class IssueSearchResult:
     """Represents a GitHub issue search result."""
     
+    __slots__ = (
+        "repo", "number", "title", "url", "labels", "comments", "created_at",
+        "updated_at", "state", "body", "score", "_snippet",
+        "_label_set",
+    )
+    
     def __init__(self, data: Dict[str, Any]):
-        self.repo = data.get("repository_url", "").split("/repos/")[-1] if "repository_url" in data else ""
+        self.repo = data["repository_url"].rpartition("/repos/")[2] if "repository_url" in data else ""
         self.number = data.get("number", 0)
         self.title = data.get("title", "")
         self.url = data.get("html_url", "")
-        self.labels = [label.get("name", "") for label in data.get("labels", [])]
+        labels = data.get("labels")
+        self.labels = [label.get("name", "") for label in labels] if labels else _EMPTY
         self.comments = data.get("comments", 0)
         self.created_at = data.get("created_at", "")
         self.updated_at = data.get("updated_at", "")
         self.state = data.get("state", "open")
         self.body = data.get("body", "")
         self.score = data.get("score", 0)
+        self._snippet: Optional[str] = None
+        self._label_set: Optional[FrozenSet[str]] = None
+    
+    # Every key __init__ reads; API items always carry all of them
+    _BULK_FIELDS = operator.itemgetter(
+        "repository_url", "number", "title", "html_url", "labels", "comments",
+        "created_at", "updated_at", "state", "body", "score"
+    )
     
-    def get_snippet(self, max_length: int = 200) -> str:
+    @classmethod
+    def bulk(cls, items: Iterable[Dict[str, Any]]) -> List["IssueSearchResult"]:
+        """
+        Build results for a whole page of search items.
+        
+        Pulls all fields out of each item with one itemgetter call instead of
+        a dict.get() per field. Items missing any key (e.g. hand-built test
+        data) go through __init__ so defaults still apply.
+        
+        Args:
+            items: Raw search result items
+            
+        Returns:
+            List of IssueSearchResult objects
+        """
+        fields = cls._BULK_FIELDS
+        new = cls.__new__
+        results = []
+        for item in items:
+            try:
+                (repository_url, number, title, url, labels, comments,
+                 created_at, updated_at, state, body, score) = fields(item)
+            except KeyError:
+                results.append(cls(item))
+                continue
+            
+            result = new(cls)
+            result.repo = repository_url.rpartition("/repos/")[2]
+            result.number = number
+            result.title = title
+            result.url = url
+            result.labels = [label.get("name", "") for label in labels] if labels else _EMPTY
+            result.comments = comments
+            result.created_at = created_at
+            result.updated_at = updated_at
+            result.state = state
+            result.body = body
+            result.score = score
+            result._snippet = None
+            result._label_set = None
+            results.append(result)
+        return results
+    
+    @property
+    def label_set(self) -> FrozenSet[str]:
+        """Lowercased label names, built on first access."""
+        # A plain slot instead of functools.cached_property, which needs __dict__
+        if self._label_set is None:
+            self._label_set = frozenset(label.lower() for label in self.labels)
+        return self._label_set
+    
+    def get_snippet(self, max_length: int = SNIPPET_LENGTH) -> str:
         """Get a short snippet of the issue body."""
+        if max_length == SNIPPET_LENGTH:
+            if self._snippet is None:
+                self._snippet = self._make_snippet(max_length)
+            return self._snippet
+        return self._make_snippet(max_length)
+    
+    def _make_snippet(self, max_length: int) -> str:
+        """Strip and truncate the body to at most max_length characters."""
         if not self.body:
             return "(No description)"
         
@@ -33,31 +148,30 @@ class IssueSearchResult:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return {
-            "repo": self.repo,
-            "number": self.number,
-            "title": self.title,
-            "url": self.url,
-            "labels": self.labels,
-            "comments": self.comments,
-            "created_at": self.created_at,
-            "updated_at": self.updated_at,
-            "snippet": self.get_snippet(),
-            "state": self.state
-        }
+        result = dict(zip(_SEARCH_RESULT_KEYS, _SEARCH_RESULT_VALUES(self)))
+        result["snippet"] = self.get_snippet()
+        result["state"] = self.state
+        return result
 
 
 class IssueDetail:
     """Represents detailed information about a GitHub issue."""
     
+    __slots__ = (
+        "number", "title", "body", "url", "state", "labels", "assignees", "milestone",
+        "created_at", "updated_at", "closed_at", "author", "comments_count",
+    )
+    
     def __init__(self, data: Dict[str, Any]):
         self.number = data.get("number", 0)
         self.title = data.get("title", "")
         self.body = data.get("body", "")
         self.url = data.get("html_url", "")
         self.state = data.get("state", "open")
-        self.labels = [label.get("name", "") for label in data.get("labels", [])]
-        self.assignees = [assignee.get("login", "") for assignee in data.get("assignees", [])]
+        labels = data.get("labels")
+        self.labels = [label.get("name", "") for label in labels] if labels else _EMPTY
+        assignees = data.get("assignees")
+        self.assignees = [assignee.get("login", "") for assignee in assignees] if assignees else _EMPTY
         self.milestone = data.get("milestone", {}).get("title") if data.get("milestone") else None
         self.created_at = data.get("created_at", "")
         self.updated_at = data.get("updated_at", "")
@@ -67,26 +181,14 @@ class IssueDetail:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return {
-            "number": self.number,
-            "title": self.title,
-            "body": self.body,
-            "url": self.url,
-            "state": self.state,
-            "labels": self.labels,
-            "assignees": self.assignees,
-            "milestone": self.milestone,
-            "created_at": self.created_at,
-            "updated_at": self.updated_at,
-            "closed_at": self.closed_at,
-            "author": self.author,
-            "comments_count": self.comments_count
-        }
+        return dict(zip(_ISSUE_DETAIL_KEYS, _ISSUE_DETAIL_VALUES(self)))
 
 
 class Comment:
     """Represents a GitHub issue comment."""
     
+    __slots__ = ("id", "author", "body", "created_at", "updated_at", "url")
+    
     def __init__(self, data: Dict[str, Any]):
         self.id = data.get("id", 0)
         self.author = data.get("user", {}).get("login", "")
@@ -95,21 +197,56 @@ class Comment:
         self.updated_at = data.get("updated_at", "")
         self.url = data.get("html_url", "")
     
+    # Every key __init__ reads; API items always carry all of them
+    _BULK_FIELDS = operator.itemgetter("id", "user", "body", "created_at", "updated_at", "html_url")
+    
+    @classmethod
+    def bulk(cls, items: Iterable[Dict[str, Any]]) -> List["Comment"]:
+        """
+        Build comments for a whole page of API items.
+        
+        Same approach as IssueSearchResult.bulk().
+        
+        Args:
+            items: Raw comment items
+            
+        Returns:
+            List of Comment objects
+        """
+        fields = cls._BULK_FIELDS
+        new = cls.__new__
+        results = []
+        for item in items:
+            try:
+                comment_id, user, body, created_at, updated_at, url = fields(item)
+            except KeyError:
+                results.append(cls(item))
+                continue
+            
+            comment = new(cls)
+            comment.id = comment_id
+            comment.author = user.get("login", "")
+            comment.body = body
+            comment.created_at = created_at
+            comment.updated_at = updated_at
+            comment.url = url
+            results.append(comment)
+        return results
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return {
-            "id": self.id,
-            "author": self.author,
-            "body": self.body,
-            "created_at": self.created_at,
-            "updated_at": self.updated_at,
-            "url": self.url
-        }
+        return dict(zip(_COMMENT_KEYS, _COMMENT_VALUES(self)))
 
 
 class RepositoryMetadata:
     """Represents GitHub repository metadata."""
     
+    __slots__ = (
+        "name", "full_name", "description", "default_branch", "language", "license",
+        "stars", "forks", "open_issues", "clone_url", "ssh_url", "topics", "homepage",
+        "created_at", "updated_at",
+    )
+    
     def __init__(self, data: Dict[str, Any]):
         self.name = data.get("name", "")
         self.full_name = data.get("full_name", "")
@@ -129,20 +266,28 @@ class RepositoryMetadata:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return {
-            "name": self.name,
-            "full_name": self.full_name,
-            "description": self.description,
-            "default_branch": self.default_branch,
-            "language": self.language,
-            "license": self.license,
-            "stars": self.stars,
-            "forks": self.forks,
-            "open_issues": self.open_issues,
-            "clone_url": self.clone_url,
-            "ssh_url": self.ssh_url,
-            "topics": self.topics,
-            "homepage": self.homepage,
-            "created_at": self.created_at,
-            "updated_at": self.updated_at
-        }
+        return dict(zip(_REPOSITORY_KEYS, _REPOSITORY_VALUES(self)))
+
+
+class IssueBundle:
+    """Represents an issue fetched together with its comments and repository."""
+    
+    __slots__ = ("issue", "comments", "repository")
+    
+    def __init__(
+        self,
+        issue: IssueDetail,
+        comments: List[Comment],
+        repository: Optional[RepositoryMetadata] = None
+    ):
+        self.issue = issue
+        self.comments = comments
+        self.repository = repository
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        result = self.issue.to_dict()
+        result["comments"] = [comment.to_dict() for comment in self.comments]
+        if self.repository is not None:
+            result["repository"] = self.repository.to_dict()
+        return result
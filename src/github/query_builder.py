@@ -1,6 +1,24 @@
 """Build GitHub search queries from user parameters."""
 
-from typing import List, Optional
+import re
+from functools import lru_cache
+from typing import AbstractSet, Callable, List, Optional, Pattern, Tuple, Union
+
+from .models import IssueSearchResult
+
+
+_STATE_RE = re.compile(r"is:(open|closed)")
+_REPO_RE = re.compile(r"repo:(\S+)")
+_LANG_RE = re.compile(r"language:(\S+)")
+
+# Label filters for each supported difficulty level
+DIFFICULTY_QUALIFIERS = {
+    "good-first-issue": 'label:"good first issue"',
+    # Try common variations of easy labels
+    "easy": '(label:"good first issue" OR label:easy OR label:beginner)',
+    "medium": "(label:medium OR label:intermediate)",
+    "hard": "(label:hard OR label:advanced OR label:expert)",
+}
 
 
 def build_search_query(
@@ -29,6 +47,31 @@ def build_search_query(
     Returns:
         GitHub search query string
     """
+    # Lists aren't hashable; tuples let repeated queries hit the cache
+    return _build_search_query(
+        mode,
+        repo,
+        tuple(skills) if skills else None,
+        tuple(topics) if topics else None,
+        language,
+        difficulty,
+        tuple(labels) if labels else None,
+        state
+    )
+
+
+@lru_cache(maxsize=256)
+def _build_search_query(
+    mode: str,
+    repo: Optional[str],
+    skills: Optional[Tuple[str, ...]],
+    topics: Optional[Tuple[str, ...]],
+    language: Optional[str],
+    difficulty: Optional[str],
+    labels: Optional[Tuple[str, ...]],
+    state: str
+) -> str:
+    """Build (and memoize) a query string from hashable arguments."""
     query_parts = ["is:issue"]
     
     # Add state filter
@@ -40,38 +83,23 @@ def build_search_query(
         query_parts.append(f"repo:{repo}")
     
     # Add difficulty labels
-    if difficulty:
-        if difficulty == "good-first-issue":
-            query_parts.append('label:"good first issue"')
-        elif difficulty == "easy":
-            # Try common variations of easy labels
-            query_parts.append('(label:"good first issue" OR label:easy OR label:beginner)')
-        elif difficulty == "medium":
-            query_parts.append('(label:medium OR label:intermediate)')
-        elif difficulty == "hard":
-            query_parts.append('(label:hard OR label:advanced OR label:expert)')
+    difficulty_qualifier = DIFFICULTY_QUALIFIERS.get(difficulty)
+    if difficulty_qualifier:
+        query_parts.append(difficulty_qualifier)
     
     # Add custom labels
     if labels:
-        for label in labels:
-            query_parts.append(f'label:"{label}"')
+        query_parts.append(" ".join(f'label:"{label}"' for label in labels))
     
     # Add language filter
     if language:
         query_parts.append(f"language:{language}")
     
-    # Build keyword search from skills and topics
-    keywords = []
+    # Add skills and topics as general search terms
     if skills:
-        keywords.extend(skills)
+        query_parts.extend(skills)
     if topics:
-        keywords.extend(topics)
-    
-    # Add keywords as general search terms
-    if keywords:
-        # Join keywords with OR for broader matching
-        keyword_query = " ".join(keywords)
-        query_parts.append(keyword_query)
+        query_parts.extend(topics)
     
     return " ".join(query_parts)
 
@@ -91,21 +119,20 @@ def explain_query(query: str) -> List[str]:
     if "is:issue" in query:
         explanations.append("Searching for issues")
     
-    if "is:open" in query:
-        explanations.append("Only open issues")
-    elif "is:closed" in query:
-        explanations.append("Only closed issues")
+    state = _STATE_RE.search(query)
+    if state:
+        explanations.append(f"Only {state.group(1)} issues")
     
-    if "repo:" in query:
-        repo = query.split("repo:")[1].split()[0]
-        explanations.append(f"In repository: {repo}")
+    repo = _REPO_RE.search(query)
+    if repo:
+        explanations.append(f"In repository: {repo.group(1)}")
     
     if "good first issue" in query.lower():
         explanations.append("Good for beginners")
     
-    if "language:" in query:
-        lang = query.split("language:")[1].split()[0]
-        explanations.append(f"Primary language: {lang}")
+    lang = _LANG_RE.search(query)
+    if lang:
+        explanations.append(f"Primary language: {lang.group(1)}")
     
     if "label:" in query:
         explanations.append("Filtered by specific labels")
@@ -113,53 +140,124 @@ def explain_query(query: str) -> List[str]:
     return explanations
 
 
-def score_result(issue_data: dict, query_params: dict) -> List[str]:
+@lru_cache(maxsize=128)
+def _keyword_pattern(keywords: Tuple[str, ...]) -> Pattern[str]:
     """
-    Generate score reasons for why an issue matched the search.
+    Compile one pattern that finds every keyword in a single pass.
+    
+    Each match is wrapped in a lookahead so overlapping occurrences are
+    reported, and longer keywords are tried first so a keyword that is a
+    prefix of another can still be recovered from the longer hit.
     
     Args:
-        issue_data: GitHub issue data
-        query_params: Original search parameters
+        keywords: Lowercased keywords to match
         
     Returns:
-        List of match reasons
+        Compiled alternation pattern
     """
-    reasons = []
-    
-    labels = [label.get("name", "").lower() for label in issue_data.get("labels", [])]
+    ordered = sorted(set(keywords), key=len, reverse=True)
+    return re.compile("(?=(" + "|".join(map(re.escape, ordered)) + "))")
+
+
+def make_scorer(query_params: dict) -> Callable[..., List[str]]:
+    """
+    Prepare a scorer that explains matches for many issues of one search.
     
-    # Check difficulty match
-    difficulty = query_params.get("difficulty", "")
-    if difficulty == "good-first-issue" and "good first issue" in labels:
-        reasons.append("Label match: good first issue")
+    Everything that depends only on the query (lowercased labels and
+    keywords, the keyword pattern, the language note) is worked out here
+    once, so scoring each result only touches that result's own data.
     
-    # Check custom label matches
-    custom_labels = query_params.get("labels") or []
-    for label in custom_labels:
-        if label.lower() in labels:
-            reasons.append(f"Label match: {label}")
+    Args:
+        query_params: Original search parameters
+        
+    Returns:
+        Function taking (issue_data, label_set=None) with the same meaning
+        as score_result's arguments and returning its list of reasons
+    """
+    wants_good_first_issue = query_params.get("difficulty", "") == "good-first-issue"
+    custom_labels = [(label, label.lower()) for label in query_params.get("labels") or ()]
     
-    # Check skill/topic keyword matches
-    title = issue_data.get("title", "").lower()
-    body = issue_data.get("body", "").lower() if issue_data.get("body") else ""
+    # Lowercase each term once for both the pattern and the hit checks
+    skills = [(skill, skill.lower()) for skill in query_params.get("skills") or ()]
+    topics = [(topic, topic.lower()) for topic in query_params.get("topics") or ()]
+    pattern = None
+    if skills or topics:
+        pattern = _keyword_pattern(tuple(lower for _, lower in skills + topics))
     
-    skills = query_params.get("skills") or []
-    for skill in skills:
-        if skill.lower() in title or skill.lower() in body:
-            reasons.append(f"Keyword match: {skill}")
+    # This is harder to verify from issue data, but we can note it was requested
+    language_reason = None
+    if query_params.get("language"):
+        language_reason = f"Repository language filter: {query_params['language']}"
     
-    topics = query_params.get("topics") or []
-    for topic in topics:
-        if topic.lower() in title or topic.lower() in body:
-            reasons.append(f"Topic match: {topic}")
+    def score(
+        issue_data: Union[dict, IssueSearchResult],
+        label_set: Optional[AbstractSet[str]] = None
+    ) -> List[str]:
+        reasons = []
+        
+        if isinstance(issue_data, IssueSearchResult):
+            raw_title, raw_body = issue_data.title, issue_data.body
+            if label_set is None:
+                label_set = issue_data.label_set
+        else:
+            raw_title, raw_body = issue_data.get("title", ""), issue_data.get("body")
+            if label_set is None:
+                label_set = {label.get("name", "").lower() for label in issue_data.get("labels", [])}
+        
+        # Check difficulty match
+        if wants_good_first_issue and "good first issue" in label_set:
+            reasons.append("Label match: good first issue")
+        
+        # Check custom label matches
+        for label, label_lower in custom_labels:
+            if label_lower in label_set:
+                reasons.append(f"Label match: {label}")
+        
+        # Check skill/topic keyword matches
+        if pattern is not None:
+            # Scan title and body separately so no match spans the two
+            hits = set(pattern.findall(raw_title.lower()))
+            hits.update(pattern.findall(raw_body.lower() if raw_body else ""))
+            
+            for skill, skill_lower in skills:
+                if any(skill_lower in hit for hit in hits):
+                    reasons.append(f"Keyword match: {skill}")
+            
+            for topic, topic_lower in topics:
+                if any(topic_lower in hit for hit in hits):
+                    reasons.append(f"Topic match: {topic}")
+        
+        if language_reason:
+            reasons.append(language_reason)
+        
+        # If no specific reasons, add general match
+        if not reasons:
+            reasons.append("General search match")
+        
+        return reasons
     
-    # Check language match
-    if query_params.get("language"):
-        # This is harder to verify from issue data, but we can note it was requested
-        reasons.append(f"Repository language filter: {query_params['language']}")
+    return score
+
+
+def score_result(
+    issue_data: Union[dict, IssueSearchResult],
+    query_params: dict,
+    label_set: Optional[AbstractSet[str]] = None
+) -> List[str]:
+    """
+    Generate score reasons for why an issue matched the search.
     
-    # If no specific reasons, add general match
-    if not reasons:
-        reasons.append("General search match")
+    For scoring many results of the same search, build the scorer once
+    with make_scorer() instead.
     
-    return reasons
\ No newline at end of file
+    Args:
+        issue_data: GitHub issue data, or a search result model whose
+            cached label_set is used directly
+        query_params: Original search parameters
+        label_set: Lowercased label names, if already known; otherwise
+            read from issue_data
+        
+    Returns:
+        List of match reasons
+    """
+    return make_scorer(query_params)(issue_data, label_set)
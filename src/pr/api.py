@@ -3,10 +3,23 @@
 import os
 from typing import Dict, Any, Optional
 
-from ..github.client import GitHubClient
+from ..github.client import get_default_client
 from ..config import GITHUB_TOKEN, ErrorCode
 from ..utils.errors import error_response, success_response
 from ..utils.redact import redact_token
+from ..utils.validation import is_valid_repo
+
+
+def _invalid_repo_response(repo: Optional[str]) -> Dict[str, Any]:
+    """Build the error response for a malformed repository name."""
+    return error_response(
+        ErrorCode.INVALID_INPUT,
+        "Invalid repository format",
+        {
+            "expected": "owner/repo",
+            "received": repo
+        }
+    )
 
 
 async def create_pull_request_automated(
@@ -47,7 +60,7 @@ async def create_pull_request_automated(
         )
     
     # Validate inputs
-    if not all([repo, head, base, title]):
+    if not (repo and head and base and title):
         return error_response(
             ErrorCode.INVALID_INPUT,
             "Missing required parameters",
@@ -57,8 +70,11 @@ async def create_pull_request_automated(
             }
         )
     
+    if not is_valid_repo(repo):
+        return _invalid_repo_response(repo)
+    
     try:
-        client = GitHubClient()
+        client = get_default_client()
         result = await client.create_pull_request(
             token=auth_token,
             repo=repo,
@@ -113,18 +129,11 @@ async def fork_repository_automated(
         )
     
     # Validate input
-    if not repo or "/" not in repo:
-        return error_response(
-            ErrorCode.INVALID_INPUT,
-            "Invalid repository format",
-            {
-                "expected": "owner/repo",
-                "received": repo
-            }
-        )
+    if not is_valid_repo(repo):
+        return _invalid_repo_response(repo)
     
     try:
-        client = GitHubClient()
+        client = get_default_client()
         result = await client.fork_repository(
             token=auth_token,
             repo=repo
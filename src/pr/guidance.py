@@ -5,6 +5,107 @@ from typing import Dict, Any
 from ..git_ops.clone import get_git_status
 
 
+_RUN_TESTS_SECTION = """### 3. Run tests (recommended)
+
+Before creating a PR, make sure tests pass:
+```bash
+# For Python projects:
+pytest
+
+# For Node.js projects:
+npm test
+
+# For other projects, check README or CONTRIBUTING.md
+```
+
+"""
+
+_CONTRIBUTION_GUIDELINES_SECTION = """## ⚠️ IMPORTANT: Review Contribution Guidelines
+
+**Before creating your PR, check the repository's contribution guidelines:**
+
+1. Look for these files in the repository:
+   - **CONTRIBUTING.md** - Contribution process and standards
+   - **CODE_OF_CONDUCT.md** - Community standards and behavior
+   - **DEVELOPMENT.md** - Setup and development instructions
+   - **.github/CONTRIBUTING.md** - GitHub-specific contribution guide
+
+2. These files explain:
+   - How to format code and commit messages
+   - Testing requirements
+   - Documentation standards
+   - PR review process
+   - Code of conduct expectations
+
+3. Follow the guidelines exactly - reviewers will check for compliance
+
+## Additional Tips
+
+- **Link to the issue**: Mention 'Fixes #123' or 'Closes #123' in your PR description
+- **Keep PRs focused**: One PR should address one issue or feature
+- **Write clear commit messages**: Use present tense, be descriptive
+- **Update documentation**: If you changed functionality, update relevant docs
+- **Use the contribution guide**: Reference CONTRIBUTING.md for specific requirements
+
+"""
+
+_QUICK_PR_GUIDE_HEADER = """# Quick PR Creation Guide
+
+## Essential Commands
+
+```bash
+# 1. Ensure you're on your feature branch
+"""
+
+_FORK_WORKFLOW_GUIDE = """# Fork Workflow Guide
+
+When contributing to repositories you don't have write access to,
+you typically use the fork workflow:
+
+## One-Time Setup
+
+```bash
+# 1. Fork the repository on GitHub (use the Fork button)
+
+# 2. Clone YOUR fork
+git clone https://github.com/YOUR-USERNAME/REPO-NAME.git
+cd REPO-NAME
+
+# 3. Add the original repository as 'upstream'
+git remote add upstream https://github.com/ORIGINAL-OWNER/REPO-NAME.git
+
+# 4. Verify remotes
+git remote -v
+# Should show:
+# origin    -> your fork
+# upstream  -> original repo
+```
+
+## For Each Contribution
+
+```bash
+# 1. Sync with upstream
+git checkout main
+git fetch upstream
+git merge upstream/main
+
+# 2. Create a feature branch
+git checkout -b feature/my-contribution
+
+# 3. Make your changes and commit
+git add .
+git commit -m "Description"
+
+# 4. Push to YOUR fork
+git push -u origin feature/my-contribution
+
+# 5. Create PR on GitHub
+# - Base: original-repo/main
+# - Head: your-fork/feature/my-contribution
+```
+"""
+
+
 async def generate_pr_checklist(
     local_repo_path: str,
     base_branch: str = "main",
@@ -27,189 +128,124 @@ async def generate_pr_checklist(
     Returns:
         Formatted checklist as a string
     """
-    checklist = []
-    
-    # Header
-    checklist.append("# Pull Request Creation Guide")
-    checklist.append("")
-    checklist.append(f"Repository: {local_repo_path}")
-    checklist.append(f"Base branch: {base_branch}")
-    checklist.append(f"Your branch: {head_branch}")
-    checklist.append("")
-    
     # Get git status (now async)
     git_status = await get_git_status(local_repo_path)
     
     if git_status.get("error"):
-        checklist.append(f"⚠️  Warning: {git_status['error']}")
-        checklist.append("")
+        status_section = f"⚠️  Warning: {git_status['error']}\n\n"
     else:
-        checklist.append(f"Current branch: {git_status.get('current_branch', 'unknown')}")
-        if git_status.get("has_uncommitted_changes"):
-            checklist.append("⚠️  You have uncommitted changes")
-        else:
-            checklist.append("✓ Working tree is clean")
-        checklist.append("")
-    
-    # Step-by-step instructions
-    checklist.append("## Step-by-Step Instructions")
-    checklist.append("")
-    
-    # Step 1: Verify branch
-    checklist.append("### 1. Verify you're on the correct branch")
-    checklist.append("```bash")
-    checklist.append(f"cd {local_repo_path}")
-    checklist.append("git branch --show-current")
-    checklist.append("```")
-    checklist.append(f"Expected output: `{head_branch}`")
-    checklist.append("")
+        tree_state = (
+            "⚠️  You have uncommitted changes"
+            if git_status.get("has_uncommitted_changes")
+            else "✓ Working tree is clean"
+        )
+        status_section = f"Current branch: {git_status.get('current_branch', 'unknown')}\n{tree_state}\n\n"
     
+    branch_warning = ""
     if git_status.get("current_branch") != head_branch:
-        checklist.append("⚠️  You're not on the expected branch! Switch with:")
-        checklist.append("```bash")
-        checklist.append(f"git checkout {head_branch}")
-        checklist.append("```")
-        checklist.append("")
+        branch_warning = f"""⚠️  You're not on the expected branch! Switch with:
+```bash
+git checkout {head_branch}
+```
+
+"""
     
-    # Step 2: Ensure all changes are committed
-    checklist.append("### 2. Ensure all changes are committed")
-    checklist.append("```bash")
-    checklist.append("git status")
-    checklist.append("```")
-    checklist.append("")
+    commit_warning = ""
     if git_status.get("has_uncommitted_changes"):
-        checklist.append("⚠️  You have uncommitted changes. Commit them:")
-        checklist.append("```bash")
-        checklist.append("git add .")
-        checklist.append('git commit -m "Your commit message"')
-        checklist.append("```")
-        checklist.append("")
-    
-    # Step 3: Run tests (if applicable)
-    checklist.append("### 3. Run tests (recommended)")
-    checklist.append("")
-    checklist.append("Before creating a PR, make sure tests pass:")
-    checklist.append("```bash")
-    checklist.append("# For Python projects:")
-    checklist.append("pytest")
-    checklist.append("")
-    checklist.append("# For Node.js projects:")
-    checklist.append("npm test")
-    checklist.append("")
-    checklist.append("# For other projects, check README or CONTRIBUTING.md")
-    checklist.append("```")
-    checklist.append("")
-    
-    # Step 4: Push your branch
-    checklist.append("### 4. Push your branch to GitHub")
-    checklist.append("")
-    if fork_flow:
-        checklist.append("Since you're working with a fork:")
-        checklist.append("```bash")
-        checklist.append(f"git push origin {head_branch}")
-        checklist.append("```")
-        checklist.append("")
-        checklist.append("If this is your first push of this branch:")
-        checklist.append("```bash")
-        checklist.append(f"git push -u origin {head_branch}")
-        checklist.append("```")
-    else:
-        checklist.append("```bash")
-        checklist.append(f"git push origin {head_branch}")
-        checklist.append("```")
-    checklist.append("")
-    
-    # Step 5: Create the pull request
-    checklist.append("### 5. Create the Pull Request")
-    checklist.append("")
-    checklist.append("You have two options:")
-    checklist.append("")
-    
-    # Option A: Web interface
-    checklist.append("**Option A: Via GitHub Web Interface**")
-    checklist.append("")
-    checklist.append("1. Go to the repository on GitHub")
-    checklist.append("2. Click on 'Pull requests' tab")
-    checklist.append("3. Click 'New pull request'")
-    if fork_flow:
-        checklist.append("4. Set base repository and branch")
-        checklist.append(f"5. Set your fork and branch: {head_branch}")
-    else:
-        checklist.append(f"4. Select base: {base_branch}")
-        checklist.append(f"5. Select compare: {head_branch}")
-    checklist.append("6. Click 'Create pull request'")
-    checklist.append(f"7. Title: {pr_title}")
-    if pr_body:
-        checklist.append(f"8. Description: {pr_body}")
-    checklist.append("")
+        commit_warning = """⚠️  You have uncommitted changes. Commit them:
+```bash
+git add .
+git commit -m "Your commit message"
+```
+
+"""
     
-    # Option B: GitHub CLI
-    checklist.append("**Option B: Via GitHub CLI (gh)**")
-    checklist.append("")
-    checklist.append("If you have GitHub CLI installed:")
-    checklist.append("```bash")
     if fork_flow:
-        checklist.append(f'gh pr create --base {base_branch} --head {head_branch} --title "{pr_title}" --body "{pr_body}"')
+        push_section = f"""Since you're working with a fork:
+```bash
+git push origin {head_branch}
+```
+
+If this is your first push of this branch:
+```bash
+git push -u origin {head_branch}
+```"""
+        branch_steps = f"4. Set base repository and branch\n5. Set your fork and branch: {head_branch}"
+        gh_command = f'gh pr create --base {base_branch} --head {head_branch} --title "{pr_title}" --body "{pr_body}"'
     else:
-        checklist.append(f'gh pr create --base {base_branch} --title "{pr_title}" --body "{pr_body}"')
-    checklist.append("```")
-    checklist.append("")
-    
-    # Important: Review contribution guidelines
-    checklist.append("## ⚠️ IMPORTANT: Review Contribution Guidelines")
-    checklist.append("")
-    checklist.append("**Before creating your PR, check the repository's contribution guidelines:**")
-    checklist.append("")
-    checklist.append("1. Look for these files in the repository:")
-    checklist.append("   - **CONTRIBUTING.md** - Contribution process and standards")
-    checklist.append("   - **CODE_OF_CONDUCT.md** - Community standards and behavior")
-    checklist.append("   - **DEVELOPMENT.md** - Setup and development instructions")
-    checklist.append("   - **.github/CONTRIBUTING.md** - GitHub-specific contribution guide")
-    checklist.append("")
-    checklist.append("2. These files explain:")
-    checklist.append("   - How to format code and commit messages")
-    checklist.append("   - Testing requirements")
-    checklist.append("   - Documentation standards")
-    checklist.append("   - PR review process")
-    checklist.append("   - Code of conduct expectations")
-    checklist.append("")
-    checklist.append("3. Follow the guidelines exactly - reviewers will check for compliance")
-    checklist.append("")
-    
-    # Additional tips
-    checklist.append("## Additional Tips")
-    checklist.append("")
-    checklist.append("- **Link to the issue**: Mention 'Fixes #123' or 'Closes #123' in your PR description")
-    checklist.append("- **Keep PRs focused**: One PR should address one issue or feature")
-    checklist.append("- **Write clear commit messages**: Use present tense, be descriptive")
-    checklist.append("- **Update documentation**: If you changed functionality, update relevant docs")
-    checklist.append("- **Use the contribution guide**: Reference CONTRIBUTING.md for specific requirements")
-    checklist.append("")
+        push_section = f"""```bash
+git push origin {head_branch}
+```"""
+        branch_steps = f"4. Select base: {base_branch}\n5. Select compare: {head_branch}"
+        gh_command = f'gh pr create --base {base_branch} --title "{pr_title}" --body "{pr_body}"'
     
-    # Troubleshooting
-    checklist.append("## Troubleshooting")
-    checklist.append("")
-    checklist.append("**If push is rejected:**")
-    checklist.append("```bash")
-    checklist.append("# Pull latest changes from upstream")
-    checklist.append(f"git pull origin {base_branch}")
-    checklist.append("# Resolve conflicts if any")
-    checklist.append("# Push again")
-    checklist.append(f"git push origin {head_branch}")
-    checklist.append("```")
-    checklist.append("")
-    checklist.append("**If you need to update your fork:**")
-    checklist.append("```bash")
-    checklist.append("# Add upstream remote (if not already added)")
-    checklist.append("git remote add upstream <original-repo-url>")
-    checklist.append("# Fetch upstream changes")
-    checklist.append("git fetch upstream")
-    checklist.append("# Merge or rebase")
-    checklist.append(f"git merge upstream/{base_branch}")
-    checklist.append("```")
-    checklist.append("")
+    description_step = f"8. Description: {pr_body}\n" if pr_body else ""
     
-    return "\n".join(checklist)
+    return f"""# Pull Request Creation Guide
+
+Repository: {local_repo_path}
+Base branch: {base_branch}
+Your branch: {head_branch}
+
+{status_section}## Step-by-Step Instructions
+
+### 1. Verify you're on the correct branch
+```bash
+cd {local_repo_path}
+git branch --show-current
+```
+Expected output: `{head_branch}`
+
+{branch_warning}### 2. Ensure all changes are committed
+```bash
+git status
+```
+
+{commit_warning}{_RUN_TESTS_SECTION}### 4. Push your branch to GitHub
+
+{push_section}
+
+### 5. Create the Pull Request
+
+You have two options:
+
+**Option A: Via GitHub Web Interface**
+
+1. Go to the repository on GitHub
+2. Click on 'Pull requests' tab
+3. Click 'New pull request'
+{branch_steps}
+6. Click 'Create pull request'
+7. Title: {pr_title}
+{description_step}
+**Option B: Via GitHub CLI (gh)**
+
+If you have GitHub CLI installed:
+```bash
+{gh_command}
+```
+
+{_CONTRIBUTION_GUIDELINES_SECTION}## Troubleshooting
+
+**If push is rejected:**
+```bash
+# Pull latest changes from upstream
+git pull origin {base_branch}
+# Resolve conflicts if any
+# Push again
+git push origin {head_branch}
+```
+
+**If you need to update your fork:**
+```bash
+# Add upstream remote (if not already added)
+git remote add upstream <original-repo-url>
+# Fetch upstream changes
+git fetch upstream
+# Merge or rebase
+git merge upstream/{base_branch}
+```
+"""
 
 
 def generate_quick_pr_guide(
@@ -228,39 +264,31 @@ def generate_quick_pr_guide(
     Returns:
         Quick reference guide
     """
-    guide = []
-    
-    guide.append("# Quick PR Creation Guide")
-    guide.append("")
-    guide.append("## Essential Commands")
-    guide.append("")
-    guide.append("```bash")
-    guide.append("# 1. Ensure you're on your feature branch")
-    guide.append(f"git checkout {head_branch}")
-    guide.append("")
-    guide.append("# 2. Commit all changes")
-    guide.append("git add .")
-    guide.append('git commit -m "Description of changes"')
-    guide.append("")
-    guide.append("# 3. Push to GitHub")
-    guide.append(f"git push -u origin {head_branch}")
-    guide.append("")
-    guide.append("# 4. Create PR via GitHub CLI (if installed)")
     issue_ref = f' --body "Fixes #{issue_number}"' if issue_number else ""
-    guide.append(f'gh pr create --base {base_branch} --title "Your PR title"{issue_ref}')
-    guide.append("```")
-    guide.append("")
-    guide.append("Or visit GitHub to create the PR via web interface.")
-    guide.append("")
-    
+    issue_section = ""
     if issue_number:
-        guide.append(f"## Link to Issue #{issue_number}")
-        guide.append("")
-        guide.append(f"Include this in your PR description: `Fixes #{issue_number}` or `Closes #{issue_number}`")
-        guide.append("This will automatically close the issue when your PR is merged.")
-        guide.append("")
+        issue_section = f"""
+## Link to Issue #{issue_number}
+
+Include this in your PR description: `Fixes #{issue_number}` or `Closes #{issue_number}`
+This will automatically close the issue when your PR is merged.
+"""
     
-    return "\n".join(guide)
+    return f"""{_QUICK_PR_GUIDE_HEADER}git checkout {head_branch}
+
+# 2. Commit all changes
+git add .
+git commit -m "Description of changes"
+
+# 3. Push to GitHub
+git push -u origin {head_branch}
+
+# 4. Create PR via GitHub CLI (if installed)
+gh pr create --base {base_branch} --title "Your PR title"{issue_ref}
+```
+
+Or visit GitHub to create the PR via web interface.
+{issue_section}"""
 
 
 def generate_fork_workflow_guide() -> str:
@@ -270,54 +298,4 @@ def generate_fork_workflow_guide() -> str:
     Returns:
         Fork workflow guide
     """
-    guide = []
-    
-    guide.append("# Fork Workflow Guide")
-    guide.append("")
-    guide.append("When contributing to repositories you don't have write access to,")
-    guide.append("you typically use the fork workflow:")
-    guide.append("")
-    guide.append("## One-Time Setup")
-    guide.append("")
-    guide.append("```bash")
-    guide.append("# 1. Fork the repository on GitHub (use the Fork button)")
-    guide.append("")
-    guide.append("# 2. Clone YOUR fork")
-    guide.append("git clone https://github.com/YOUR-USERNAME/REPO-NAME.git")
-    guide.append("cd REPO-NAME")
-    guide.append("")
-    guide.append("# 3. Add the original repository as 'upstream'")
-    guide.append("git remote add upstream https://github.com/ORIGINAL-OWNER/REPO-NAME.git")
-    guide.append("")
-    guide.append("# 4. Verify remotes")
-    guide.append("git remote -v")
-    guide.append("# Should show:")
-    guide.append("# origin    -> your fork")
-    guide.append("# upstream  -> original repo")
-    guide.append("```")
-    guide.append("")
-    guide.append("## For Each Contribution")
-    guide.append("")
-    guide.append("```bash")
-    guide.append("# 1. Sync with upstream")
-    guide.append("git checkout main")
-    guide.append("git fetch upstream")
-    guide.append("git merge upstream/main")
-    guide.append("")
-    guide.append("# 2. Create a feature branch")
-    guide.append("git checkout -b feature/my-contribution")
-    guide.append("")
-    guide.append("# 3. Make your changes and commit")
-    guide.append("git add .")
-    guide.append('git commit -m "Description"')
-    guide.append("")
-    guide.append("# 4. Push to YOUR fork")
-    guide.append("git push -u origin feature/my-contribution")
-    guide.append("")
-    guide.append("# 5. Create PR on GitHub")
-    guide.append("# - Base: original-repo/main")
-    guide.append("# - Head: your-fork/feature/my-contribution")
-    guide.append("```")
-    guide.append("")
-    
-    return "\n".join(guide)
+    return _FORK_WORKFLOW_GUIDE
@@ -7,12 +7,19 @@ This version uses simple parameters instead of Pydantic models for better
 compatibility with AI clients like Cursor.
 """
 
-import json
+import asyncio
+import functools
 import logging
 import os
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Optional, List
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, List, Set
+
+try:
+    import uvloop  # Optional: faster event loop on Linux/macOS (not available on Windows)
+except ImportError:
+    uvloop = None
 
 # Add parent directory to Python path to support running directly
 # This allows: python src/server.py from the project root
@@ -27,25 +34,38 @@ from src.config import (
     DEFAULT_SEARCH_LIMIT,
     MAX_SEARCH_LIMIT,
     DEFAULT_MAX_COMMENTS,
+    MAX_BATCH_ISSUES,
+    PREFETCH_TOP_K,
+    PREFETCH_CONCURRENCY,
     DEFAULT_CLONE_METHOD,
-    GITHUB_TOKEN,
-    get_github_headers
+    GITHUB_TOKEN
 )
 from src.utils.logging_config import setup_logging, get_logger
-from src.github.client import GitHubClient
-from src.github.query_builder import build_search_query, score_result
+from src.github.client import get_default_client, close_http_client
+from src.github.query_builder import build_search_query, make_scorer
 from src.git_ops.fs_validate import validate_folder_for_clone
-from src.git_ops.clone import clone_repository
+from src.git_ops.clone import clone_repository, close_git_sessions
 from src.pr.guidance import generate_pr_checklist
 from src.pr.api import create_pull_request_automated, fork_repository_automated
-from src.utils.errors import MCPError, RateLimitError, GitHubApiError, success_response, format_success_json, format_error_json
+from src.utils.errors import MCPError, RateLimitError, GitHubApiError, success_response, error_response, format_json_response, format_success_json, format_error_json
+from src.utils.validation import is_valid_repo
 
 # Setup logging before initializing MCP server
 setup_logging(log_level=logging.INFO)
 logger = get_logger(__name__)
 
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Release pooled GitHub API connections and git helper processes on shutdown."""
+    try:
+        yield
+    finally:
+        await close_http_client()
+        await close_git_sessions()
+
+
 # Initialize MCP server
-mcp = FastMCP("github_issue_shepherd")
+mcp = FastMCP("github_issue_shepherd", lifespan=lifespan)
 
 logger.info("GitHub Issue Shepherd MCP Server initialized")
 if GITHUB_TOKEN:
@@ -54,6 +74,71 @@ else:
     logger.warning("No GITHUB_TOKEN set - using unauthenticated API (60 req/hour limit)")
 
 
+REPO_FORMAT_HINT = "Example: 'facebook/react' or 'torvalds/linux'"
+
+
+def validate_repo(hint: str = REPO_FORMAT_HINT) -> Callable[[Callable[..., Awaitable[str]]], Callable[..., Awaitable[str]]]:
+    """
+    Reject tool calls whose repo argument isn't in 'owner/repo' format.
+    
+    The check runs before the wrapped tool, which must take repo as its
+    first parameter. The wrapper keeps the tool's signature, so FastMCP
+    still builds the same input schema.
+    
+    Args:
+        hint: Resolution hint included in the error response
+        
+    Returns:
+        Decorator for async tool handlers
+    """
+    def decorator(func: Callable[..., Awaitable[str]]) -> Callable[..., Awaitable[str]]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> str:
+            repo = kwargs["repo"] if "repo" in kwargs else (args[0] if args else None)
+            if not is_valid_repo(repo):
+                logger.warning("Invalid repo format: %s", repo)
+                return format_error_json(
+                    code="INVALID_INPUT",
+                    message="repo must be in 'owner/repo' format",
+                    hint=hint
+                )
+            return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# Strong references to running prefetch tasks so they aren't garbage collected
+_prefetch_tasks: Set[asyncio.Task] = set()
+
+
+async def _prefetch_issues(issues: List[Any]) -> None:
+    """
+    Warm the response cache with issue details and repository metadata.
+    
+    Runs in the background after a search, so the follow-up
+    get_issue_details and list_repo_metadata calls are served from memory.
+    Failures are only logged; the caller has already returned.
+    
+    Args:
+        issues: Search results to fetch details for
+    """
+    client = get_default_client()
+    semaphore = asyncio.Semaphore(PREFETCH_CONCURRENCY)
+    
+    async def warm(fetch: Awaitable[Any]) -> None:
+        async with semaphore:
+            try:
+                await fetch
+            except Exception as e:
+                logger.debug("Prefetch failed: %s", e)
+    
+    repos = dict.fromkeys(issue.repo for issue in issues)
+    await asyncio.gather(
+        *(warm(client.get_issue(issue.repo, issue.number)) for issue in issues),
+        *(warm(client.get_repository(repo)) for repo in repos)
+    )
+
+
 # ============================================================================
 # MCP Tools - Simplified with Regular Parameters
 # ============================================================================
@@ -111,35 +196,15 @@ async def discover_repository(
         
         query = " ".join(query_parts)
         
-        logger.info(f"discover_repository called: language={language}, topics={topics}")
-        logger.debug(f"Discovery query: {query}")
+        logger.info("discover_repository called: language=%s, topics=%s", language, topics)
+        logger.debug("Discovery query: %s", query)
         
         # Search for popular repositories
-        client = GitHubClient()
-        
-        # Use a custom search to get repos instead of issues
-        url = f"{client.base_url}/search/repositories"
-        params = {
-            "q": query,
-            "sort": sort_param,
-            "order": "desc",
-            "per_page": min(limit, 30)
-        }
-        
-        logger.debug(f"Fetching popular repositories with sort={sort_param}")
-        
-        import httpx
-        async with httpx.AsyncClient(timeout=client.timeout) as http_client:
-            response = await http_client.get(
-                url,
-                params=params,
-                headers=get_github_headers()
-            )
-            response.raise_for_status()
-            data = response.json()
+        logger.debug("Fetching popular repositories with sort=%s", sort_param)
+        items = await get_default_client().search_repositories(query, sort_param, min(limit, 30))
         
         repos = []
-        for item in data.get("items", [])[:limit]:
+        for item in items[:limit]:
             repos.append({
                 "name": item.get("full_name", ""),
                 "url": item.get("html_url", ""),
@@ -151,9 +216,9 @@ async def discover_repository(
                 "open_issues": item.get("open_issues_count", 0)
             })
         
-        logger.info(f"Found {len(repos)} popular repositories matching criteria")
+        logger.info("Found %s popular repositories matching criteria", len(repos))
         
-        return json.dumps({
+        return format_json_response({
             "ok": True,
             "data": {
                 "repositories": repos,
@@ -165,18 +230,15 @@ async def discover_repository(
                     "note": "These repositories have 1000+ stars, indicating 100+ contributors and active maintenance"
                 }
             }
-        }, indent=2)
+        })
         
     except Exception as e:
-        logger.error(f"Error discovering repositories: {e}", exc_info=True)
-        return json.dumps({
-            "ok": False,
-            "error": {
-                "code": "DISCOVERY_ERROR",
-                "message": f"Failed to discover repositories: {str(e)}",
-                "details": {}
-            }
-        }, indent=2)
+        logger.error("Error discovering repositories: %s", e, exc_info=True)
+        return format_error_json(
+            code="DISCOVERY_ERROR",
+            message=f"Failed to discover repositories: {e}",
+            context={"error": str(e)}
+        )
 
 @mcp.tool(
     name="search_issues",
@@ -188,6 +250,7 @@ async def discover_repository(
         "openWorldHint": True
     }
 )
+@validate_repo(hint=f"{REPO_FORMAT_HINT}. Use discover_repository to find repos.")
 async def search_issues(
     repo: str,
     skills: Optional[List[str]] = None,
@@ -197,7 +260,8 @@ async def search_issues(
     labels: Optional[List[str]] = None,
     state: str = "open",
     sort: str = "relevance",
-    limit: int = DEFAULT_SEARCH_LIMIT
+    limit: int = DEFAULT_SEARCH_LIMIT,
+    prefetch: bool = False
 ) -> str:
     """Search for GitHub issues in a specific repository.
     
@@ -218,21 +282,14 @@ async def search_issues(
         state: 'open', 'closed', or 'all'
         sort: 'relevance', 'created', 'updated', 'comments'
         limit: Maximum results (1-30)
+        prefetch: Fetch details of the top results in the background so
+            follow-up get_issue_details calls are answered from cache
     
     Returns:
         JSON string containing search results
     """
     try:
-        logger.info(f"search_issues called: repo={repo}")
-        
-        # Validate repo format
-        if not repo or '/' not in repo:
-            logger.warning(f"Invalid repo format: {repo}")
-            return format_error_json(
-                code="INVALID_INPUT",
-                message="repo must be in 'owner/repo' format",
-                hint="Example: 'facebook/react' or 'torvalds/linux'. Use discover_repository to find repos."
-            )
+        logger.info("search_issues called: repo=%s", repo)
         
         # Clamp limit
         limit = max(1, min(limit, MAX_SEARCH_LIMIT))
@@ -249,17 +306,17 @@ async def search_issues(
             state=state
         )
         
-        logger.debug(f"Search query: {query}")
+        logger.debug("Search query: %s", query)
         
         # Execute search
-        client = GitHubClient()
+        client = get_default_client()
         issues = await client.search_issues(
             query=query,
             sort=sort,
             limit=limit
         )
         
-        logger.info(f"Search completed: found {len(issues)} issues")
+        logger.info("Search completed: found %s issues", len(issues))
         
         # Format results with score reasons
         query_params = {
@@ -272,13 +329,11 @@ async def search_issues(
             "state": state
         }
         
+        score = make_scorer(query_params)
         results = []
         for issue in issues:
             issue_dict = issue.to_dict()
-            issue_dict["score_reason"] = score_result(
-                {"title": issue.title, "body": issue.body, "labels": [{"name": l} for l in issue.labels]},
-                query_params
-            )
+            issue_dict["score_reason"] = score(issue)
             results.append(issue_dict)
         
         response = success_response({
@@ -287,24 +342,26 @@ async def search_issues(
             "total_found": len(results)
         })
         
+        if prefetch and issues:
+            task = asyncio.create_task(_prefetch_issues(issues[:PREFETCH_TOP_K]))
+            _prefetch_tasks.add(task)
+            task.add_done_callback(_prefetch_tasks.discard)
+        
         return format_success_json(response["data"])
         
     except RateLimitError as e:
-        logger.error(f"Rate limit exceeded: {e}")
+        logger.error("Rate limit exceeded: %s", e)
         return e.to_json()
     except MCPError as e:
-        logger.error(f"MCP error in search_issues: {e}")
+        logger.error("MCP error in search_issues: %s", e)
         return e.to_json()
     except Exception as e:
-        logger.error(f"Unexpected error in search_issues: {e}", exc_info=True)
-        return json.dumps({
-            "ok": False,
-            "error": {
-                "code": "UNEXPECTED_ERROR",
-                "message": f"Unexpected error during search: {str(e)}",
-                "details": {}
-            }
-        }, indent=2)
+        logger.error("Unexpected error in search_issues: %s", e, exc_info=True)
+        return format_error_json(
+            code="UNEXPECTED_ERROR",
+            message=f"Unexpected error during search: {e}",
+            context={"error": str(e)}
+        )
 
 
 @mcp.tool(
@@ -317,6 +374,7 @@ async def search_issues(
         "openWorldHint": True
     }
 )
+@validate_repo()
 async def get_issue_details(
     repo: str,
     number: int,
@@ -338,55 +396,134 @@ async def get_issue_details(
         JSON string with issue details
     """
     try:
-        logger.info(f"get_issue_details called: repo={repo}, number={number}, include_comments={include_comments}")
-        
-        # Validate repo format
-        if '/' not in repo:
-            logger.warning(f"Invalid repo format: {repo}")
-            return format_error_json(
-                code="INVALID_INPUT",
-                message="repo must be in 'owner/repo' format",
-                hint="Example: 'facebook/react' or 'torvalds/linux'"
-            )
+        logger.info("get_issue_details called: repo=%s, number=%s, include_comments=%s", repo, number, include_comments)
         
         # Validate number
         if number <= 0:
-            logger.warning(f"Invalid issue number: {number}")
+            logger.warning("Invalid issue number: %s", number)
             return format_error_json(
                 code="INVALID_INPUT",
                 message="number must be greater than 0",
                 hint="Issue number must be a positive integer"
             )
         
-        client = GitHubClient()
+        client = get_default_client()
         
-        # Get issue details
-        logger.debug(f"Fetching issue {repo}#{number}")
-        issue = await client.get_issue(repo, number)
-        result = issue.to_dict()
-        
-        # Get comments if requested
         if include_comments and max_comments > 0:
-            logger.debug(f"Fetching {max_comments} comments for {repo}#{number}")
-            comments = await client.get_issue_comments(
-                repo,
-                number,
-                max_comments
-            )
-            result["comments"] = [c.to_dict() for c in comments]
-            logger.info(f"Fetched {len(comments)} comments for {repo}#{number}")
+            # Fetch the issue and its comments concurrently
+            logger.debug("Fetching issue %s#%s with %s comments", repo, number, max_comments)
+            bundle = await client.get_issue_bundle(repo, number, max_comments)
+            result = bundle.to_dict()
+            logger.info("Fetched %s comments for %s#%s", len(bundle.comments), repo, number)
+        else:
+            logger.debug("Fetching issue %s#%s", repo, number)
+            issue = await client.get_issue(repo, number)
+            result = issue.to_dict()
         
-        logger.info(f"Successfully retrieved issue details for {repo}#{number}")
+        logger.info("Successfully retrieved issue details for %s#%s", repo, number)
         return format_success_json(result)
         
     except RateLimitError as e:
-        logger.error(f"Rate limit exceeded while fetching {repo}#{number}: {e}")
+        logger.error("Rate limit exceeded while fetching %s#%s: %s", repo, number, e)
         return e.to_json()
     except MCPError as e:
-        logger.error(f"MCP error in get_issue_details: {e}")
+        logger.error("MCP error in get_issue_details: %s", e)
         return e.to_json()
     except Exception as e:
-        logger.error(f"Unexpected error fetching issue {repo}#{number}: {e}", exc_info=True)
+        logger.error("Unexpected error fetching issue %s#%s: %s", repo, number, e, exc_info=True)
+        return format_error_json(
+            code="UNEXPECTED_ERROR",
+            message="Failed to fetch issue details",
+            context={"error": str(e)}
+        )
+
+
+@mcp.tool(
+    name="get_issues_batch",
+    annotations={
+        "title": "Get Multiple Issue Details",
+        "readOnlyHint": True,
+        "destructiveHint": False,
+        "idempotentHint": True,
+        "openWorldHint": True
+    }
+)
+async def get_issues_batch(items: List[Dict[str, Any]]) -> str:
+    """Get details for several GitHub issues in one call.
+    
+    Fetches the issues concurrently instead of one tool call per issue.
+    Repeated issues are fetched once. Each entry succeeds or fails on its
+    own, so one missing issue doesn't fail the whole batch.
+    
+    Args:
+        items: Issues to fetch, each {"repo": "owner/repo", "number": 123}
+            (at most 20)
+    
+    Returns:
+        JSON string with one result per item, in input order
+    """
+    try:
+        logger.info("get_issues_batch called: %s items", len(items))
+        
+        if not items:
+            return format_error_json(
+                code="INVALID_INPUT",
+                message="items must not be empty",
+                hint='Example: [{"repo": "facebook/react", "number": 123}]'
+            )
+        if len(items) > MAX_BATCH_ISSUES:
+            return format_error_json(
+                code="INVALID_INPUT",
+                message=f"items must contain at most {MAX_BATCH_ISSUES} issues",
+                hint="Split the request into several batches"
+            )
+        
+        keys = []
+        for item in items:
+            repo = item.get("repo") if isinstance(item, dict) else None
+            number = item.get("number") if isinstance(item, dict) else None
+            if not is_valid_repo(repo) or type(number) is not int or number <= 0:
+                keys.append(None)
+            else:
+                keys.append((repo, number))
+        
+        # Fetch each distinct issue once; the client bounds concurrency
+        unique = list(dict.fromkeys(key for key in keys if key is not None))
+        client = get_default_client()
+        fetched = await asyncio.gather(
+            *(client.get_issue(repo, number) for repo, number in unique),
+            return_exceptions=True
+        )
+        outcomes = dict(zip(unique, fetched))
+        
+        results = []
+        for item, key in zip(items, keys):
+            if key is None:
+                results.append(error_response(
+                    "INVALID_INPUT",
+                    "each item needs a repo in 'owner/repo' format and a positive number",
+                    {"item": item}
+                ))
+                continue
+            
+            outcome = outcomes[key]
+            if isinstance(outcome, MCPError):
+                results.append(outcome.to_dict())
+            elif isinstance(outcome, BaseException):
+                logger.error("Unexpected error fetching issue %s#%s: %s", key[0], key[1], outcome)
+                results.append(error_response(
+                    "UNEXPECTED_ERROR",
+                    "Failed to fetch issue details",
+                    {"error": str(outcome)}
+                ))
+            else:
+                results.append(success_response(outcome.to_dict()))
+        
+        logger.info("get_issues_batch fetched %s distinct issues", len(unique))
+        return format_success_json({"results": results})
+        
+    except Exception as e:
+        logger.error("Unexpected error in get_issues_batch: %s", e, exc_info=True)
         return format_error_json(
             code="UNEXPECTED_ERROR",
             message="Failed to fetch issue details",
@@ -404,6 +541,7 @@ async def get_issue_details(
         "openWorldHint": True
     }
 )
+@validate_repo()
 async def list_repo_metadata(repo: str) -> str:
     """Get metadata and information about a GitHub repository.
     
@@ -421,19 +559,10 @@ async def list_repo_metadata(repo: str) -> str:
         JSON string with repository metadata and contribution guide pointers
     """
     try:
-        logger.info(f"list_repo_metadata called: repo={repo}")
-        
-        # Validate repo format
-        if '/' not in repo:
-            logger.warning(f"Invalid repo format: {repo}")
-            return format_error_json(
-                code="INVALID_INPUT",
-                message="repo must be in 'owner/repo' format",
-                hint="Example: 'facebook/react' or 'torvalds/linux'"
-            )
+        logger.info("list_repo_metadata called: repo=%s", repo)
         
-        logger.debug(f"Fetching metadata for {repo}")
-        client = GitHubClient()
+        logger.debug("Fetching metadata for %s", repo)
+        client = get_default_client()
         metadata = await client.get_repository(repo)
         
         # Enhance metadata with contribution guide information
@@ -454,17 +583,17 @@ async def list_repo_metadata(repo: str) -> str:
             "common_files": contribution_guides
         }
         
-        logger.info(f"Successfully retrieved metadata for {repo}")
+        logger.info("Successfully retrieved metadata for %s", repo)
         return format_success_json(metadata_dict)
         
     except RateLimitError as e:
-        logger.error(f"Rate limit exceeded while fetching metadata for {repo}: {e}")
+        logger.error("Rate limit exceeded while fetching metadata for %s: %s", repo, e)
         return e.to_json()
     except MCPError as e:
-        logger.error(f"MCP error in list_repo_metadata: {e}")
+        logger.error("MCP error in list_repo_metadata: %s", e)
         return e.to_json()
     except Exception as e:
-        logger.error(f"Unexpected error fetching metadata for {repo}: {e}", exc_info=True)
+        logger.error("Unexpected error fetching metadata for %s: %s", repo, e, exc_info=True)
         return format_error_json(
             code="UNEXPECTED_ERROR",
             message="Failed to fetch repository metadata",
@@ -499,19 +628,21 @@ async def prepare_clone(
         JSON string with validation results
     """
     try:
-        logger.info(f"prepare_clone called: target_path={target_path}, must_be_empty={must_be_empty}")
+        logger.info("prepare_clone called: target_path=%s, must_be_empty=%s", target_path, must_be_empty)
         
-        result = validate_folder_for_clone(
+        # stat/makedirs/scandir can stall on slow or network filesystems
+        result = await asyncio.to_thread(
+            validate_folder_for_clone,
             target_path,
             must_be_empty
         )
         
         if result.get("ok"):
-            logger.info(f"Folder validation passed: {target_path}")
+            logger.info("Folder validation passed: %s", target_path)
             return format_success_json(result.get("data", result))
         else:
             error_info = result.get("error", {})
-            logger.warning(f"Folder validation failed for {target_path}: {error_info.get('message')}")
+            logger.warning("Folder validation failed for %s: %s", target_path, error_info.get('message'))
             return format_error_json(
                 code=error_info.get("code", "VALIDATION_ERROR"),
                 message=error_info.get("message", "Validation failed"),
@@ -519,7 +650,7 @@ async def prepare_clone(
             )
         
     except Exception as e:
-        logger.error(f"Unexpected error validating {target_path}: {e}", exc_info=True)
+        logger.error("Unexpected error validating %s: %s", target_path, e, exc_info=True)
         return format_error_json(
             code="UNEXPECTED_ERROR",
             message="Unexpected error during validation",
@@ -537,13 +668,16 @@ async def prepare_clone(
         "openWorldHint": False
     }
 )
+@validate_repo()
 async def clone_repo(
     repo: str,
     target_path: str,
     confirmed: bool = False,
     clone_method: str = DEFAULT_CLONE_METHOD,
     shallow: bool = False,
-    branch: Optional[str] = None
+    branch: Optional[str] = None,
+    filter_spec: Optional[str] = None,
+    no_checkout: bool = False
 ) -> str:
     """Clone a GitHub repository to a local directory - USER CONFIRMATION REQUIRED.
     
@@ -567,6 +701,8 @@ async def clone_repo(
         clone_method: 'https' or 'ssh' (default: 'https')
         shallow: Whether to do shallow clone (default: false)
         branch: Specific branch to checkout
+        filter_spec: Partial clone filter, e.g. 'blob:none' to fetch file contents on demand
+        no_checkout: Skip writing the working tree (default: false); useful when only history is needed
     
     Returns:
         JSON string with clone results or confirmation error
@@ -574,7 +710,7 @@ async def clone_repo(
     try:
         # Check confirmation first - this is required before proceeding
         if not confirmed:
-            logger.warning(f"clone_repo called without explicit user confirmation")
+            logger.warning("clone_repo called without explicit user confirmation")
             return format_error_json(
                 code="CONFIRMATION_REQUIRED",
                 message="Clone operation requires explicit user confirmation",
@@ -584,41 +720,34 @@ async def clone_repo(
                 }
             )
         
-        logger.info(f"clone_repo called: repo={repo}, target_path={target_path}, confirmed={confirmed}, clone_method={clone_method}")
-        
-        # Validate repo format
-        if '/' not in repo:
-            logger.warning(f"Invalid repo format: {repo}")
-            return format_error_json(
-                code="INVALID_INPUT",
-                message="repo must be in 'owner/repo' format",
-                hint="Example: 'facebook/react' or 'torvalds/linux'"
-            )
+        logger.info("clone_repo called: repo=%s, target_path=%s, confirmed=%s, clone_method=%s", repo, target_path, confirmed, clone_method)
         
         # Validate clone method
         if clone_method not in ["https", "ssh"]:
-            logger.warning(f"Invalid clone method: {clone_method}")
+            logger.warning("Invalid clone method: %s", clone_method)
             return format_error_json(
                 code="INVALID_INPUT",
                 message="clone_method must be 'https' or 'ssh'",
                 hint="Use 'https' for password/token auth or 'ssh' for key-based auth"
             )
         
-        logger.debug(f"Starting clone of {repo} to {target_path}")
+        logger.debug("Starting clone of %s to %s", repo, target_path)
         result = await clone_repository(
             repo=repo,
             target_path=target_path,
             clone_method=clone_method,
             shallow=shallow,
-            branch=branch
+            branch=branch,
+            filter_spec=filter_spec,
+            no_checkout=no_checkout
         )
         
         if result.get("ok"):
-            logger.info(f"Successfully cloned {repo} to {target_path}")
+            logger.info("Successfully cloned %s to %s", repo, target_path)
             return format_success_json(result.get("data", result))
         else:
             error_info = result.get("error", {})
-            logger.error(f"Clone failed for {repo}: {error_info.get('message')}")
+            logger.error("Clone failed for %s: %s", repo, error_info.get('message'))
             return format_error_json(
                 code=error_info.get("code", "CLONE_FAILED"),
                 message=error_info.get("message", "Clone operation failed"),
@@ -626,7 +755,7 @@ async def clone_repo(
             )
         
     except Exception as e:
-        logger.error(f"Unexpected error cloning {repo}: {e}", exc_info=True)
+        logger.error("Unexpected error cloning %s: %s", repo, e, exc_info=True)
         return format_error_json(
             code="UNEXPECTED_ERROR",
             message="Unexpected error during clone",
@@ -674,9 +803,9 @@ async def pr_assistant(
         Markdown-formatted checklist with contribution guidelines emphasized
     """
     try:
-        logger.info(f"pr_assistant called: local_repo_path={local_repo_path}, head_branch={head_branch}")
+        logger.info("pr_assistant called: local_repo_path=%s, head_branch=%s", local_repo_path, head_branch)
         
-        logger.debug(f"Generating PR checklist for {head_branch} -> {base_branch}")
+        logger.debug("Generating PR checklist for %s -> %s", head_branch, base_branch)
         checklist = await generate_pr_checklist(
             local_repo_path=local_repo_path,
             base_branch=base_branch,
@@ -686,11 +815,11 @@ async def pr_assistant(
             fork_flow=fork_flow
         )
         
-        logger.info(f"Successfully generated PR checklist for {head_branch}")
+        logger.info("Successfully generated PR checklist for %s", head_branch)
         return checklist
         
     except Exception as e:
-        logger.error(f"Error generating PR guide for {head_branch}: {e}", exc_info=True)
+        logger.error("Error generating PR guide for %s: %s", head_branch, e, exc_info=True)
         return f"Error generating PR guide: {str(e)}"
 
 
@@ -704,6 +833,7 @@ async def pr_assistant(
         "openWorldHint": True
     }
 )
+@validate_repo()
 async def create_pull_request(
     repo: str,
     head: str,
@@ -731,16 +861,7 @@ async def create_pull_request(
         JSON string with PR creation results
     """
     try:
-        logger.info(f"create_pull_request called: repo={repo}, head={head}, base={base}, title={title}")
-        
-        # Validate repo format
-        if '/' not in repo:
-            logger.warning(f"Invalid repo format: {repo}")
-            return format_error_json(
-                code="INVALID_INPUT",
-                message="repo must be in 'owner/repo' format",
-                hint="Example: 'facebook/react' or 'torvalds/linux'"
-            )
+        logger.info("create_pull_request called: repo=%s, head=%s, base=%s, title=%s", repo, head, base, title)
         
         # Validate title
         if not title or len(title.strip()) == 0:
@@ -751,7 +872,7 @@ async def create_pull_request(
                 hint="Provide a clear, concise PR title (e.g., 'Fix login redirect bug')"
             )
         
-        logger.debug(f"Creating PR: {head} -> {base}")
+        logger.debug("Creating PR: %s -> %s", head, base)
         result = await create_pull_request_automated(
             repo=repo,
             head=head,
@@ -763,11 +884,11 @@ async def create_pull_request(
         )
         
         if result.get("ok"):
-            logger.info(f"Successfully created PR in {repo}")
+            logger.info("Successfully created PR in %s", repo)
             return format_success_json(result.get("data", result))
         else:
             error_info = result.get("error", {})
-            logger.error(f"PR creation failed for {repo}: {error_info.get('message')}")
+            logger.error("PR creation failed for %s: %s", repo, error_info.get('message'))
             return format_error_json(
                 code=error_info.get("code", "PR_CREATION_FAILED"),
                 message=error_info.get("message", "Failed to create pull request"),
@@ -775,7 +896,7 @@ async def create_pull_request(
             )
         
     except Exception as e:
-        logger.error(f"Unexpected error creating PR in {repo}: {e}", exc_info=True)
+        logger.error("Unexpected error creating PR in %s: %s", repo, e, exc_info=True)
         return format_error_json(
             code="UNEXPECTED_ERROR",
             message="Unexpected error during PR creation",
@@ -793,6 +914,7 @@ async def create_pull_request(
         "openWorldHint": True
     }
 )
+@validate_repo()
 async def fork_repo(
     repo: str,
     token: Optional[str] = None
@@ -810,29 +932,20 @@ async def fork_repo(
         JSON string with fork results
     """
     try:
-        logger.info(f"fork_repo called: repo={repo}")
-        
-        # Validate repo format
-        if '/' not in repo:
-            logger.warning(f"Invalid repo format: {repo}")
-            return format_error_json(
-                code="INVALID_INPUT",
-                message="repo must be in 'owner/repo' format",
-                hint="Example: 'facebook/react' or 'torvalds/linux'"
-            )
+        logger.info("fork_repo called: repo=%s", repo)
         
-        logger.debug(f"Forking {repo} to user account")
+        logger.debug("Forking %s to user account", repo)
         result = await fork_repository_automated(
             repo=repo,
             token=token
         )
         
         if result.get("ok"):
-            logger.info(f"Successfully forked {repo}")
+            logger.info("Successfully forked %s", repo)
             return format_success_json(result.get("data", result))
         else:
             error_info = result.get("error", {})
-            logger.error(f"Fork failed for {repo}: {error_info.get('message')}")
+            logger.error("Fork failed for %s: %s", repo, error_info.get('message'))
             return format_error_json(
                 code=error_info.get("code", "FORK_FAILED"),
                 message=error_info.get("message", "Failed to fork repository"),
@@ -840,7 +953,7 @@ async def fork_repo(
             )
         
     except Exception as e:
-        logger.error(f"Unexpected error forking {repo}: {e}", exc_info=True)
+        logger.error("Unexpected error forking %s: %s", repo, e, exc_info=True)
         return format_error_json(
             code="UNEXPECTED_ERROR",
             message="Unexpected error during fork",
@@ -853,4 +966,8 @@ async def fork_repo(
 # ============================================================================
 
 if __name__ == "__main__":
+    # Run on uvloop when installed; otherwise keep the default asyncio loop
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("Using uvloop event loop")
     mcp.run()
\ No newline at end of file
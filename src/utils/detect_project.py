@@ -1,7 +1,29 @@
 """Utilities for detecting project type and providing setup hints."""
 
+import os
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Set
+
+
+def _is_case_insensitive(directory: Path, names: Set[str]) -> bool:
+    """
+    Check whether a directory resolves file names case-insensitively.
+    
+    Probes one listed name with its case swapped; that is the default on
+    macOS and Windows, where Readme.md also answers for README.md.
+    
+    Args:
+        directory: Directory the names were listed from
+        names: Entry names in the directory
+        
+    Returns:
+        True if a case-swapped name resolves to an existing entry
+    """
+    for name in names:
+        swapped = name.swapcase()
+        if swapped != name and swapped not in names:
+            return os.path.exists(os.path.join(directory, swapped))
+    return False
 
 
 def detect_project_type(repo_path: Path) -> Dict[str, Any]:
@@ -17,85 +39,103 @@ def detect_project_type(repo_path: Path) -> Dict[str, Any]:
     hints = []
     project_types = []
     
+    # List the top level once; every marker check below is a set lookup
+    try:
+        with os.scandir(repo_path) as it:
+            # Like Path.exists(), a symlink only counts if its target exists
+            names = {
+                entry.name for entry in it
+                if not entry.is_symlink() or os.path.exists(entry.path)
+            }
+    except OSError:
+        names = set()
+    
+    # Match names the way Path.exists() would resolve them on this filesystem
+    fold = str.lower if _is_case_insensitive(repo_path, names) else str
+    names = {fold(name) for name in names}
+    
+    def has(name: str) -> bool:
+        return fold(name) in names
+    
     # Python project detection
-    if (repo_path / "pyproject.toml").exists():
+    if has("pyproject.toml"):
         project_types.append("Python (pyproject.toml)")
         hints.append("Install dependencies: pip install -e .")
-    elif (repo_path / "requirements.txt").exists():
+    elif has("requirements.txt"):
         project_types.append("Python (requirements.txt)")
         hints.append("Install dependencies: pip install -r requirements.txt")
-    elif (repo_path / "setup.py").exists():
+    elif has("setup.py"):
         project_types.append("Python (setup.py)")
         hints.append("Install dependencies: pip install -e .")
-    elif (repo_path / "Pipfile").exists():
+    elif has("Pipfile"):
         project_types.append("Python (Pipenv)")
         hints.append("Install dependencies: pipenv install")
-    elif (repo_path / "poetry.lock").exists():
+    elif has("poetry.lock"):
         project_types.append("Python (Poetry)")
         hints.append("Install dependencies: poetry install")
     
     # Node.js project detection
-    if (repo_path / "package.json").exists():
+    if has("package.json"):
         project_types.append("Node.js")
-        if (repo_path / "package-lock.json").exists():
+        if has("package-lock.json"):
             hints.append("Install dependencies: npm install")
-        elif (repo_path / "yarn.lock").exists():
+        elif has("yarn.lock"):
             hints.append("Install dependencies: yarn install")
-        elif (repo_path / "pnpm-lock.yaml").exists():
+        elif has("pnpm-lock.yaml"):
             hints.append("Install dependencies: pnpm install")
         else:
             hints.append("Install dependencies: npm install")
     
     # C/C++ project detection
-    if (repo_path / "CMakeLists.txt").exists():
+    if has("CMakeLists.txt"):
         project_types.append("C/C++ (CMake)")
         hints.append("Build: mkdir build && cd build && cmake .. && make")
-    elif (repo_path / "Makefile").exists():
+    elif has("Makefile"):
         project_types.append("C/C++ (Makefile)")
         hints.append("Build: make")
     
     # Rust project detection
-    if (repo_path / "Cargo.toml").exists():
+    if has("Cargo.toml"):
         project_types.append("Rust")
         hints.append("Build: cargo build")
         hints.append("Run tests: cargo test")
     
     # Go project detection
-    if (repo_path / "go.mod").exists():
+    if has("go.mod"):
         project_types.append("Go")
         hints.append("Install dependencies: go mod download")
         hints.append("Build: go build")
     
     # Java/Maven project detection
-    if (repo_path / "pom.xml").exists():
+    if has("pom.xml"):
         project_types.append("Java (Maven)")
         hints.append("Build: mvn clean install")
-    elif (repo_path / "build.gradle").exists() or (repo_path / "build.gradle.kts").exists():
+    elif has("build.gradle") or has("build.gradle.kts"):
         project_types.append("Java (Gradle)")
         hints.append("Build: ./gradlew build")
     
     # Ruby project detection
-    if (repo_path / "Gemfile").exists():
+    if has("Gemfile"):
         project_types.append("Ruby")
         hints.append("Install dependencies: bundle install")
     
     # Docker detection
-    if (repo_path / "Dockerfile").exists():
+    if has("Dockerfile"):
         hints.append("Docker support detected. Build: docker build -t <image-name> .")
-    if (repo_path / "docker-compose.yml").exists() or (repo_path / "docker-compose.yaml").exists():
+    if has("docker-compose.yml") or has("docker-compose.yaml"):
         hints.append("Docker Compose support detected. Run: docker-compose up")
     
     # General hints
-    if (repo_path / "README.md").exists() or (repo_path / "README").exists():
+    if has("README.md") or has("README"):
         hints.insert(0, "Read README for setup instructions")
     
-    if (repo_path / "CONTRIBUTING.md").exists():
+    if has("CONTRIBUTING.md"):
         hints.append("Read CONTRIBUTING.md for contribution guidelines")
     
     # Test detection
     test_dirs = ["test", "tests", "__tests__", "spec"]
     for test_dir in test_dirs:
-        if (repo_path / test_dir).exists():
+        if has(test_dir):
             hints.append(f"Run tests (check README for test commands)")
             break
     
@@ -105,7 +145,12 @@ def detect_project_type(repo_path: Path) -> Dict[str, Any]:
     }
 
 
-def format_next_steps(repo_path: Path, repo_name: str, current_branch: str) -> str:
+def format_next_steps(
+    repo_path: Path,
+    repo_name: str,
+    current_branch: str,
+    detection: Optional[Dict[str, Any]] = None
+) -> str:
     """
     Format next steps after cloning a repository.
     
@@ -113,11 +158,13 @@ def format_next_steps(repo_path: Path, repo_name: str, current_branch: str) -> s
         repo_path: Path to the cloned repository
         repo_name: Name of the repository (owner/repo)
         current_branch: The current branch checked out
+        detection: Precomputed detect_project_type() result (optional)
         
     Returns:
         Formatted string with next steps
     """
-    detection = detect_project_type(repo_path)
+    if detection is None:
+        detection = detect_project_type(repo_path)
     
     output = f"Repository cloned successfully!\n\n"
     output += f"Repository: {repo_name}\n"
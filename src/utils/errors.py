@@ -2,8 +2,14 @@
 
 import json
 import logging
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
+try:
+    import orjson  # Optional: faster JSON encoding
+except ImportError:
+    orjson = None
+
 
 # Configure module logger
 logger = logging.getLogger(__name__)
@@ -17,7 +23,7 @@ class MCPError(Exception):
         self.message = message
         self.details = details or {}
         super().__init__(message)
-        logger.error(f"MCPError ({code}): {message}", extra={"details": self.details})
+        logger.error("MCPError (%s): %s", code, message, extra={"details": self.details})
     
     def to_dict(self) -> dict:
         """Convert error to standardized dictionary format."""
@@ -32,7 +38,7 @@ class MCPError(Exception):
     
     def to_json(self) -> str:
         """Convert error to JSON string."""
-        return json.dumps(self.to_dict(), indent=2)
+        return format_json_response(self.to_dict())
 
 
 class GitHubApiError(MCPError):
@@ -94,17 +100,35 @@ def error_response(code: str, message: str, details: Optional[Dict[str, Any]] =
     }
 
 
-def format_json_response(data: Any, indent: int = 2) -> str:
+def format_json_response(data: Any, indent: Optional[int] = None) -> str:
     """
     Format a standardized response as JSON string.
     
+    Tool results are read by MCP clients rather than people, so output is
+    compact unless an indent is given or debug logging is enabled (then
+    two-space indented). orjson is used when installed, falling back to the
+    stdlib encoder for other indents and for values orjson can't serialize.
+    Non-ASCII text is emitted as UTF-8 rather than \\u escapes; both decode
+    to the same data.
+    
     Args:
         data: Response dict (typically from success_response or error_response)
-        indent: JSON indentation level
+        indent: JSON indentation level; None for the default described above
         
     Returns:
         JSON-formatted string
     """
+    if indent is None and logger.isEnabledFor(logging.DEBUG):
+        indent = 2
+    
+    if orjson is not None and indent in (None, 2):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+        except TypeError:  # orjson.JSONEncodeError, e.g. non-str keys
+            pass
+    
+    if indent is None:
+        return json.dumps(data, separators=(",", ":"))
     return json.dumps(data, indent=indent)
 
 
@@ -112,6 +136,9 @@ def format_error_json(code: str, message: str, hint: Optional[str] = None, conte
     """
     Format an error response as JSON string with optional hint and context.
     
+    Errors without context are fully determined by their arguments, so
+    their JSON is rendered once and reused.
+    
     Args:
         code: Error code
         message: Human-readable error message
@@ -121,6 +148,20 @@ def format_error_json(code: str, message: str, hint: Optional[str] = None, conte
     Returns:
         JSON-formatted error string
     """
+    if not context:
+        # The debug flag is part of the key because it changes the layout
+        return _format_static_error_json(code, message, hint, logger.isEnabledFor(logging.DEBUG))
+    return _render_error_json(code, message, hint, context)
+
+
+@lru_cache(maxsize=128)
+def _format_static_error_json(code: str, message: str, hint: Optional[str], debug: bool) -> str:
+    """Render (and memoize) an error response that has no context."""
+    return _render_error_json(code, message, hint, None)
+
+
+def _render_error_json(code: str, message: str, hint: Optional[str], context: Optional[Dict[str, Any]]) -> str:
+    """Build and serialize an error response dict."""
     error_dict = {
         "ok": False,
         "error": {
@@ -131,7 +172,7 @@ def format_error_json(code: str, message: str, hint: Optional[str] = None, conte
     }
     if hint:
         error_dict["error"]["hint"] = hint
-    return json.dumps(error_dict, indent=2)
+    return format_json_response(error_dict)
 
 
 def format_success_json(data: Any) -> str:
@@ -144,4 +185,4 @@ def format_success_json(data: Any) -> str:
     Returns:
         JSON-formatted success string
     """
-    return json.dumps(success_response(data), indent=2)
+    return format_json_response(success_response(data))
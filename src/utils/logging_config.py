@@ -9,6 +9,11 @@ DEFAULT_LOG_LEVEL = logging.INFO
 DEBUG_LOG_LEVEL = logging.DEBUG
 PRODUCTION_LOG_LEVEL = logging.WARNING
 
+# Single-process stdio server: skip collecting thread/process info per record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
 
 def setup_logging(log_level: Optional[int] = None, log_file: Optional[str] = None) -> None:
     """
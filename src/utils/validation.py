@@ -0,0 +1,26 @@
+"""Validation helpers for tool inputs."""
+
+import re
+from typing import Optional
+
+
+# Exactly one owner and one name segment, within GitHub's length limits.
+# "." and ".." are refused since they'd be resolved as path steps in API URLs.
+_SEGMENT_GUARD = r"(?!\.\.?(?:/|$))"
+REPO_SLUG_RE = re.compile(
+    rf"{_SEGMENT_GUARD}[A-Za-z0-9._-]{{1,39}}/{_SEGMENT_GUARD}[A-Za-z0-9._-]{{1,100}}"
+)
+
+
+def is_valid_repo(repo: Optional[str]) -> bool:
+    """
+    Check that a repository name is in "owner/repo" format.
+    
+    Args:
+        repo: Repository name to check
+        
+    Returns:
+        True if repo has exactly one owner and name of valid length,
+        neither of them "." or ".."
+    """
+    return bool(repo) and REPO_SLUG_RE.fullmatch(repo) is not None
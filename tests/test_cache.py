@@ -0,0 +1,112 @@
+"""Tests for the GitHub response cache."""
+
+import sqlite3
+import time
+
+import pytest
+
+from src.github.cache import ResponseCache
+from src.github.disk_cache import RepoMetadataStore
+
+
+def test_make_key_sorts_params():
+    """Test that parameter order does not change the key."""
+    first = ResponseCache.make_key("https://api.github.com/x", {"b": 2, "a": 1})
+    second = ResponseCache.make_key("https://api.github.com/x", {"a": 1, "b": 2})
+    
+    assert first == second == "https://api.github.com/x?a=1&b=2"
+    assert ResponseCache.make_key("https://api.github.com/x") == "https://api.github.com/x"
+
+
+def test_store_and_expire():
+    """Test fresh and stale entries."""
+    cache = ResponseCache()
+    cache.store("fresh", {"n": 1}, '"etag-1"', ttl=60)
+    cache.store("stale", {"n": 2}, '"etag-2"', ttl=-1)
+    
+    assert cache.lookup("fresh").is_fresh()
+    assert not cache.lookup("stale").is_fresh()
+    assert cache.lookup("missing") is None
+    
+    assert cache.revalidate("stale", cache.lookup("stale"), ttl=60) == {"n": 2}
+    assert cache.lookup("stale").is_fresh()
+
+
+def test_revalidate_restores_dropped_entry():
+    """Test that a 304 for an entry evicted mid-request puts it back."""
+    cache = ResponseCache()
+    cache.store("stale", {"n": 2}, '"etag-2"', ttl=-1)
+    entry = cache.lookup("stale")
+    cache.clear()
+    
+    assert cache.revalidate("stale", entry, ttl=60) == {"n": 2}
+    assert cache.lookup("stale") is entry and entry.is_fresh()
+
+
+def test_conditional_headers():
+    """Test that If-None-Match is only added for entries with an ETag."""
+    cache = ResponseCache()
+    base = {"Accept": "application/vnd.github+json"}
+    cache.store("tagged", {}, '"abc"', ttl=-1)
+    cache.store("untagged", {}, None, ttl=-1)
+    
+    assert cache.conditional_headers(base, cache.lookup("tagged"))["If-None-Match"] == '"abc"'
+    assert cache.conditional_headers(base, cache.lookup("untagged")) is base
+    assert cache.conditional_headers(base, None) is base
+    assert "If-None-Match" not in base
+
+
+def test_lru_eviction():
+    """Test that the least recently used entry is evicted first."""
+    cache = ResponseCache(max_entries=2)
+    cache.store("a", 1, None, ttl=60)
+    cache.store("b", 2, None, ttl=60)
+    cache.lookup("a")
+    cache.store("c", 3, None, ttl=60)
+    
+    assert cache.lookup("b") is None
+    assert cache.lookup("a").data == 1
+    assert cache.lookup("c").data == 3
+
+
+@pytest.mark.asyncio
+async def test_repo_metadata_store_round_trip(tmp_path):
+    """Test that stored metadata survives a new store on the same file."""
+    path = str(tmp_path / "cache" / "repos.db")
+    await RepoMetadataStore(path).save("owner/repo", {"full_name": "owner/repo"}, '"v1"')
+    
+    store = RepoMetadataStore(path)
+    assert await store.load("owner/repo") == ({"full_name": "owner/repo"}, '"v1"')
+    assert await store.load("owner/other") is None
+    assert await RepoMetadataStore(path, max_age=-1).load("owner/repo") is None
+
+
+@pytest.mark.asyncio
+async def test_repo_metadata_store_ignores_storage_errors(tmp_path):
+    """Test that an unusable database file reads as a miss."""
+    path = tmp_path / "repos.db"
+    path.write_bytes(b"not a database")
+    store = RepoMetadataStore(str(path))
+    
+    assert await store.load("owner/repo") is None
+    await store.save("owner/repo", {}, '"v1"')
+
+
+@pytest.mark.asyncio
+async def test_repo_metadata_store_refreshes_confirmed_entries(tmp_path):
+    """Test that an unchanged ETag keeps a stored body from aging out."""
+    path = str(tmp_path / "repos.db")
+    store = RepoMetadataStore(path, max_age=100)
+    await store.save("owner/repo", {"full_name": "owner/repo"}, '"v1"')
+    
+    # Written 90s ago: still loadable, but due for a touch
+    with sqlite3.connect(path) as conn:
+        conn.execute("UPDATE repos SET fetched_at = fetched_at - 90")
+    store._stored_at["owner/repo"] -= 90
+    
+    await store.save("owner/repo", {"full_name": "owner/repo"}, '"v1"')
+    
+    with sqlite3.connect(path) as conn:
+        (fetched_at,) = conn.execute("SELECT fetched_at FROM repos").fetchone()
+    assert time.time() - fetched_at < 10
+    assert await RepoMetadataStore(path, max_age=100).load("owner/repo") is not None
@@ -0,0 +1,301 @@
+"""Tests for git helper operations.
+
+These tests run real git commands against temporary repositories.
+"""
+
+import asyncio
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.git_ops.clone import (
+    GitSession,
+    clone_repository,
+    close_git_sessions,
+    get_current_branch,
+    get_git_session,
+    get_git_status,
+    get_remote_url,
+    invalidate_repo_cache,
+    run_git_command,
+)
+
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def _init_repo(path: Path, branch: str = "main") -> None:
+    """Create a git repository with an unborn branch at path."""
+    subprocess.run(["git", "init", "-q", "-b", branch, str(path)], check=True)
+
+
+@pytest.mark.asyncio
+async def test_get_git_status_not_a_repo():
+    """Test status of a directory that is not a git repository."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        status = await get_git_status(tmpdir)
+
+        assert status == {"error": "Not a git repository"}
+
+
+@pytest.mark.asyncio
+async def test_get_git_status_unborn_branch():
+    """Test status of a freshly initialised repository without commits."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _init_repo(Path(tmpdir))
+
+        status = await get_git_status(tmpdir)
+
+        assert status["is_git_repo"] is True
+        assert status["current_branch"] == "unknown"
+        assert status["has_uncommitted_changes"] is False
+
+
+@pytest.mark.asyncio
+async def test_get_git_status_with_commit_and_changes():
+    """Test branch detection and uncommitted changes."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        repo = Path(tmpdir)
+        _init_repo(repo, branch="feature")
+        subprocess.run(
+            ["git", "-c", "user.name=t", "-c", "user.email=t@example.com",
+             "commit", "-q", "--allow-empty", "-m", "init"],
+            cwd=repo,
+            check=True
+        )
+        (repo / "new.txt").write_text("content")
+
+        status = await get_git_status(tmpdir)
+
+        assert status["current_branch"] == "feature"
+        assert status["has_uncommitted_changes"] is True
+        assert "new.txt" in status["status_summary"]
+
+
+@pytest.mark.asyncio
+async def test_git_session_reuses_batch_process():
+    """Test that repeated ref lookups share one cat-file process."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        repo = Path(tmpdir)
+        _init_repo(repo)
+        subprocess.run(
+            ["git", "-c", "user.name=t", "-c", "user.email=t@example.com",
+             "commit", "-q", "--allow-empty", "-m", "init"],
+            cwd=repo,
+            check=True
+        )
+
+        async with GitSession(repo.resolve()) as session:
+            assert await session.branch() == "main"
+            batch = session._batch
+            head = await session.rev_parse("HEAD")
+
+            assert head is not None and len(head) >= 40
+            assert await session.rev_parse("no-such-ref") is None
+            assert session._batch is batch
+
+        assert session._batch is None
+
+
+@pytest.mark.asyncio
+async def test_git_session_restarts_batch_after_failed_read():
+    """Test that a timed-out query doesn't leave its reply for the next one."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        repo = Path(tmpdir)
+        _init_repo(repo)
+        subprocess.run(
+            ["git", "-c", "user.name=t", "-c", "user.email=t@example.com",
+             "commit", "-q", "--allow-empty", "-m", "init"],
+            cwd=repo,
+            check=True
+        )
+
+        async with GitSession(repo.resolve()) as session:
+            head = await session.rev_parse("HEAD")
+            batch = session._batch
+            batch.stdout.readline = AsyncMock(side_effect=asyncio.TimeoutError)
+
+            with pytest.raises(asyncio.TimeoutError):
+                await session.rev_parse("no-such-ref")
+
+            assert session._batch is None
+            assert batch.returncode is not None
+            assert await session.rev_parse("HEAD") == head
+
+
+@pytest.mark.asyncio
+async def test_close_git_sessions_waits_for_queries_and_reaps():
+    """Test that shutdown closes cached sessions without cutting off a query."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        repo = Path(tmpdir).resolve()
+        _init_repo(repo)
+
+        session = await get_git_session(repo)
+        await session.rev_parse("HEAD")
+        batch = session._batch
+
+        async with session._lock:
+            closing = asyncio.create_task(close_git_sessions())
+            await asyncio.sleep(0.05)
+            # aclose waits for the lock instead of closing pipes in use
+            assert session._batch is batch
+        await closing
+
+        assert session._batch is None
+        assert batch.returncode is not None
+        assert await get_git_session(repo) is not session
+        await close_git_sessions()
+
+
+@pytest.mark.asyncio
+async def test_get_current_branch_cache_follows_head():
+    """Test that the cached branch is refreshed when HEAD changes."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        repo = Path(tmpdir).resolve()
+        _init_repo(repo)
+        subprocess.run(
+            ["git", "-c", "user.name=t", "-c", "user.email=t@example.com",
+             "commit", "-q", "--allow-empty", "-m", "init"],
+            cwd=repo,
+            check=True
+        )
+
+        assert await get_current_branch(repo) == "main"
+
+        subprocess.run(["git", "checkout", "-q", "-b", "feature"], cwd=repo, check=True)
+        os.utime(repo / ".git" / "HEAD", ns=(0, 0))
+
+        assert await get_current_branch(repo) == "feature"
+
+
+def _commit(path: Path) -> None:
+    """Create an empty commit in the repository at path."""
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@example.com",
+         "commit", "-q", "--allow-empty", "-m", "init"],
+        cwd=path,
+        check=True
+    )
+
+
+@pytest.mark.asyncio
+async def test_invalidate_repo_cache_drops_session_for_nested_repo():
+    """Test that a repo created inside another is seen after invalidation."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        parent = Path(tmpdir).resolve()
+        _init_repo(parent, branch="parentbr")
+        _commit(parent)
+        child = parent / "child"
+        child.mkdir()
+
+        assert await get_current_branch(child) == "parentbr"
+
+        _init_repo(child, branch="childbr")
+        _commit(child)
+        await invalidate_repo_cache(child)
+
+        assert await get_current_branch(child) == "childbr"
+        await close_git_sessions()
+
+
+@pytest.mark.asyncio
+async def test_git_session_notices_nested_repo_without_invalidation():
+    """Test that a cached session re-resolves when a nested repo appears."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        parent = Path(tmpdir).resolve()
+        _init_repo(parent, branch="parentbr")
+        _commit(parent)
+        child = parent / "child"
+        child.mkdir()
+
+        async with GitSession(child) as session:
+            assert await session.branch() == "parentbr"
+            parent_batch = session._batch
+
+            _init_repo(child, branch="childbr")
+            _commit(child)
+
+            assert await session.branch() == "childbr"
+            assert session.git_dir == child / ".git"
+            assert parent_batch.returncode is not None
+
+            shutil.rmtree(child / ".git")
+
+            assert await session.branch() == "parentbr"
+
+
+@pytest.mark.asyncio
+async def test_get_remote_url_cache_follows_config():
+    """Test that the cached remote URL is refreshed when config changes."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        repo = Path(tmpdir).resolve()
+        _init_repo(repo)
+        subprocess.run(["git", "remote", "add", "origin", "https://example.com/a.git"], cwd=repo, check=True)
+
+        assert await get_remote_url(str(repo)) == "https://example.com/a.git"
+
+        subprocess.run(["git", "remote", "set-url", "origin", "https://example.com/b.git"], cwd=repo, check=True)
+        os.utime(repo / ".git" / "config", ns=(0, 0))
+
+        assert await get_remote_url(str(repo)) == "https://example.com/b.git"
+
+
+@pytest.mark.asyncio
+async def test_clone_repository_partial_clone_flags():
+    """Test that filter and no-checkout options reach the git command."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with patch("src.git_ops.clone.run_git_command", new=AsyncMock(return_value=(1, b"", b"boom"))) as mock_run:
+            result = await clone_repository(
+                "owner/repo",
+                str(Path(tmpdir) / "clone"),
+                filter_spec="blob:none",
+                no_checkout=True
+            )
+
+        cmd = mock_run.call_args.args[0]
+        assert result["ok"] is False
+        assert cmd[cmd.index("--filter") + 1] == "blob:none"
+        assert "--no-checkout" in cmd
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not hasattr(os, "killpg") or not os.path.isdir("/proc"), reason="needs POSIX process groups and /proc")
+async def test_run_git_command_timeout_kills_children():
+    """Test that a timeout kills the whole process group, not just the leader."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        pid_file = Path(tmpdir) / "child.pid"
+
+        start = time.monotonic()
+        with pytest.raises(asyncio.TimeoutError):
+            await run_git_command(
+                ["sh", "-c", f"sleep 30 & echo $! > {pid_file}; wait"],
+                timeout=0.5
+            )
+
+        # An orphaned child holding the pipes open would stall until it exits
+        assert time.monotonic() - start < 10
+
+        child_pid = int(pid_file.read_text())
+        stat_file = Path(f"/proc/{child_pid}/stat")
+        for _ in range(50):
+            # Gone, or a zombie waiting to be reaped by init
+            if not stat_file.exists() or stat_file.read_text().split(")")[-1].split()[0] == "Z":
+                break
+            await asyncio.sleep(0.02)
+        else:
+            pytest.fail("child process survived the timeout")
+
+
+@pytest.mark.asyncio
+async def test_run_git_command_disables_credential_prompts():
+    """Test that git runs with terminal prompts disabled."""
+    returncode, stdout, _ = await run_git_command(["sh", "-c", "echo $GIT_TERMINAL_PROMPT"])
+
+    assert returncode == 0
+    assert stdout.strip() == b"0"
@@ -0,0 +1,62 @@
+"""Tests for project type detection."""
+
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from src.utils.detect_project import _is_case_insensitive, detect_project_type
+
+
+def test_detect_project_type_markers():
+    """Test detection from top-level marker files."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        repo = Path(tmpdir)
+        for name in ["pyproject.toml", "package.json", "yarn.lock", "README.md"]:
+            (repo / name).write_text("")
+        (repo / "tests").mkdir()
+        
+        result = detect_project_type(repo)
+        
+        assert result["project_types"] == ["Python (pyproject.toml)", "Node.js"]
+        assert result["setup_hints"][0] == "Read README for setup instructions"
+        assert "Install dependencies: yarn install" in result["setup_hints"]
+        assert "Run tests (check README for test commands)" in result["setup_hints"]
+
+
+def test_detect_project_type_missing_directory():
+    """Test that an unreadable path falls back to unknown."""
+    result = detect_project_type(Path("/nonexistent/path/for/detection"))
+    
+    assert result["project_types"] == ["Unknown"]
+    assert result["setup_hints"] == ["Check README for setup instructions"]
+
+
+def test_detect_project_type_ignores_dangling_symlinks():
+    """Test that a marker symlink without a target doesn't count."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        repo = Path(tmpdir)
+        (repo / "Cargo.toml").symlink_to(repo / "missing")
+        (repo / "go.mod").write_text("")
+        (repo / "pom.xml").symlink_to(repo / "go.mod")
+        
+        result = detect_project_type(repo)
+        
+        assert result["project_types"] == ["Go", "Java (Maven)"]
+
+
+def test_detect_project_type_case_insensitive_filesystem():
+    """Test that differently cased markers match where the filesystem folds case."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        repo = Path(tmpdir)
+        for name in ["Readme.md", "makefile", "dockerfile"]:
+            (repo / name).write_text("")
+        
+        with patch("src.utils.detect_project._is_case_insensitive", return_value=True):
+            result = detect_project_type(repo)
+        
+        assert result["project_types"] == ["C/C++ (Makefile)"]
+        assert result["setup_hints"][0] == "Read README for setup instructions"
+        assert any(hint.startswith("Docker support detected") for hint in result["setup_hints"])
+        
+        # A case-sensitive filesystem keeps exact-name matching
+        assert _is_case_insensitive(repo, {"Readme.md"}) == (repo / "README.MD").exists()
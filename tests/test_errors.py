@@ -0,0 +1,41 @@
+"""Tests for structured error and JSON response helpers."""
+
+import json
+import logging
+
+from src.utils.errors import format_error_json, format_json_response, format_success_json
+
+
+def test_format_json_response_matches_stdlib():
+    """Test that the fast path produces the same layout as json.dumps."""
+    data = {"ok": True, "data": {"items": [1, 2], "empty": {}, "none": None, "labels": ("a",)}}
+    
+    assert format_json_response(data) == json.dumps(data, separators=(",", ":"))
+    assert format_json_response(data, indent=2) == json.dumps(data, indent=2)
+    assert format_json_response(data, indent=4) == json.dumps(data, indent=4)
+
+
+def test_format_json_response_pretty_when_debugging():
+    """Test that debug logging switches the default to indented output."""
+    logger = logging.getLogger("src.utils.errors")
+    previous = logger.level
+    logger.setLevel(logging.DEBUG)
+    try:
+        assert format_json_response({"ok": True}) == '{\n  "ok": true\n}'
+    finally:
+        logger.setLevel(previous)
+
+
+def test_format_json_response_falls_back_for_unsupported_values():
+    """Test that values orjson rejects still serialize via the stdlib."""
+    data = {1: "int key"}
+    
+    assert json.loads(format_json_response(data)) == {"1": "int key"}
+
+
+def test_format_helpers_round_trip():
+    """Test that success and error helpers emit the standard envelope."""
+    assert json.loads(format_success_json({"x": "café"})) == {"ok": True, "data": {"x": "café"}}
+    
+    error = json.loads(format_error_json("INVALID_INPUT", "bad", hint="fix it"))
+    assert error["error"] == {"code": "INVALID_INPUT", "message": "bad", "details": {}, "hint": "fix it"}
@@ -10,7 +10,8 @@ from pathlib import Path
 from src.git_ops.fs_validate import (
     validate_folder_for_clone,
     list_directory_contents,
-    ValidationStatus
+    ValidationStatus,
+    _is_empty_fast
 )
 
 
@@ -98,6 +99,16 @@ def test_list_directory_contents_max_items():
         assert len(contents) == 10
 
 
+def test_is_empty_fast():
+    """Test the scandir-based emptiness check."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        assert _is_empty_fast(Path(tmpdir)) is True
+        
+        (Path(tmpdir) / ".hidden").write_text("content")
+        
+        assert _is_empty_fast(Path(tmpdir)) is False
+
+
 def test_validate_file_not_directory():
     """Test validation fails when path is a file."""
     with tempfile.TemporaryDirectory() as tmpdir:
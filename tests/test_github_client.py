@@ -0,0 +1,449 @@
+"""Tests for the shared GitHub HTTP connection pool."""
+
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from src.github.client import (
+    GitHubClient,
+    get_default_client,
+    get_http_client,
+    close_http_client,
+    _exhausted_buckets,
+    _inflight,
+    _token_headers,
+)
+from src.config import MAX_CONCURRENT_REQUESTS
+from src.github.cache import response_cache
+from src.github.disk_cache import RepoMetadataStore
+from src.github.models import IssueDetail, RepositoryMetadata
+from src.utils.errors import MCPError, RateLimitError
+
+
+@pytest.mark.asyncio
+async def test_http_client_is_shared():
+    """Test that repeated lookups reuse one pooled client."""
+    client = get_http_client()
+    
+    assert get_http_client() is client
+    
+    await close_http_client()
+    
+    assert client.is_closed
+    assert get_http_client() is not client
+    await close_http_client()
+
+
+@pytest.mark.asyncio
+async def test_github_client_uses_shared_pool_by_default():
+    """Test that clients without a dedicated HTTP client share the pool."""
+    async with GitHubClient() as first, GitHubClient() as second:
+        assert first._http() is second._http() is get_http_client()
+    
+    # Leaving the context must not close the shared pool
+    assert not get_http_client().is_closed
+    await close_http_client()
+
+
+@pytest.mark.asyncio
+async def test_github_client_closes_dedicated_client():
+    """Test that aclose() closes an explicitly provided HTTP client."""
+    http_client = httpx.AsyncClient()
+    
+    async with GitHubClient(http_client=http_client) as client:
+        assert client._http() is http_client
+    
+    assert http_client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_http_client_enables_http2_when_available():
+    """Test that HTTP/2 is requested when h2 is installed."""
+    pytest.importorskip("h2")
+    await close_http_client()
+    
+    with patch("httpx.AsyncClient") as mock_async_client:
+        get_http_client()
+    
+    assert mock_async_client.call_args.kwargs["http2"] is True
+    await close_http_client()
+
+
+@pytest.mark.asyncio
+async def test_get_issue_bundle_fetches_concurrently():
+    """Test that the bundle combines issue, comments and repository."""
+    client = GitHubClient()
+    issue = IssueDetail({"number": 7, "title": "Bug"})
+    repository = RepositoryMetadata({"full_name": "owner/repo"})
+    
+    with patch.object(client, "get_issue", AsyncMock(return_value=issue)), \
+         patch.object(client, "get_issue_comments", AsyncMock(return_value=[])) as mock_comments, \
+         patch.object(client, "get_repository", AsyncMock(return_value=repository)) as mock_repository:
+        bundle = await client.get_issue_bundle("owner/repo", 7, max_comments=3, include_repository=True)
+    
+    mock_comments.assert_awaited_once_with("owner/repo", 7, 3)
+    mock_repository.assert_awaited_once_with("owner/repo")
+    assert bundle.issue is issue
+    assert bundle.to_dict()["repository"]["full_name"] == "owner/repo"
+
+
+@pytest.mark.asyncio
+async def test_get_repository_revalidates_with_etag():
+    """Test that stale cached metadata is revalidated with If-None-Match."""
+    response_cache.clear()
+    ok = MagicMock(status_code=200, headers={"ETag": '"v1"'})
+    ok.json.return_value = {"full_name": "owner/repo", "stargazers_count": 5}
+    ok.content = json.dumps(ok.json.return_value).encode()
+    not_modified = MagicMock(status_code=304, headers={})
+    http_client = MagicMock()
+    http_client.request = AsyncMock(side_effect=[ok, not_modified])
+    client = GitHubClient(http_client=http_client)
+    
+    first = await client.get_repository("owner/repo")
+    # Served from cache while fresh
+    assert (await client.get_repository("owner/repo")).stars == 5
+    assert http_client.request.await_count == 1
+    
+    key = response_cache.make_key(f"{client.base_url}/repos/owner/repo")
+    response_cache.lookup(key).expires_at = 0
+    second = await client.get_repository("owner/repo")
+    
+    assert http_client.request.await_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+    assert first.full_name == second.full_name == "owner/repo"
+    assert response_cache.lookup(key).is_fresh()
+    response_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_get_repository_304_after_cache_cleared_mid_request():
+    """Test that a 304 still returns the body if the entry was dropped in flight."""
+    response_cache.clear()
+    key_url = "https://api.github.com/repos/owner/repo"
+    response_cache.store(key_url, {"full_name": "owner/repo", "stargazers_count": 5}, '"v1"', ttl=-1)
+    
+    async def clear_then_not_modified(*args, **kwargs):
+        response_cache.clear()
+        return MagicMock(status_code=304, headers={})
+    
+    http_client = MagicMock()
+    http_client.request = AsyncMock(side_effect=clear_then_not_modified)
+    client = GitHubClient(http_client=http_client)
+    
+    repository = await client.get_repository("owner/repo")
+    
+    assert http_client.request.await_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+    assert repository.stars == 5
+    assert response_cache.lookup(response_cache.make_key(key_url)).is_fresh()
+    response_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_get_repository_seeds_from_disk_store(tmp_path):
+    """Test that metadata stored by an earlier process is revalidated, not refetched."""
+    response_cache.clear()
+    store = RepoMetadataStore(str(tmp_path / "repos.db"))
+    ok = MagicMock(status_code=200, headers={"ETag": '"v1"'})
+    ok.json.return_value = {"full_name": "owner/repo", "stargazers_count": 5}
+    ok.content = json.dumps(ok.json.return_value).encode()
+    http_client = MagicMock()
+    http_client.request = AsyncMock(return_value=ok)
+    
+    with patch("src.github.client.repo_metadata_store", store):
+        await GitHubClient(http_client=http_client).get_repository("owner/repo")
+        
+        # A restarted server has an empty in-memory cache
+        response_cache.clear()
+        http_client.request = AsyncMock(return_value=MagicMock(status_code=304, headers={}))
+        repository = await GitHubClient(http_client=http_client).get_repository("owner/repo")
+    
+    assert http_client.request.await_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+    assert repository.stars == 5
+    response_cache.clear()
+
+
+def test_token_headers_built_once_per_token():
+    """Test that explicit-token headers are cached per token."""
+    headers = _token_headers("token-a")
+    
+    assert headers["Authorization"] == "Bearer token-a"
+    assert _token_headers("token-a") is headers
+    assert _token_headers("token-b")["Authorization"] == "Bearer token-b"
+
+
+@pytest.mark.asyncio
+async def test_request_retries_gateway_errors_for_get_only():
+    """Test that 502s are retried for GETs but not for POSTs."""
+    bad_gateway = MagicMock(status_code=502, headers={})
+    ok = MagicMock(status_code=200, headers={})
+    http_client = MagicMock()
+    http_client.request = AsyncMock(side_effect=[bad_gateway, ok])
+    client = GitHubClient(http_client=http_client)
+    
+    with patch("asyncio.sleep", new=AsyncMock()) as mock_sleep:
+        assert await client._request("GET", "https://api.github.com/x") is ok
+        
+        http_client.request = AsyncMock(return_value=bad_gateway)
+        assert await client._request("POST", "https://api.github.com/x") is bad_gateway
+    
+    assert mock_sleep.await_count == 1
+    assert http_client.request.await_count == 1
+
+
+def test_retry_delay_honours_retry_after_and_gives_up_on_long_resets():
+    """Test delay selection for secondary and primary rate limits."""
+    client = GitHubClient()
+    secondary = MagicMock(status_code=403, headers={"Retry-After": "5"})
+    exhausted = MagicMock(status_code=429, headers={"X-RateLimit-Reset": str(int(time.time()) + 3600)})
+    
+    assert 5 <= client._retry_delay("POST", secondary, attempt=0) <= 6
+    assert client._retry_delay("GET", exhausted, attempt=0) is None
+
+
+@pytest.mark.asyncio
+async def test_request_concurrency_is_capped():
+    """Test that fan-out never exceeds the shared request limit."""
+    in_flight = 0
+    peak = 0
+    
+    async def slow_request(*args, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return MagicMock(status_code=200, headers={})
+    
+    http_client = MagicMock()
+    http_client.request = slow_request
+    client = GitHubClient(http_client=http_client)
+    
+    await asyncio.gather(*(client._request("GET", "https://api.github.com/x") for _ in range(25)))
+    
+    assert peak == MAX_CONCURRENT_REQUESTS
+
+
+def _json_response(status_code: int, payload) -> httpx.Response:
+    """Build an httpx response carrying a JSON body."""
+    return httpx.Response(status_code, json=payload, request=httpx.Request("GET", "https://api.github.com"))
+
+
+@pytest.mark.asyncio
+async def test_search_issues_uses_graphql_with_token():
+    """Test that authenticated searches go through GraphQL."""
+    response_cache.clear()
+    node = {
+        "number": 42,
+        "title": "Fix docs",
+        "url": "https://github.com/owner/repo/issues/42",
+        "state": "OPEN",
+        "body": "Details",
+        "createdAt": "2025-01-01T00:00:00Z",
+        "updatedAt": "2025-01-02T00:00:00Z",
+        "comments": {"totalCount": 3},
+        "labels": {"nodes": [{"name": "good first issue"}]},
+        "repository": {"nameWithOwner": "owner/repo"}
+    }
+    http_client = MagicMock()
+    http_client.request = AsyncMock(return_value=_json_response(200, {"data": {"search": {"nodes": [node, {}]}}}))
+    client = GitHubClient(http_client=http_client)
+    
+    with patch("src.github.client.GITHUB_TOKEN", "token"):
+        results = await client.search_issues("is:issue repo:owner/repo", sort="updated", limit=5)
+    
+    method, url = http_client.request.await_args.args
+    variables = http_client.request.await_args.kwargs["json"]["variables"]
+    assert (method, url) == ("POST", "https://api.github.com/graphql")
+    assert variables == {"q": "is:issue repo:owner/repo sort:updated-desc", "n": 5}
+    assert len(results) == 1
+    assert results[0].to_dict()["repo"] == "owner/repo"
+    assert results[0].labels == ["good first issue"]
+    assert results[0].state == "open"
+    assert results[0].comments == 3
+    response_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_search_issues_falls_back_to_rest():
+    """Test that GraphQL errors fall back to the REST search endpoint."""
+    response_cache.clear()
+    graphql_error = _json_response(200, {"errors": [{"message": "Something went wrong"}]})
+    rest_ok = _json_response(200, {"items": [{"number": 1, "title": "From REST"}]})
+    http_client = MagicMock()
+    http_client.request = AsyncMock(side_effect=[graphql_error, rest_ok])
+    client = GitHubClient(http_client=http_client)
+    
+    with patch("src.github.client.GITHUB_TOKEN", "token"):
+        results = await client.search_issues("is:issue", limit=5)
+    
+    assert http_client.request.await_args.args == ("GET", "https://api.github.com/search/issues")
+    assert [issue.title for issue in results] == ["From REST"]
+    response_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_search_issues_paginates_beyond_100():
+    """Test that large limits fetch only the pages total_count allows."""
+    response_cache.clear()
+    def page(start: int, count: int, total: int) -> MagicMock:
+        items = [{"number": n, "title": f"Issue {n}"} for n in range(start, start + count)]
+        return _json_response(200, {"total_count": total, "items": items})
+    
+    http_client = MagicMock()
+    http_client.request = AsyncMock(side_effect=[page(1, 100, 250), page(101, 100, 250), page(201, 50, 250)])
+    client = GitHubClient(http_client=http_client)
+    
+    results = await client.search_issues("is:issue", limit=500)
+    
+    requested_pages = [call.kwargs["params"].get("page", 1) for call in http_client.request.await_args_list]
+    assert requested_pages == [1, 2, 3]
+    assert [issue.number for issue in results] == list(range(1, 251))
+    response_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_search_issues_served_from_cache():
+    """Test that repeating a search within the TTL makes no new request."""
+    response_cache.clear()
+    http_client = MagicMock()
+    http_client.request = AsyncMock(return_value=_json_response(200, {"items": [{"number": 7, "title": "Cached"}]}))
+    client = GitHubClient(http_client=http_client)
+    
+    with patch("src.github.client.GITHUB_TOKEN", None):
+        first = await client.search_issues("is:issue label:bug", limit=5)
+        second = await client.search_issues("is:issue label:bug", limit=5)
+    
+    assert http_client.request.await_count == 1
+    assert [issue.number for issue in second] == [issue.number for issue in first] == [7]
+    assert second[0] is not first[0]
+    response_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_error_map_dispatch():
+    """Test that mapped statuses raise and unmapped ones fall through."""
+    response_cache.clear()
+    http_client = MagicMock()
+    http_client.request = AsyncMock(return_value=_json_response(404, {"message": "Not Found"}))
+    client = GitHubClient(http_client=http_client)
+    
+    with pytest.raises(MCPError) as exc_info:
+        await client.get_issue("owner/repo", 1)
+    assert exc_info.value.code == "GITHUB_NOT_FOUND"
+    
+    # Comments have no mapping for 404 and degrade to an empty list
+    assert await client.get_issue_comments("owner/repo", 1) == []
+    response_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_search_repositories_goes_through_client():
+    """Test that repository discovery uses the pooled, cached request path."""
+    response_cache.clear()
+    items = [{"full_name": f"org/repo{n}"} for n in range(3)]
+    http_client = MagicMock()
+    http_client.request = AsyncMock(return_value=_json_response(200, {"items": items}))
+    client = GitHubClient(http_client=http_client)
+    
+    first = await client.search_repositories("stars:>1000", limit=2)
+    second = await client.search_repositories("stars:>1000", limit=2)
+    
+    method, url = http_client.request.await_args.args
+    assert (method, url) == ("GET", "https://api.github.com/search/repositories")
+    assert http_client.request.await_args.kwargs["params"]["per_page"] == 2
+    assert http_client.request.await_count == 1
+    assert first == second == items[:2]
+    response_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_are_coalesced():
+    """Test that simultaneous identical GETs share one HTTP request."""
+    response_cache.clear()
+    
+    async def slow_response(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return _json_response(200, {"full_name": "owner/repo"})
+    
+    http_client = MagicMock()
+    http_client.request = AsyncMock(side_effect=slow_response)
+    client = GitHubClient(http_client=http_client)
+    
+    results = await asyncio.gather(*(client.get_repository("owner/repo") for _ in range(5)))
+    
+    assert http_client.request.await_count == 1
+    assert {result.full_name for result in results} == {"owner/repo"}
+    assert not _inflight
+    response_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_get_issue_comments_fetches_pages_concurrently():
+    """Test that comment pages after the first are fetched together and kept in order."""
+    response_cache.clear()
+    
+    def page(start: int, count: int) -> httpx.Response:
+        return _json_response(200, [{"id": n, "body": f"Comment {n}"} for n in range(start, start + count)])
+    
+    http_client = MagicMock()
+    http_client.request = AsyncMock(side_effect=[page(1, 100), page(101, 100), page(201, 30)])
+    client = GitHubClient(http_client=http_client)
+    
+    comments = await client.get_issue_comments("owner/repo", 1, max_comments=250)
+    
+    requested_pages = [call.kwargs["params"].get("page", 1) for call in http_client.request.await_args_list]
+    assert requested_pages == [1, 2, 3]
+    assert [comment.id for comment in comments] == list(range(1, 231))
+    response_cache.clear()
+
+
+def test_default_client_is_singleton():
+    """Test that tool handlers share one GitHubClient."""
+    assert get_default_client() is get_default_client()
+
+
+@pytest.mark.asyncio
+async def test_exhausted_rate_limit_fails_fast():
+    """Test that requests against an exhausted bucket aren't sent."""
+    reset_at = int(time.time()) + 3600
+    exhausted = httpx.Response(
+        403,
+        headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset_at)},
+        request=httpx.Request("GET", "https://api.github.com")
+    )
+    http_client = MagicMock()
+    http_client.request = AsyncMock(return_value=exhausted)
+    client = GitHubClient(http_client=http_client)
+    
+    try:
+        await client._request("GET", "https://api.github.com/repos/owner/repo")
+        
+        with pytest.raises(RateLimitError) as exc_info:
+            await client._request("GET", "https://api.github.com/repos/other/repo")
+        assert http_client.request.await_count == 1
+        assert exc_info.value.details["resets_at"]
+        
+        # Other budgets are unaffected
+        await client._request("GET", "https://api.github.com/search/issues")
+        assert http_client.request.await_count == 2
+    finally:
+        _exhausted_buckets.clear()
+
+
+@pytest.mark.asyncio
+async def test_exhausted_rate_limit_waits_for_near_reset():
+    """Test that a bucket resetting soon is waited for, then retried."""
+    _exhausted_buckets[("core", None)] = time.time() + 5
+    http_client = MagicMock()
+    http_client.request = AsyncMock(return_value=_json_response(200, {}))
+    client = GitHubClient(http_client=http_client)
+    
+    with patch("asyncio.sleep", new=AsyncMock()) as mock_sleep:
+        await client._request("GET", "https://api.github.com/repos/owner/repo")
+    
+    assert 0 < mock_sleep.await_args.args[0] <= 5
+    assert http_client.request.await_count == 1
+    assert not _exhausted_buckets
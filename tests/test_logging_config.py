@@ -0,0 +1,27 @@
+"""Tests for logging conventions."""
+
+import ast
+from pathlib import Path
+
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+LOG_METHODS = {"debug", "info", "warning", "error", "exception", "critical"}
+
+
+def test_logger_calls_use_lazy_formatting():
+    """Test that no logger call formats its message eagerly with an f-string."""
+    eager = []
+    for path in SRC_DIR.rglob("*.py"):
+        for node in ast.walk(ast.parse(path.read_text(encoding="utf-8"))):
+            if (
+                isinstance(node, ast.Call)
+                and isinstance(node.func, ast.Attribute)
+                and node.func.attr in LOG_METHODS
+                and isinstance(node.func.value, ast.Name)
+                and node.func.value.id == "logger"
+                and node.args
+                and isinstance(node.args[0], ast.JoinedStr)
+            ):
+                eager.append(f"{path.relative_to(SRC_DIR)}:{node.lineno}")
+
+    assert eager == []
@@ -28,7 +28,7 @@ async def test_search_issues_repo_mode():
     from src.github.models import IssueSearchResult
     
     # Mock the GitHubClient
-    with patch('src.server.GitHubClient') as MockClient:
+    with patch('src.server.get_default_client') as MockClient:
         mock_client = MockClient.return_value
         
         # Create mock issue
@@ -69,7 +69,7 @@ async def test_search_issues_with_filters():
     from src.server import search_issues
     from src.github.models import IssueSearchResult
     
-    with patch('src.server.GitHubClient') as MockClient:
+    with patch('src.server.get_default_client') as MockClient:
         mock_client = MockClient.return_value
         
         mock_issue_data = {
@@ -99,6 +99,35 @@ async def test_search_issues_with_filters():
         assert result_data["data"]["results"][0]["repo"] == "facebook/react"
 
 
+@pytest.mark.asyncio
+async def test_search_issues_prefetch_warms_top_results():
+    """Test that prefetch fetches the top results' details in the background."""
+    from src import server
+    from src.config import PREFETCH_TOP_K
+    from src.github.models import IssueSearchResult
+    
+    issues = [
+        IssueSearchResult({"repository_url": "https://api.github.com/repos/test/repo", "number": n})
+        for n in range(1, PREFETCH_TOP_K + 3)
+    ]
+    
+    with patch('src.server.get_default_client') as MockClient:
+        mock_client = MockClient.return_value
+        mock_client.search_issues = AsyncMock(return_value=issues)
+        mock_client.get_issue = AsyncMock(side_effect=[RuntimeError("gone"), *[None] * 10])
+        mock_client.get_repository = AsyncMock()
+        
+        result = await server.search_issues(repo="test/repo", prefetch=True)
+        await asyncio.gather(*server._prefetch_tasks)
+    
+    assert json.loads(result)["data"]["total_found"] == len(issues)
+    assert [call.args for call in mock_client.get_issue.await_args_list] == [
+        ("test/repo", n) for n in range(1, PREFETCH_TOP_K + 1)
+    ]
+    mock_client.get_repository.assert_awaited_once_with("test/repo")
+    assert not server._prefetch_tasks
+
+
 @pytest.mark.asyncio
 async def test_search_issues_missing_repo():
     """Test search_issues without repo parameter (now required)."""
@@ -113,6 +142,9 @@ async def test_search_issues_missing_repo():
     assert result_data["ok"] is False
     assert "INVALID_INPUT" in result_data["error"]["code"]
     assert "owner/repo" in result_data["error"]["message"]
+    
+    # Context-free errors are rendered once and reused
+    assert await search_issues(repo="", limit=10) is result
 
 
 @pytest.mark.asyncio
@@ -121,7 +153,7 @@ async def test_get_issue_details():
     from src.server import get_issue_details
     from src.github.models import IssueDetail
     
-    with patch('src.server.GitHubClient') as MockClient:
+    with patch('src.server.get_default_client') as MockClient:
         mock_client = MockClient.return_value
         
         mock_issue_data = {
@@ -155,6 +187,36 @@ async def test_get_issue_details():
         assert result_data["data"]["title"] == "Test Issue"
 
 
+@pytest.mark.asyncio
+async def test_get_issue_details_with_comments():
+    """Test get_issue_details fetching the issue and comments together."""
+    from src.server import get_issue_details
+    from src.github.models import IssueDetail, Comment, IssueBundle
+    
+    with patch('src.server.get_default_client') as MockClient:
+        mock_client = MockClient.return_value
+        
+        mock_issue = IssueDetail({"number": 123, "title": "Test Issue"})
+        mock_comments = [Comment({"id": 1, "user": {"login": "reviewer"}, "body": "Looks good"})]
+        mock_client.get_issue_bundle = AsyncMock(
+            return_value=IssueBundle(mock_issue, mock_comments)
+        )
+        
+        result = await get_issue_details(
+            repo="test/repo",
+            number=123,
+            include_comments=True,
+            max_comments=5
+        )
+        
+        mock_client.get_issue_bundle.assert_awaited_once_with("test/repo", 123, 5)
+        result_data = json.loads(result)
+        assert result_data["ok"] is True
+        assert result_data["data"]["title"] == "Test Issue"
+        assert result_data["data"]["comments"][0]["author"] == "reviewer"
+        assert "repository" not in result_data["data"]
+
+
 @pytest.mark.asyncio
 async def test_get_issue_details_invalid_repo():
     """Test get_issue_details with invalid repo format."""
@@ -176,7 +238,7 @@ async def test_list_repo_metadata():
     from src.server import list_repo_metadata
     from src.github.models import RepositoryMetadata
     
-    with patch('src.server.GitHubClient') as MockClient:
+    with patch('src.server.get_default_client') as MockClient:
         mock_client = MockClient.return_value
         
         mock_repo_data = {
@@ -360,6 +422,52 @@ async def test_fork_repo_invalid_repo():
     assert "owner/repo" in result_data["error"]["message"].lower()
 
 
+@pytest.mark.asyncio
+async def test_get_issues_batch():
+    """Test get_issues_batch deduplicates fetches and keeps input order."""
+    from src.server import get_issues_batch
+    from src.github.models import IssueDetail
+    from src.utils.errors import GitHubApiError
+    
+    async def fake_get_issue(repo, number):
+        if number == 404:
+            raise GitHubApiError("Issue not found", status_code=404)
+        return IssueDetail({"number": number, "title": f"{repo} issue"})
+    
+    with patch('src.server.get_default_client') as MockClient:
+        mock_client = MockClient.return_value
+        mock_client.get_issue = AsyncMock(side_effect=fake_get_issue)
+        
+        result = await get_issues_batch(items=[
+            {"repo": "test/repo", "number": 1},
+            {"repo": "test/repo", "number": 404},
+            {"repo": "bad", "number": 2},
+            {"repo": "test/repo", "number": 1},
+        ])
+        
+        assert mock_client.get_issue.await_count == 2
+        result_data = json.loads(result)
+        assert result_data["ok"] is True
+        results = result_data["data"]["results"]
+        assert [r["ok"] for r in results] == [True, False, False, True]
+        assert results[0]["data"]["title"] == "test/repo issue"
+        assert results[1]["error"]["code"] == "GITHUB_API_ERROR"
+        assert results[2]["error"]["code"] == "INVALID_INPUT"
+        assert results[3] == results[0]
+
+
+@pytest.mark.asyncio
+async def test_get_issues_batch_limits():
+    """Test get_issues_batch rejects empty and oversized batches."""
+    from src.server import get_issues_batch
+    from src.config import MAX_BATCH_ISSUES
+    
+    for items in [[], [{"repo": "test/repo", "number": 1}] * (MAX_BATCH_ISSUES + 1)]:
+        result_data = json.loads(await get_issues_batch(items=items))
+        assert result_data["ok"] is False
+        assert result_data["error"]["code"] == "INVALID_INPUT"
+
+
 # Test that all tools are registered
 def test_all_tools_registered():
     """Test that all 8 tools are registered with the MCP server."""
@@ -373,6 +481,7 @@ def test_all_tools_registered():
     from src import server
     assert hasattr(server, 'search_issues')
     assert hasattr(server, 'get_issue_details')
+    assert hasattr(server, 'get_issues_batch')
     assert hasattr(server, 'list_repo_metadata')
     assert hasattr(server, 'prepare_clone')
     assert hasattr(server, 'clone_repo')
@@ -389,7 +498,7 @@ async def test_search_performance():
     from src.github.models import IssueSearchResult
     import time
     
-    with patch('src.server.GitHubClient') as MockClient:
+    with patch('src.server.get_default_client') as MockClient:
         mock_client = MockClient.return_value
         mock_client.search_issues = AsyncMock(return_value=[])
         
@@ -414,39 +523,29 @@ async def test_discover_repository_no_filters():
     """Test discover_repository with no language/topic filters."""
     from src.server import discover_repository
     
-    with patch('httpx.AsyncClient') as MockAsyncClient:
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "items": [
-                {
-                    "full_name": "python/cpython",
-                    "html_url": "https://github.com/python/cpython",
-                    "description": "The Python programming language",
-                    "stargazers_count": 60000,
-                    "language": "C",
-                    "topics": ["python", "interpreter"],
-                    "updated_at": "2025-01-09T00:00:00Z",
-                    "open_issues_count": 50
-                },
-                {
-                    "full_name": "torvalds/linux",
-                    "html_url": "https://github.com/torvalds/linux",
-                    "description": "Linux kernel source tree",
-                    "stargazers_count": 185000,
-                    "language": "C",
-                    "topics": ["kernel", "linux"],
-                    "updated_at": "2025-01-09T00:00:00Z",
-                    "open_issues_count": 100
-                }
-            ]
-        }
-        
-        mock_client_instance = AsyncMock()
-        mock_client_instance.__aenter__.return_value = mock_client_instance
-        mock_client_instance.__aexit__.return_value = None
-        mock_client_instance.get = AsyncMock(return_value=mock_response)
-        
-        MockAsyncClient.return_value = mock_client_instance
+    with patch('src.server.get_default_client') as mock_get_client:
+        mock_get_client.return_value.search_repositories = AsyncMock(return_value=[
+            {
+                "full_name": "python/cpython",
+                "html_url": "https://github.com/python/cpython",
+                "description": "The Python programming language",
+                "stargazers_count": 60000,
+                "language": "C",
+                "topics": ["python", "interpreter"],
+                "updated_at": "2025-01-09T00:00:00Z",
+                "open_issues_count": 50
+            },
+            {
+                "full_name": "torvalds/linux",
+                "html_url": "https://github.com/torvalds/linux",
+                "description": "Linux kernel source tree",
+                "stargazers_count": 185000,
+                "language": "C",
+                "topics": ["kernel", "linux"],
+                "updated_at": "2025-01-09T00:00:00Z",
+                "open_issues_count": 100
+            }
+        ])
         
         result = await discover_repository()
         
@@ -463,29 +562,19 @@ async def test_discover_repository_with_language():
     """Test discover_repository filtered by language."""
     from src.server import discover_repository
     
-    with patch('httpx.AsyncClient') as MockAsyncClient:
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "items": [
-                {
-                    "full_name": "tensorflow/tensorflow",
-                    "html_url": "https://github.com/tensorflow/tensorflow",
-                    "description": "An Open Source Machine Learning Framework",
-                    "stargazers_count": 185000,
-                    "language": "Python",
-                    "topics": ["machine-learning", "deep-learning"],
-                    "updated_at": "2025-01-09T00:00:00Z",
-                    "open_issues_count": 800
-                }
-            ]
-        }
-        
-        mock_client_instance = AsyncMock()
-        mock_client_instance.__aenter__.return_value = mock_client_instance
-        mock_client_instance.__aexit__.return_value = None
-        mock_client_instance.get = AsyncMock(return_value=mock_response)
-        
-        MockAsyncClient.return_value = mock_client_instance
+    with patch('src.server.get_default_client') as mock_get_client:
+        mock_get_client.return_value.search_repositories = AsyncMock(return_value=[
+            {
+                "full_name": "tensorflow/tensorflow",
+                "html_url": "https://github.com/tensorflow/tensorflow",
+                "description": "An Open Source Machine Learning Framework",
+                "stargazers_count": 185000,
+                "language": "Python",
+                "topics": ["machine-learning", "deep-learning"],
+                "updated_at": "2025-01-09T00:00:00Z",
+                "open_issues_count": 800
+            }
+        ])
         
         result = await discover_repository(language="python")
         
@@ -501,29 +590,19 @@ async def test_discover_repository_with_topics():
     """Test discover_repository filtered by topics."""
     from src.server import discover_repository
     
-    with patch('httpx.AsyncClient') as MockAsyncClient:
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "items": [
-                {
-                    "full_name": "scikit-learn/scikit-learn",
-                    "html_url": "https://github.com/scikit-learn/scikit-learn",
-                    "description": "scikit-learn: machine learning in Python",
-                    "stargazers_count": 60000,
-                    "language": "Python",
-                    "topics": ["machine-learning", "python"],
-                    "updated_at": "2025-01-09T00:00:00Z",
-                    "open_issues_count": 400
-                }
-            ]
-        }
-        
-        mock_client_instance = AsyncMock()
-        mock_client_instance.__aenter__.return_value = mock_client_instance
-        mock_client_instance.__aexit__.return_value = None
-        mock_client_instance.get = AsyncMock(return_value=mock_response)
-        
-        MockAsyncClient.return_value = mock_client_instance
+    with patch('src.server.get_default_client') as mock_get_client:
+        mock_get_client.return_value.search_repositories = AsyncMock(return_value=[
+            {
+                "full_name": "scikit-learn/scikit-learn",
+                "html_url": "https://github.com/scikit-learn/scikit-learn",
+                "description": "scikit-learn: machine learning in Python",
+                "stargazers_count": 60000,
+                "language": "Python",
+                "topics": ["machine-learning", "python"],
+                "updated_at": "2025-01-09T00:00:00Z",
+                "open_issues_count": 400
+            }
+        ])
         
         result = await discover_repository(topics=["machine-learning"])
         
@@ -539,31 +618,21 @@ async def test_discover_repository_limit():
     """Test discover_repository respects the limit parameter."""
     from src.server import discover_repository
     
-    with patch('httpx.AsyncClient') as MockAsyncClient:
+    with patch('src.server.get_default_client') as mock_get_client:
         # Return 5 items but request limit of 3
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "items": [
-                {
-                    "full_name": f"org{i}/repo{i}",
-                    "html_url": f"https://github.com/org{i}/repo{i}",
-                    "description": f"Repo {i}",
-                    "stargazers_count": 5000 + i * 1000,
-                    "language": "Python",
-                    "topics": ["test"],
-                    "updated_at": "2025-01-09T00:00:00Z",
-                    "open_issues_count": 100
-                }
-                for i in range(5)
-            ]
-        }
-        
-        mock_client_instance = AsyncMock()
-        mock_client_instance.__aenter__.return_value = mock_client_instance
-        mock_client_instance.__aexit__.return_value = None
-        mock_client_instance.get = AsyncMock(return_value=mock_response)
-        
-        MockAsyncClient.return_value = mock_client_instance
+        mock_get_client.return_value.search_repositories = AsyncMock(return_value=[
+            {
+                "full_name": f"org{i}/repo{i}",
+                "html_url": f"https://github.com/org{i}/repo{i}",
+                "description": f"Repo {i}",
+                "stargazers_count": 5000 + i * 1000,
+                "language": "Python",
+                "topics": ["test"],
+                "updated_at": "2025-01-09T00:00:00Z",
+                "open_issues_count": 100
+            }
+            for i in range(5)
+        ])
         
         result = await discover_repository(limit=3)
         
@@ -578,13 +647,8 @@ async def test_discover_repository_error_handling():
     """Test discover_repository error handling."""
     from src.server import discover_repository
     
-    with patch('httpx.AsyncClient') as MockAsyncClient:
-        mock_client_instance = AsyncMock()
-        mock_client_instance.__aenter__.return_value = mock_client_instance
-        mock_client_instance.__aexit__.return_value = None
-        mock_client_instance.get = AsyncMock(side_effect=Exception("API Error"))
-        
-        MockAsyncClient.return_value = mock_client_instance
+    with patch('src.server.get_default_client') as mock_get_client:
+        mock_get_client.return_value.search_repositories = AsyncMock(side_effect=Exception("API Error"))
         
         result = await discover_repository()
         
@@ -594,5 +658,63 @@ async def test_discover_repository_error_handling():
         assert "Failed to discover repositories" in result_data["error"]["message"]
 
 
+@pytest.mark.asyncio
+async def test_fork_repository_automated_uses_shared_client():
+    """Test that the PR API helpers go through the shared GitHub client."""
+    from src.pr.api import fork_repository_automated
+    
+    with patch('src.pr.api.get_default_client') as mock_get_client:
+        mock_get_client.return_value.fork_repository = AsyncMock(return_value={
+            "fork_full_name": "me/repo",
+            "clone_url": "https://github.com/me/repo.git",
+            "ssh_url": "git@github.com:me/repo.git"
+        })
+        
+        result = await fork_repository_automated("owner/repo", token="t")
+        
+        assert result["ok"] is True
+        assert result["data"]["fork_full_name"] == "me/repo"
+        mock_get_client.return_value.fork_repository.assert_awaited_once_with(token="t", repo="owner/repo")
+
+
+@pytest.mark.asyncio
+async def test_pr_api_rejects_malformed_repo():
+    """Test that the PR API helpers reject anything but owner/repo."""
+    from src.pr.api import create_pull_request_automated, fork_repository_automated
+    
+    with patch('src.pr.api.get_default_client') as mock_get_client:
+        for repo in ["owner", "owner/", "/repo", "a/b/c", "owner/re po", "../..", "a/.."]:
+            fork = await fork_repository_automated(repo, token="t")
+            pr = await create_pull_request_automated(repo, "feature", "main", "Title", token="t")
+            
+            assert fork["ok"] is False and fork["error"]["code"] == "INVALID_INPUT"
+            assert pr["ok"] is False and pr["error"]["code"] == "INVALID_INPUT"
+        
+        mock_get_client.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_tools_reject_malformed_repo_before_running():
+    """Test that the repo validator short-circuits every repo-taking tool."""
+    from src.server import fork_repo, get_issue_details, list_repo_metadata, mcp
+    
+    with patch('src.server.get_default_client') as mock_get_client:
+        for repo in [
+            "owner/", "/repo", "a/b/c", "owner/re po", "o" * 40 + "/repo", "owner/" + "r" * 101,
+            "../..", "a/..", "./x", "x/.",
+        ]:
+            for result in [
+                await get_issue_details(repo=repo, number=1),
+                await list_repo_metadata(repo),
+                await fork_repo(repo=repo),
+            ]:
+                assert json.loads(result)["error"]["code"] == "INVALID_INPUT"
+        
+        mock_get_client.assert_not_called()
+    
+    # The wrapper keeps the original signature for FastMCP's input schema
+    tools = {tool.name: tool for tool in await mcp.list_tools()}
+    assert list(tools["fork_repo"].inputSchema["properties"]) == ["repo", "token"]
+
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    pytest.main([__file__, "-v"])
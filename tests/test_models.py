@@ -0,0 +1,102 @@
+"""Tests for GitHub API data models."""
+
+from src.github.models import Comment, IssueSearchResult
+
+
+SEARCH_ITEM = {
+    "repository_url": "https://api.github.com/repos/owner/repo",
+    "number": 12,
+    "title": "Crash on startup",
+    "html_url": "https://github.com/owner/repo/issues/12",
+    "labels": [{"name": "bug"}, {"name": "help wanted"}],
+    "comments": 4,
+    "created_at": "2025-01-01T00:00:00Z",
+    "updated_at": "2025-01-02T00:00:00Z",
+    "state": "open",
+    "body": "Steps to reproduce",
+    "score": 1.0
+}
+
+COMMENT_ITEM = {
+    "id": 99,
+    "user": {"login": "maintainer"},
+    "body": "Thanks!",
+    "created_at": "2025-01-03T00:00:00Z",
+    "updated_at": "2025-01-03T00:00:00Z",
+    "html_url": "https://github.com/owner/repo/issues/12#issuecomment-99"
+}
+
+
+def test_search_result_bulk_matches_init():
+    """Test that bulk construction matches one-by-one construction."""
+    partial = {"number": 3, "title": "Partial item"}
+    
+    bulk = IssueSearchResult.bulk([SEARCH_ITEM, partial])
+    single = [IssueSearchResult(SEARCH_ITEM), IssueSearchResult(partial)]
+    
+    assert [r.to_dict() for r in bulk] == [r.to_dict() for r in single]
+    assert bulk[0].repo == "owner/repo"
+    assert bulk[0].score == 1.0
+
+
+def test_comment_bulk_matches_init():
+    """Test that bulk comment construction matches one-by-one construction."""
+    partial = {"id": 5}
+    
+    bulk = Comment.bulk([COMMENT_ITEM, partial])
+    single = [Comment(COMMENT_ITEM), Comment(partial)]
+    
+    assert [c.to_dict() for c in bulk] == [c.to_dict() for c in single]
+    assert bulk[0].author == "maintainer"
+
+
+def test_models_have_no_instance_dict():
+    """Test that model instances are slot-based."""
+    result = IssueSearchResult(SEARCH_ITEM)
+    
+    assert not hasattr(result, "__dict__")
+    assert not hasattr(Comment(COMMENT_ITEM), "__dict__")
+
+
+def test_to_dict_key_order():
+    """Test that serialized keys keep their documented order."""
+    result = IssueSearchResult(SEARCH_ITEM).to_dict()
+    comment = Comment(COMMENT_ITEM).to_dict()
+    
+    assert list(result) == [
+        "repo", "number", "title", "url", "labels", "comments",
+        "created_at", "updated_at", "snippet", "state",
+    ]
+    assert result["repo"] == "owner/repo"
+    assert list(comment) == ["id", "author", "body", "created_at", "updated_at", "url"]
+    assert comment["author"] == "maintainer"
+
+
+def test_snippet_is_memoized():
+    """Test that the default snippet is computed once and reused."""
+    result = IssueSearchResult({**SEARCH_ITEM, "body": "  " + "x" * 300 + "  "})
+    
+    snippet = result.get_snippet()
+    
+    assert snippet == "x" * 200 + "..."
+    assert result.get_snippet() is snippet
+    assert result.to_dict()["snippet"] is snippet
+    assert result.get_snippet(10) == "x" * 10 + "..."
+    assert IssueSearchResult.bulk([SEARCH_ITEM])[0].get_snippet() == IssueSearchResult(SEARCH_ITEM).get_snippet()
+
+
+def test_missing_labels_share_empty_tuple():
+    """Test that label-less results reuse one immutable empty sequence."""
+    first = IssueSearchResult({**SEARCH_ITEM, "labels": []})
+    second = IssueSearchResult.bulk([{**SEARCH_ITEM, "labels": []}])[0]
+    
+    assert first.labels == () and first.labels is second.labels
+    assert first.to_dict()["labels"] == ()
+
+
+def test_label_set_is_lowercased_and_cached():
+    """Test that label_set lowercases names and is built once."""
+    result = IssueSearchResult({**SEARCH_ITEM, "labels": [{"name": "Good First Issue"}]})
+    
+    assert result.label_set == frozenset({"good first issue"})
+    assert result.label_set is result.label_set
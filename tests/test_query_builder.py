@@ -4,7 +4,7 @@ These tests work with both Pydantic and simplified parameter versions.
 """
 
 import pytest
-from src.github.query_builder import build_search_query, score_result
+from src.github.query_builder import build_search_query, explain_query, score_result
 
 
 def test_build_search_query_repo_mode():
@@ -112,4 +112,106 @@ def test_score_result_no_matches():
     reasons = score_result(issue_data, query_params)
     
     assert len(reasons) > 0
-    assert any("general" in r.lower() for r in reasons)
\ No newline at end of file
+    assert any("general" in r.lower() for r in reasons)
+
+def test_score_result_overlapping_keywords():
+    """Test that overlapping and prefix keywords are each reported once."""
+    issue_data = {
+        "title": "Python Typing cleanup",
+        "body": "docs",
+        "labels": [{"name": "Help Wanted"}]
+    }
+    
+    query_params = {
+        "skills": ["py", "Python", "typing", "cleanupdocs"],
+        "topics": ["thon"],
+        "labels": ["help wanted"]
+    }
+    
+    reasons = score_result(issue_data, query_params)
+    
+    assert reasons == [
+        "Label match: help wanted",
+        "Keyword match: py",
+        "Keyword match: Python",
+        "Keyword match: typing",
+        "Topic match: thon",
+    ]
+
+
+def test_explain_query():
+    """Test explanations extracted from a built query."""
+    query = build_search_query(
+        mode="repo",
+        repo="owner/repo",
+        language="python",
+        difficulty="good-first-issue",
+        state="closed"
+    )
+    
+    assert explain_query(query) == [
+        "Searching for issues",
+        "Only closed issues",
+        "In repository: owner/repo",
+        "Good for beginners",
+        "Primary language: python",
+        "Filtered by specific labels",
+    ]
+    assert explain_query("is:issue repo:") == ["Searching for issues"]
+
+
+def test_score_result_with_prebuilt_label_set():
+    """Test that a prebuilt label set is used instead of issue_data labels."""
+    issue_data = {"title": "Fix crash", "body": None}
+    
+    reasons = score_result(
+        issue_data,
+        {"difficulty": "good-first-issue", "labels": ["Bug"]},
+        label_set=frozenset({"good first issue", "bug"})
+    )
+    
+    assert reasons == ["Label match: good first issue", "Label match: Bug"]
+
+
+def test_score_result_accepts_search_result_model():
+    """Test that a search result model scores the same as raw issue data."""
+    from src.github.models import IssueSearchResult
+    
+    issue_data = {
+        "title": "Add Python support",
+        "body": None,
+        "labels": [{"name": "Good First Issue"}, {"name": "Docs"}]
+    }
+    query_params = {"difficulty": "good-first-issue", "labels": ["docs"], "skills": ["python"]}
+    
+    assert score_result(IssueSearchResult(issue_data), query_params) == score_result(issue_data, query_params)
+
+
+def test_build_search_query_is_cached():
+    """Test that equal list arguments reuse the cached query string."""
+    first = build_search_query(mode="global", skills=["python"], labels=["bug"])
+    second = build_search_query(mode="global", skills=["python"], labels=["bug"])
+    
+    assert first == 'is:issue is:open label:"bug" python'
+    assert second is first
+
+
+def test_make_scorer_matches_score_result():
+    """Test that a prepared scorer gives the same reasons as score_result."""
+    from src.github.query_builder import make_scorer
+    
+    query_params = {
+        "difficulty": "good-first-issue",
+        "labels": ["Docs"],
+        "skills": ["python"],
+        "topics": ["cli"],
+        "language": "python"
+    }
+    issues = [
+        {"title": "Python CLI", "body": "", "labels": [{"name": "docs"}]},
+        {"title": "Unrelated", "body": None, "labels": [{"name": "good first issue"}]},
+    ]
+    
+    score = make_scorer(query_params)
+    
+    assert [score(issue) for issue in issues] == [score_result(issue, query_params) for issue in issues]
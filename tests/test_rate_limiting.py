@@ -17,7 +17,8 @@ class TestRateLimitDetection:
         """Test handling of 429 (Too Many Requests) response."""
         client = GitHubClient()
         
-        with patch('httpx.AsyncClient') as mock_async_client:
+        # Force the REST path regardless of a GITHUB_TOKEN in the environment
+        with patch('src.github.client.GITHUB_TOKEN', None), patch('httpx.AsyncClient') as mock_async_client:
             # Mock the response with 429 status
             mock_response = MagicMock()
             mock_response.status_code = 429
@@ -31,12 +32,16 @@ class TestRateLimitDetection:
             mock_client_instance = MagicMock()
             mock_client_instance.__aenter__.return_value = mock_client_instance
             mock_client_instance.__aexit__.return_value = None
-            mock_client_instance.get = AsyncMock(return_value=mock_response)
+            mock_client_instance.request = AsyncMock(return_value=mock_response)
             mock_async_client.return_value = mock_client_instance
             
-            # Test that RateLimitError is raised
-            with pytest.raises(RateLimitError) as exc_info:
-                await client.search_issues("python", limit=10)
+            # Test that RateLimitError is raised once retries are exhausted
+            with patch('asyncio.sleep', new=AsyncMock()) as mock_sleep:
+                with pytest.raises(RateLimitError) as exc_info:
+                    await client.search_issues("python", limit=10)
+            
+            assert mock_client_instance.request.await_count == client.max_retries + 1
+            assert mock_sleep.await_count == client.max_retries
             
             # Verify error contains rate limit info
             error = exc_info.value
@@ -49,7 +54,8 @@ class TestRateLimitDetection:
         """Test handling of 403 with rate limit error message."""
         client = GitHubClient()
         
-        with patch('httpx.AsyncClient') as mock_async_client:
+        # Force the REST path regardless of a GITHUB_TOKEN in the environment
+        with patch('src.github.client.GITHUB_TOKEN', None), patch('httpx.AsyncClient') as mock_async_client:
             # Mock 403 response with rate limit message
             mock_response = MagicMock()
             mock_response.status_code = 403
@@ -62,20 +68,46 @@ class TestRateLimitDetection:
                 "message": "API rate limit exceeded",
                 "documentation_url": "https://docs.github.com/rest/overview/resources-in-the-rest-api#rate-limiting"
             })
+            mock_response.content = json.dumps(mock_response.json.return_value).encode()
             
             # Setup AsyncClient mock
             mock_client_instance = MagicMock()
             mock_client_instance.__aenter__.return_value = mock_client_instance
             mock_client_instance.__aexit__.return_value = None
-            mock_client_instance.get = AsyncMock(return_value=mock_response)
+            mock_client_instance.request = AsyncMock(return_value=mock_response)
             mock_async_client.return_value = mock_client_instance
             
-            # Test that RateLimitError is raised
+            # Test that RateLimitError is raised (no Retry-After, so no retry)
             with pytest.raises(RateLimitError) as exc_info:
                 await client.search_issues("python", limit=10)
             
+            assert mock_client_instance.request.await_count == 1
             error = exc_info.value
             assert error.code == "GITHUB_RATE_LIMIT"
+            # Decided from the headers alone
+            mock_response.json.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_403_without_rate_limit_headers(self):
+        """Test that 403s without rate limit headers are classified from the body."""
+        client = GitHubClient()
+        
+        # Force the REST path regardless of a GITHUB_TOKEN in the environment
+        with patch('src.github.client.GITHUB_TOKEN', None), patch('httpx.AsyncClient') as mock_async_client:
+            mock_response = MagicMock()
+            mock_response.status_code = 403
+            mock_response.headers = {}
+            mock_response.json = MagicMock(return_value={"message": "Resource not accessible"})
+            mock_response.content = json.dumps(mock_response.json.return_value).encode()
+            
+            mock_client_instance = MagicMock()
+            mock_client_instance.request = AsyncMock(return_value=mock_response)
+            mock_async_client.return_value = mock_client_instance
+            
+            with pytest.raises(GitHubApiError) as exc_info:
+                await client.search_issues("python", limit=10)
+            
+            assert "Resource not accessible" in exc_info.value.message
     
     @pytest.mark.asyncio
     async def test_rate_limit_error_json_format(self):
@@ -289,3 +321,31 @@ class TestRateLimitWarnings:
         
         # Should not raise or log warning
         client._check_rate_limit(mock_response)
+
+
+class TestRateLimitWarning:
+    """Test the low rate limit warning."""
+    
+    def _response(self, remaining: str, limit: str) -> MagicMock:
+        response = MagicMock()
+        response.headers = {"X-RateLimit-Remaining": remaining, "X-RateLimit-Limit": limit}
+        return response
+    
+    def test_warns_below_ten_percent(self, caplog):
+        """Test that the warning fires only under 10% remaining."""
+        client = GitHubClient()
+        
+        client._check_rate_limit(self._response("500", "5000"))
+        assert "Approaching GitHub API rate limit" not in caplog.text
+        
+        client._check_rate_limit(self._response("499", "5000"))
+        assert "Approaching GitHub API rate limit: 499/5000" in caplog.text
+    
+    def test_ignores_malformed_headers(self, caplog):
+        """Test that missing or malformed headers are skipped quietly."""
+        client = GitHubClient()
+        
+        client._check_rate_limit(self._response("", "60"))
+        client._check_rate_limit(self._response("n/a", "60"))
+        
+        assert "Approaching" not in caplog.text